@@ -0,0 +1,72 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:19
+
+import django.contrib.auth.models
+import django.contrib.auth.validators
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CustomUser',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('password', models.CharField(max_length=128, verbose_name='password')),
+                ('last_login', models.DateTimeField(blank=True, null=True, verbose_name='last login')),
+                ('is_superuser', models.BooleanField(default=False, help_text='Designates that this user has all permissions without explicitly assigning them.', verbose_name='superuser status')),
+                ('username', models.CharField(error_messages={'unique': 'A user with that username already exists.'}, help_text='Required. 150 characters or fewer. Letters, digits and @/./+/-/_ only.', max_length=150, unique=True, validators=[django.contrib.auth.validators.UnicodeUsernameValidator()], verbose_name='username')),
+                ('first_name', models.CharField(blank=True, max_length=150, verbose_name='first name')),
+                ('last_name', models.CharField(blank=True, max_length=150, verbose_name='last name')),
+                ('is_staff', models.BooleanField(default=False, help_text='Designates whether the user can log into this admin site.', verbose_name='staff status')),
+                ('is_active', models.BooleanField(default=True, help_text='Designates whether this user should be treated as active. Unselect this instead of deleting accounts.', verbose_name='active')),
+                ('date_joined', models.DateTimeField(default=django.utils.timezone.now, verbose_name='date joined')),
+                ('email', models.EmailField(max_length=254, unique=True)),
+                ('phone_number', models.CharField(blank=True, max_length=15)),
+                ('student_id', models.CharField(blank=True, max_length=20)),
+                ('university', models.CharField(blank=True, max_length=200)),
+                ('course', models.CharField(blank=True, max_length=100)),
+                ('year_of_study', models.IntegerField(blank=True, null=True)),
+                ('user_type', models.CharField(choices=[('student', 'Student'), ('tutor', 'Tutor'), ('service_provider', 'Service Provider'), ('admin', 'Administrator')], default='student', max_length=20)),
+                ('profile_picture', models.ImageField(blank=True, upload_to='profile_pics/')),
+                ('bio', models.TextField(blank=True)),
+                ('points', models.IntegerField(default=0)),
+                ('is_verified', models.BooleanField(default=False)),
+                ('verification_code', models.CharField(blank=True, max_length=6)),
+                ('dark_mode', models.BooleanField(default=False)),
+                ('location', models.CharField(blank=True, max_length=200)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('groups', models.ManyToManyField(blank=True, help_text='The groups this user belongs to. A user will get all permissions granted to each of their groups.', related_name='user_set', related_query_name='user', to='auth.group', verbose_name='groups')),
+                ('user_permissions', models.ManyToManyField(blank=True, help_text='Specific permissions for this user.', related_name='user_set', related_query_name='user', to='auth.permission', verbose_name='user permissions')),
+            ],
+            options={
+                'ordering': ['-date_joined'],
+            },
+            managers=[
+                ('objects', django.contrib.auth.models.UserManager()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Badge',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('badge_type', models.CharField(choices=[('tutor', 'Top Tutor'), ('helper', 'Helpful Hero'), ('finder', 'Finder Star'), ('active', 'Active User'), ('expert', 'Subject Expert'), ('verified', 'Verified User')], max_length=20)),
+                ('awarded_date', models.DateTimeField(default=django.utils.timezone.now)),
+                ('description', models.TextField(blank=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='badges', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-awarded_date'],
+            },
+        ),
+    ]
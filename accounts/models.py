@@ -26,6 +26,8 @@ class CustomUser(AbstractUser):
     verification_code = models.CharField(max_length=6, blank=True)
     dark_mode = models.BooleanField(default=False)
     location = models.CharField(max_length=200, blank=True)
+    place = models.ForeignKey('core.Place', on_delete=models.SET_NULL, null=True, blank=True,
+                              editable=False, related_name='+')
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -8,5 +8,7 @@ urlpatterns = [
     path('notifications/read/', views.mark_notification_read_api, name='api_mark_notification_read'),
     path('leaderboard/', views.get_leaderboard, name='api_leaderboard'),
     path('search/autocomplete/', views.search_autocomplete_api, name='api_search_autocomplete'),
+    path('tutors/match/', views.match_tutors_api, name='api_match_tutors'),
+    path('services/nearest/', views.nearest_services_api, name='api_nearest_services'),
     path('report/', views.report_content, name='api_report'),
 ]
\ No newline at end of file
@@ -4,6 +4,7 @@ from django.contrib.auth.decorators import login_required
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST, require_GET
 import json
+from core import autocomplete
 from core.recommendations import RecommendationEngine
 from accounts.gamification import GamificationEngine
 from messaging.models import Notification
@@ -82,51 +83,102 @@ def get_leaderboard(request):
 @login_required
 @require_GET
 def search_autocomplete_api(request):
-    """Search autocomplete endpoint"""
-    query = request.GET.get('q', '')
-    results = []
-
-    if len(query) >= 2:
-        from lost_found.models import LostItem
-        from tutoring.models import Tutor
-        from jobs.models import Job
-        from resources.models import Resource
-        from services.models import Service
-
-        # Search lost items
-        lost_items = LostItem.objects.filter(
-            title__icontains=query
-        )[:3]
-        results.extend([{
-            'type': 'lost_item',
-            'title': item.title,
-            'description': f"Lost {item.get_category_display()}",
-            'link': f'/lost-found/{item.id}/'
-        } for item in lost_items])
-
-        # Search tutors
-        tutors = Tutor.objects.filter(
-            user__username__icontains=query
-        )[:3]
-        results.extend([{
-            'type': 'tutor',
-            'title': tutor.user.username,
-            'description': f"{tutor.get_primary_subject_display()} Tutor",
-            'link': f'/tutoring/{tutor.id}/'
-        } for tutor in tutors])
-
-        # Search jobs
-        jobs = Job.objects.filter(
-            title__icontains=query
-        )[:3]
-        results.extend([{
-            'type': 'job',
-            'title': job.title,
-            'description': job.get_category_display(),
-            'link': f'/jobs/{job.id}/'
-        } for job in jobs])
-
-    return JsonResponse({'results': results[:10]})
+    """Search autocomplete endpoint, served from the in-memory prefix index"""
+    entries = autocomplete.search(request.GET.get('q', ''), limit=10)
+    results = [{
+        'type': entry['kind'],
+        'title': entry['title'],
+        'description': entry['description'],
+        'link': entry['link'],
+    } for entry in entries]
+    return JsonResponse({'results': results})
+
+
+@login_required
+@require_GET
+def match_tutors_api(request):
+    """Rank available tutors for a student's request"""
+    from tutoring.matching import TutorMatcher, DAYS
+
+    try:
+        subject_ids = [int(s) for s in request.GET.get('subjects', '').split(',') if s.strip()]
+        max_rate = float(request.GET['max_rate']) if request.GET.get('max_rate') else None
+        limit = min(int(request.GET.get('limit', 10)), 50)
+        slots = []
+        for slot in request.GET.get('slots', '').split(','):
+            if not slot.strip():
+                continue
+            day, hour = slot.strip().lower().rsplit('-', 1)
+            if day not in DAYS or not 0 <= int(hour) < 24:
+                raise ValueError(slot)
+            slots.append((day, int(hour)))
+    except ValueError:
+        return JsonResponse({'success': False, 'error': 'Invalid match parameters'}, status=400)
+
+    matches = TutorMatcher().match(
+        student=request.user, limit=limit,
+        subject_ids=subject_ids, max_rate=max_rate, slots=slots,
+    )
+    return JsonResponse({'results': [{
+        'tutor_id': match['tutor'].id,
+        'name': match['tutor'].full_name,
+        'subject': match['tutor'].primary_subject.name if match['tutor'].primary_subject else None,
+        'hourly_rate': float(match['tutor'].hourly_rate),
+        'rating': float(match['tutor'].rating),
+        'score': match['score'],
+        'breakdown': match['breakdown'],
+        'link': f"/tutoring/tutor/{match['tutor'].id}/",
+    } for match in matches]})
+
+
+@login_required
+@require_GET
+def nearest_services_api(request):
+    """
+    The k services closest to ?lat=&lng= (or a named ?place=), nearest
+    first; ?open_now=1 or ?open_at=<ISO time> keeps only services open then
+    """
+    from core.exports import parse_since
+    from core.places import get_gazetteer, resolve_place
+    from services.geo import nearest_services
+    from services.hours import open_at
+    from services.models import Service
+
+    try:
+        if request.GET.get('place'):
+            place_id = resolve_place(request.GET['place'])
+            if place_id is None:
+                return JsonResponse({'success': False, 'error': 'Unknown place'}, status=404)
+            latitude, longitude = get_gazetteer()['coords'][place_id]
+        else:
+            latitude, longitude = float(request.GET['lat']), float(request.GET['lng'])
+            if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+                raise ValueError(latitude, longitude)
+        k = max(1, min(int(request.GET.get('k', 5)), 50))
+    except (KeyError, ValueError):
+        return JsonResponse({'success': False, 'error': 'Give lat and lng, or a place'}, status=400)
+
+    services = Service.objects.all()
+    if request.GET.get('category'):
+        services = services.filter(category=request.GET['category'])
+    if request.GET.get('open_at'):
+        try:
+            services = open_at(services, parse_since(request.GET['open_at']))
+        except ValueError:
+            return JsonResponse({'success': False, 'error': 'open_at must be an ISO date or datetime'}, status=400)
+    elif request.GET.get('open_now'):
+        services = open_at(services)
+
+    return JsonResponse({'results': [{
+        'id': service.id,
+        'name': service.name,
+        'category': service.category,
+        'location': service.location,
+        'latitude': service.latitude,
+        'longitude': service.longitude,
+        'distance_km': round(service.distance_km, 3),
+        'link': f'/services/{service.id}/',
+    } for service in nearest_services(latitude, longitude, k=k, queryset=services)]})
 
 
 @csrf_exempt
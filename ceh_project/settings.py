@@ -113,3 +113,10 @@ LOGIN_URL = 'login'
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Public base URL used in QR codes and other links that leave the site
+SITE_URL = os.getenv('SITE_URL', 'https://yourdomain.com')
+
+# Background tasks (core.tasks) run in a small thread pool after commit
+BACKGROUND_TASK_WORKERS = int(os.getenv('BACKGROUND_TASK_WORKERS', 2))
+BACKGROUND_TASKS_EAGER = os.getenv('BACKGROUND_TASKS_EAGER', 'False') == 'True'
@@ -3,7 +3,7 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
-from core.views import home, about, announcements, contact
+from core.views import home, about, announcements, contact, qr_sheet
 from accounts.views import theme_toggle
 
 urlpatterns = [
@@ -12,6 +12,7 @@ urlpatterns = [
     path('about/', about, name='about'),
     path('announcements/', announcements, name='announcements'),
     path('contact/', contact, name='contact'),
+    path('qr-sheet.pdf', qr_sheet, name='qr_sheet'),
 
     # Accounts
     path('accounts/', include('accounts.urls')),
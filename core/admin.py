@@ -1,3 +1,35 @@
 from django.contrib import admin
+from .models import TaskWatermark, CacheVersion, ImageVariant, Place, PlaceAlias
 
-# Register your models here.
+
+@admin.register(TaskWatermark)
+class TaskWatermarkAdmin(admin.ModelAdmin):
+    list_display = ['name', 'value', 'updated_at']
+    search_fields = ['name']
+
+
+@admin.register(CacheVersion)
+class CacheVersionAdmin(admin.ModelAdmin):
+    list_display = ['name', 'version', 'updated_at']
+    search_fields = ['name']
+
+
+@admin.register(ImageVariant)
+class ImageVariantAdmin(admin.ModelAdmin):
+    list_display = ['source_name', 'format', 'width', 'height', 'size', 'created_at']
+    list_filter = ['format', 'width']
+    search_fields = ['source_name']
+
+
+class PlaceAliasInline(admin.TabularInline):
+    model = PlaceAlias
+    extra = 1
+
+
+@admin.register(Place)
+class PlaceAdmin(admin.ModelAdmin):
+    list_display = ['name', 'kind', 'latitude', 'longitude']
+    list_filter = ['kind']
+    search_fields = ['name', 'aliases__alias']
+    prepopulated_fields = {'slug': ['name']}
+    inlines = [PlaceAliasInline]
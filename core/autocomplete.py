@@ -0,0 +1,377 @@
+# core/autocomplete.py
+import json
+import math
+import os
+import re
+import threading
+import time
+import unicodedata
+from bisect import bisect_left, insort
+from collections import defaultdict, namedtuple
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import AutocompleteChange
+from .tasks import run_in_background
+
+Entry = namedtuple('Entry', 'kind id title description link weight')
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+MIN_QUERY_LENGTH = 2
+PER_KIND_LIMIT = 4
+# Snapshots older than this are rebuilt from the database instead of loaded
+SNAPSHOT_MAX_AGE = getattr(settings, 'AUTOCOMPLETE_SNAPSHOT_MAX_AGE', 3600)
+SNAPSHOT_PATH = getattr(settings, 'AUTOCOMPLETE_SNAPSHOT_PATH',
+                        os.path.join(settings.BASE_DIR, 'autocomplete_snapshot.json'))
+# Every change is logged as an AutocompleteChange row; workers replay the
+# rows they haven't seen onto their own index at most this often
+CHANGE_CHECK_INTERVAL = getattr(settings, 'AUTOCOMPLETE_CHANGE_CHECK_INTERVAL', 30)
+# Ids can commit out of order, so each replay also re-reads this far back
+CHANGE_OVERLAP = 60
+# Logged changes are pruned after this long; a worker further behind rebuilds
+CHANGE_RETENTION = 24 * 3600
+# Past this many pending changes a full rebuild (in the background) is cheaper
+MAX_REPLAY = 2000
+# Saves touching only these just nudge ranking weights: the saving worker
+# updates its entry, the rest catch up at their next rebuild
+RANKING_FIELDS = frozenset({'views_count', 'views', 'downloads', 'average_rating', 'total_ratings',
+                            'rating', 'total_reviews'})
+
+
+def normalize(text):
+    """Lowercase ASCII words: accents folded, punctuation dropped"""
+    text = unicodedata.normalize('NFKD', text or '').encode('ascii', 'ignore').decode().lower()
+    return TOKEN_RE.findall(text)
+
+
+# One builder per indexed kind: the model label, the queryset of rows to
+# index, and a function turning a row into an Entry (None to leave it out).
+
+def _lost_item_entry(item):
+    if item.is_resolved:
+        return None
+    verb = 'Found' if item.status == 'found' else 'Lost'
+    return Entry('lost_item', item.id, item.title, f"{verb} {item.get_category_display()}",
+                 f'/lost-found/{item.id}/', 0.5)
+
+
+def _job_entry(job):
+    if job.status != 'open':
+        return None
+    return Entry('job', job.id, job.title, job.get_category_display(), f'/jobs/{job.id}/',
+                 1 + math.log1p(job.views_count) / 10)
+
+
+def _resource_entry(resource):
+    if not resource.is_approved:
+        return None
+    return Entry('resource', resource.id, resource.title,
+                 f"{resource.course_code} {resource.get_resource_type_display()}".strip(),
+                 f'/resources/{resource.id}/',
+                 0.8 + math.log1p(resource.downloads) / 10 + (0.3 if resource.is_featured else 0))
+
+
+def _service_entry(service):
+    return Entry('service', service.id, service.name, service.get_category_display(),
+                 f'/services/{service.id}/',
+                 0.7 + float(service.average_rating) / 10 + (0.2 if service.is_verified else 0))
+
+
+def _tutor_entry(tutor):
+    if not tutor.is_available:
+        return None
+    description = f"{tutor.primary_subject.name} Tutor" if tutor.primary_subject else 'Tutor'
+    return Entry('tutor', tutor.id, tutor.full_name, description, f'/tutoring/tutor/{tutor.id}/',
+                 0.8 + float(tutor.rating) / 10)
+
+
+SOURCES = {
+    'lost_item': ('lost_found.LostItem', lambda m: m.objects.filter(is_resolved=False), _lost_item_entry),
+    'job': ('jobs.Job', lambda m: m.objects.filter(status='open'), _job_entry),
+    'resource': ('resources.Resource', lambda m: m.objects.filter(is_approved=True), _resource_entry),
+    'service': ('services.Service', lambda m: m.objects.all(), _service_entry),
+    'tutor': ('tutoring.Tutor', lambda m: m.objects.filter(is_available=True).select_related(
+        'user', 'primary_subject'), _tutor_entry),
+}
+
+
+class PrefixIndex:
+    """
+    Word-prefix index over entry titles. Keys are "word\\0kind:id" strings in
+    one sorted list, so every title word starting with a prefix is a
+    contiguous run found by bisect. Entries carry everything a result
+    needs, so lookups never touch the database.
+    """
+
+    def __init__(self, last_change=0, replayed_at=None):
+        # Changes up to id last_change, and everything logged before replayed_at, are applied
+        self.last_change = last_change
+        self.replayed_at = replayed_at or time.time()
+        self.next_check = 0
+        self._keys = []
+        self._entries = {}
+        self._words = {}
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _ref(kind, pk):
+        return f'{kind}:{pk}'
+
+    def add(self, entry):
+        ref = self._ref(entry.kind, entry.id)
+        with self._lock:
+            self.remove(entry.kind, entry.id)
+            self._entries[ref] = entry
+            self._words[ref] = normalize(entry.title)
+            for word in set(self._words[ref]):
+                insort(self._keys, f'{word}\0{ref}')
+
+    def remove(self, kind, pk):
+        ref = self._ref(kind, pk)
+        with self._lock:
+            entry = self._entries.pop(ref, None)
+            if entry is None:
+                return
+            for word in set(self._words.pop(ref)):
+                key = f'{word}\0{ref}'
+                position = bisect_left(self._keys, key)
+                if position < len(self._keys) and self._keys[position] == key:
+                    del self._keys[position]
+
+    def _refs_with_prefix(self, prefix):
+        refs = set()
+        position = bisect_left(self._keys, prefix)
+        while position < len(self._keys) and self._keys[position].startswith(prefix):
+            refs.add(self._keys[position].split('\0', 1)[1])
+            position += 1
+        return refs
+
+    def search(self, query, kinds=None, limit=10):
+        """Best entries whose title has a word starting with every query word"""
+        words = normalize(query)
+        if not words or len(''.join(words)) < MIN_QUERY_LENGTH:
+            return []
+        with self._lock:
+            # The longest word has the shortest run of keys; verify the rest per entry
+            refs = self._refs_with_prefix(max(words, key=len))
+            candidates = [(self._entries[ref], self._words[ref]) for ref in refs]
+
+        scored = []
+        for entry, title_words in candidates:
+            if kinds and entry.kind not in kinds:
+                continue
+            if not all(any(t.startswith(w) for t in title_words) for w in words):
+                continue
+            score = entry.weight
+            score += sum(0.5 for w in words if w in title_words)  # whole-word matches
+            if title_words[0].startswith(words[0]):
+                score += 0.5  # title starts with the query
+            scored.append((score, entry))
+        scored.sort(key=lambda pair: (-pair[0], pair[1].title.lower()))
+
+        results, per_kind = [], {}
+        for _, entry in scored:
+            if per_kind.get(entry.kind, 0) >= PER_KIND_LIMIT:
+                continue
+            per_kind[entry.kind] = per_kind.get(entry.kind, 0) + 1
+            results.append(entry)
+            if len(results) >= limit:
+                break
+        return results
+
+    def to_snapshot(self):
+        with self._lock:
+            return {'built_at': self.replayed_at, 'last_change': self.last_change,
+                    'entries': [list(entry) for entry in self._entries.values()]}
+
+    @classmethod
+    def from_entries(cls, entries, last_change=0, replayed_at=None):
+        index = cls(last_change, replayed_at)
+        index._entries = {cls._ref(entry.kind, entry.id): entry for entry in entries}
+        index._words = {ref: normalize(entry.title) for ref, entry in index._entries.items()}
+        # Sort once instead of insort per word
+        index._keys = sorted(f'{word}\0{ref}' for ref, words in index._words.items() for word in set(words))
+        return index
+
+
+def build_entries():
+    from django.apps import apps
+
+    for label, queryset, to_entry in SOURCES.values():
+        for row in queryset(apps.get_model(label)).iterator(chunk_size=2000):
+            entry = to_entry(row)
+            if entry is not None:
+                yield entry
+
+
+def write_snapshot(index, path=SNAPSHOT_PATH):
+    tmp = f'{path}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(index.to_snapshot(), f)
+    os.replace(tmp, path)
+
+
+def read_snapshot(path=SNAPSHOT_PATH, max_age=SNAPSHOT_MAX_AGE):
+    """Index from a fresh enough snapshot file, else None; changes since it was taken are replayed later"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if time.time() - snapshot.get('built_at', 0) > max_age:
+        return None
+    return PrefixIndex.from_entries((Entry(*row) for row in snapshot['entries']),
+                                    snapshot.get('last_change', 0), snapshot['built_at'])
+
+
+def _build():
+    # Note where the change log stands first, so changes made while building are replayed
+    last_change = AutocompleteChange.objects.order_by('-pk').values_list('pk', flat=True).first() or 0
+    return PrefixIndex.from_entries(build_entries(), last_change, time.time())
+
+
+_index = None
+_index_lock = threading.Lock()
+_replay_lock = threading.Lock()
+_rebuilding = False
+
+
+def get_index():
+    """
+    The process-wide index: loaded from the snapshot if fresh, else built
+    from the database. Every CHANGE_CHECK_INTERVAL seconds one request
+    replays the changes other workers logged; the rest keep searching.
+    """
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = read_snapshot() or _build()
+    index = _index
+    if time.monotonic() >= index.next_check and _replay_lock.acquire(blocking=False):
+        try:
+            index.next_check = time.monotonic() + CHANGE_CHECK_INTERVAL
+            replay_changes(index)
+        finally:
+            _replay_lock.release()
+    return index
+
+
+def replay_changes(index):
+    """
+    Bring `index` up to date from the change log: re-read each changed row
+    and add, update or drop its entry. Returns the number of changes applied;
+    when too far behind, a rebuild is queued and the index is left as is.
+    """
+    started = time.time()
+    if started - index.replayed_at > CHANGE_RETENTION - CHANGE_OVERLAP:
+        _rebuild_later()
+        return 0
+    since = datetime.fromtimestamp(index.replayed_at - CHANGE_OVERLAP, tz=dt_timezone.utc)
+    changes = list(AutocompleteChange.objects.filter(
+        Q(pk__gt=index.last_change) | Q(created_at__gte=since)
+    ).order_by('pk').values_list('pk', 'kind', 'object_id')[:MAX_REPLAY + 1])
+    if len(changes) > MAX_REPLAY:
+        _rebuild_later()
+        return 0
+
+    from django.apps import apps
+
+    changed = defaultdict(set)
+    for _, kind, object_id in changes:
+        if kind in SOURCES:
+            changed[kind].add(object_id)
+    for kind, ids in changed.items():
+        label, queryset, to_entry = SOURCES[kind]
+        current = {row.pk: to_entry(row) for row in queryset(apps.get_model(label)).filter(pk__in=ids)}
+        for pk in ids:
+            if current.get(pk) is None:
+                index.remove(kind, pk)
+            else:
+                index.add(current[pk])
+
+    if changes:
+        index.last_change = max(index.last_change, changes[-1][0])
+    index.replayed_at = started
+    return len(changes)
+
+
+def _rebuild_later():
+    global _rebuilding
+    with _index_lock:
+        if _rebuilding:
+            return
+        _rebuilding = True
+    run_in_background(_rebuild_in_background)
+
+
+def _rebuild_in_background():
+    global _index, _rebuilding
+    try:
+        _index = _build()
+    finally:
+        _rebuilding = False
+
+
+def rebuild_index(write=True):
+    """Build a fresh index (and snapshot), and prune change log rows no worker still needs"""
+    global _index
+    index = _build()
+    if write:
+        write_snapshot(index)
+    AutocompleteChange.objects.filter(
+        created_at__lt=timezone.now() - timedelta(seconds=CHANGE_RETENTION)
+    ).delete()
+    _index = index
+    return index
+
+
+def is_loaded():
+    return _index is not None
+
+
+def log_changes(kind, pks):
+    """Record changed rows so every other worker re-reads them at its next replay"""
+    AutocompleteChange.objects.bulk_create(
+        [AutocompleteChange(kind=kind, object_id=pk) for pk in pks], batch_size=500
+    )
+
+
+def update_entry(kind, instance, shared=True):
+    """
+    Re-index one row after a save, here at once and in other workers at
+    their next replay. With shared=False (ranking-only changes) nothing is
+    logged for the other workers.
+    """
+    index = _index
+    if index is not None:
+        entry = SOURCES[kind][2](instance)
+        if entry is None:
+            index.remove(kind, instance.pk)
+        else:
+            index.add(entry)
+    if shared:
+        log_changes(kind, [instance.pk])
+
+
+def remove_entries(kind, pks):
+    """Drop rows from every worker's index, e.g. after a bulk update that skipped the signals"""
+    index = _index
+    if index is not None:
+        for pk in pks:
+            index.remove(kind, pk)
+    log_changes(kind, pks)
+
+
+def remove_entry(kind, pk):
+    remove_entries(kind, [pk])
+
+
+def search(query, kinds=None, limit=10):
+    return [entry._asdict() for entry in get_index().search(query, kinds, limit)]
@@ -0,0 +1,160 @@
+# core/images.py
+import os
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from .models import ImageVariant
+
+# Uploaded images that get variants: model label -> field
+IMAGE_FIELDS = {
+    'lost_found.LostItem': 'image',
+    'lost_found.FoundItem': 'image',
+    'accounts.CustomUser': 'profile_picture',
+    'tutoring.Tutor': 'profile_picture',
+}
+WIDTHS = (320, 640, 1280)
+# format -> (Pillow format, save options)
+FORMATS = {
+    'webp': ('WEBP', {'quality': 80, 'method': 4}),
+    'jpeg': ('JPEG', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+# Upload formats re-encoded without metadata on save (MPO is a phone camera JPEG)
+STRIP_FORMATS = {'JPEG': 'JPEG', 'MPO': 'JPEG', 'PNG': 'PNG', 'WEBP': 'WEBP'}
+
+
+def variant_name(source_name, width, image_format):
+    # Keep the source extension so x.jpg and x.png get different variants
+    stem, extension = os.path.splitext(source_name)
+    suffix = f"_{extension.lstrip('.').lower()}" if extension else ''
+    return f"variants/{stem}{suffix}_{width}w.{image_format}"
+
+
+def target_widths(original_width):
+    """The fixed widths below the original, or just the original width for small images"""
+    return [width for width in WIDTHS if width < original_width] or [original_width]
+
+
+def _encode(image, image_format):
+    pil_format, options = FORMATS[image_format]
+    if image_format == 'jpeg' and image.mode != 'RGB':
+        # JPEG has no alpha: flatten onto white
+        background = Image.new('RGB', image.size, 'white')
+        background.paste(image, mask=image.getchannel('A') if 'A' in image.getbands() else None)
+        image = background
+    buffer = BytesIO()
+    # Pillow only writes EXIF/ICC when asked to, so variants come out stripped
+    image.save(buffer, pil_format, **options)
+    return buffer.getvalue()
+
+
+def strip_metadata(fieldfile):
+    """
+    Re-encode a new, not yet stored upload without its EXIF (GPS position,
+    camera details), rotated upright first. Returns True if the file was
+    rewritten; anything that isn't a still image in a known format is left as is.
+    """
+    if not fieldfile or fieldfile._committed:
+        return False
+    try:
+        fieldfile.open('rb')
+        fieldfile.seek(0)
+        with Image.open(fieldfile) as original:
+            pil_format = STRIP_FORMATS.get(original.format)
+            if pil_format is None or getattr(original, 'is_animated', False):
+                return False
+            icc_profile = original.info.get('icc_profile')
+            image = ImageOps.exif_transpose(original)
+            if pil_format == 'JPEG' and image.mode not in ('RGB', 'L', 'CMYK'):
+                image = image.convert('RGB')
+            buffer = BytesIO()
+            options = {'quality': 92} if pil_format in ('JPEG', 'WEBP') else {}
+            if icc_profile:
+                options['icc_profile'] = icc_profile
+            image.save(buffer, pil_format, **options)
+    except (OSError, UnidentifiedImageError):
+        return False
+    fieldfile.file = ContentFile(buffer.getvalue(), name=fieldfile.name)
+    return True
+
+
+def build_variants(source_name):
+    """
+    Write resized WebP and JPEG copies of a stored image and record them.
+    The original is rotated upright from its EXIF orientation first. Returns
+    the number of variants written (0 if the file is missing or not an image).
+    """
+    if not source_name or ImageVariant.objects.filter(source_name=source_name).exists():
+        return 0
+    try:
+        with default_storage.open(source_name, 'rb') as f, Image.open(f) as original:
+            image = ImageOps.exif_transpose(original)
+            image = image.convert('RGBA' if 'A' in image.getbands() or image.mode == 'P' else 'RGB')
+    except (OSError, UnidentifiedImageError):
+        return 0
+
+    variants = []
+    for width in target_widths(image.width):
+        height = max(1, round(image.height * width / image.width))
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        for image_format in FORMATS:
+            data = _encode(resized, image_format)
+            name = variant_name(source_name, width, image_format)
+            if default_storage.exists(name):
+                default_storage.delete(name)
+            variants.append(ImageVariant(
+                source_name=source_name, file=default_storage.save(name, ContentFile(data)),
+                format=image_format, width=width, height=height, size=len(data),
+            ))
+    ImageVariant.objects.bulk_create(variants, ignore_conflicts=True)
+    return len(variants)
+
+
+def delete_variants(source_name):
+    """Remove a replaced image's variants and their files"""
+    variants = list(ImageVariant.objects.filter(source_name=source_name))
+    for variant in variants:
+        variant.file.delete(save=False)
+    ImageVariant.objects.filter(pk__in=[variant.pk for variant in variants]).delete()
+
+
+def replace_variants(old_name, new_name):
+    if old_name:
+        delete_variants(old_name)
+    if new_name:
+        build_variants(new_name)
+
+
+def prefetch_variants(files):
+    """Attach variants to many FieldFiles with one query (for list pages)"""
+    files = [f for f in files if f]
+    by_source = {}
+    for variant in ImageVariant.objects.filter(source_name__in={f.name for f in files}):
+        by_source.setdefault(variant.source_name, []).append(variant)
+    for f in files:
+        f._variants = by_source.get(f.name, [])
+
+
+def get_variants(fieldfile):
+    variants = getattr(fieldfile, '_variants', None)
+    if variants is None:
+        variants = list(ImageVariant.objects.filter(source_name=fieldfile.name))
+        fieldfile._variants = variants
+    return variants
+
+
+def build_all_variants():
+    """Backfill variants for every tracked image field; returns images processed"""
+    from django.apps import apps
+
+    count = 0
+    for label, field in IMAGE_FIELDS.items():
+        names = apps.get_model(label).objects.exclude(**{field: ''}).exclude(
+            **{f'{field}__isnull': True}
+        ).values_list(field, flat=True).distinct()
+        for name in names.iterator():
+            if build_variants(name):
+                count += 1
+    return count
@@ -0,0 +1,12 @@
+# core/management/commands/build_autocomplete_index.py
+from django.core.management.base import BaseCommand
+from core.autocomplete import SNAPSHOT_PATH, rebuild_index
+
+
+class Command(BaseCommand):
+    help = ('Rebuilds the search autocomplete index, writes the snapshot web processes start from '
+            'and prunes old change log rows (run from cron)')
+
+    def handle(self, *args, **options):
+        index = rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f'Indexed {len(index)} entries into {SNAPSHOT_PATH}'))
@@ -0,0 +1,11 @@
+# core/management/commands/build_image_variants.py
+from django.core.management.base import BaseCommand
+from core.images import build_all_variants
+
+
+class Command(BaseCommand):
+    help = 'Builds resized WebP/JPEG variants for images uploaded before the pipeline existed'
+
+    def handle(self, *args, **options):
+        count = build_all_variants()
+        self.stdout.write(self.style.SUCCESS(f'Built variants for {count} images'))
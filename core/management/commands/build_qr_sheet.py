@@ -0,0 +1,24 @@
+# core/management/commands/build_qr_sheet.py
+import time
+from django.core.management.base import BaseCommand
+from core.qr_sheet import build_qr_sheet
+
+
+class Command(BaseCommand):
+    help = ('Builds a printable PDF sheet of QR codes for services and verified tutors '
+            '(run regenerate_qr_codes first for fresh codes)')
+
+    def add_arguments(self, parser):
+        parser.add_argument('output', help='Path of the PDF to write')
+        parser.add_argument('--only', choices=['services', 'tutors'], help='Limit to one kind')
+
+    def handle(self, *args, **options):
+        include = [options['only']] if options['only'] else ['services', 'tutors']
+
+        started = time.monotonic()
+        count = build_qr_sheet(options['output'], include=include)
+        elapsed = time.monotonic() - started
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote {count} QR code(s) to {options['output']} in {elapsed:.1f}s"
+        ))
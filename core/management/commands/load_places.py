@@ -0,0 +1,43 @@
+# core/management/commands/load_places.py
+import json
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils.text import slugify
+from core.models import Place, PlaceAlias
+from core.places import backfill_places, normalize
+
+
+class Command(BaseCommand):
+    help = 'Loads the campus gazetteer from JSON and re-resolves stored locations against it'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path',
+            help='JSON list of {"name", "slug"?, "kind"?, "latitude", "longitude", "aliases"?: [...]}',
+        )
+        parser.add_argument('--no-backfill', action='store_true', help='Only load the places')
+
+    def handle(self, *args, **options):
+        try:
+            with open(options['path'], encoding='utf-8') as f:
+                rows = json.load(f)
+        except (OSError, ValueError) as exc:
+            raise CommandError(f"Can't read {options['path']}: {exc}")
+
+        with transaction.atomic():
+            for row in rows:
+                place, _ = Place.objects.update_or_create(
+                    slug=row.get('slug') or slugify(row['name']),
+                    defaults={
+                        'name': row['name'],
+                        'kind': row.get('kind', 'building'),
+                        'latitude': row['latitude'],
+                        'longitude': row['longitude'],
+                    },
+                )
+                for alias in row.get('aliases', []):
+                    PlaceAlias.objects.update_or_create(alias=normalize(alias), defaults={'place': place})
+        self.stdout.write(self.style.SUCCESS(f'Loaded {len(rows)} places'))
+
+        if not options['no_backfill']:
+            self.stdout.write(self.style.SUCCESS(f'Resolved places for {backfill_places()} rows'))
@@ -0,0 +1,55 @@
+# core/management/commands/regenerate_qr_codes.py
+from concurrent.futures import ProcessPoolExecutor
+from django.core.management.base import BaseCommand
+from django.db import connection, connections
+from core.utils import (tutor_qr_payload, service_qr_payload, qr_code_is_stale,
+                        refresh_tutor_qr_code, refresh_service_qr_code)
+from tutoring.models import Tutor
+from services.models import Service
+
+
+def _init_worker():
+    # Under the spawn start method the child starts with an unconfigured Django
+    import django
+    django.setup()
+
+
+def _render(job):
+    """Render one QR code in a worker process (qrcode and Pillow hold the GIL)"""
+    func, pk, force = job
+    try:
+        func(pk, force=force)
+    finally:
+        connection.close()
+
+
+class Command(BaseCommand):
+    help = 'Regenerates QR codes (PNG + SVG) whose encoded payload has changed, in parallel'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--only', choices=['tutors', 'services'], help='Limit to one kind')
+        parser.add_argument('--force', action='store_true', help='Re-render even if up to date')
+        parser.add_argument('--workers', type=int, default=4, help='Parallel render workers')
+
+    def handle(self, *args, **options):
+        jobs = []
+
+        if options['only'] in (None, 'tutors'):
+            tutors = Tutor.objects.select_related('user', 'primary_subject')
+            jobs += [(refresh_tutor_qr_code, tutor.pk) for tutor in tutors.iterator(chunk_size=500)
+                     if options['force'] or qr_code_is_stale(tutor, tutor_qr_payload(tutor), check_files=True)]
+
+        if options['only'] in (None, 'services'):
+            jobs += [(refresh_service_qr_code, service.pk) for service in Service.objects.iterator(chunk_size=500)
+                     if options['force'] or qr_code_is_stale(service, service_qr_payload(service), check_files=True)]
+
+        if not jobs:
+            self.stdout.write(self.style.SUCCESS('All QR codes are up to date'))
+            return
+
+        # Forked workers must not share the parent's open connections
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=options['workers'], initializer=_init_worker) as pool:
+            list(pool.map(_render, [(func, pk, options['force']) for func, pk in jobs], chunksize=16))
+
+        self.stdout.write(self.style.SUCCESS(f'Regenerated {len(jobs)} QR code(s)'))
@@ -0,0 +1,11 @@
+# core/management/commands/resolve_places.py
+from django.core.management.base import BaseCommand
+from core.places import backfill_places
+
+
+class Command(BaseCommand):
+    help = 'Re-resolves free-text locations to gazetteer places (run after editing places or aliases)'
+
+    def handle(self, *args, **options):
+        count = backfill_places()
+        self.stdout.write(self.style.SUCCESS(f'Updated places for {count} rows'))
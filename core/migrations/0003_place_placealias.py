@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_imagevariant'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Place',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('slug', models.SlugField(max_length=100, unique=True)),
+                ('kind', models.CharField(choices=[('building', 'Building'), ('hall', 'Hall of Residence'), ('library', 'Library'), ('dining', 'Cafeteria/Dining'), ('sports', 'Sports Facility'), ('gate', 'Gate'), ('area', 'Area')], default='building', max_length=20)),
+                ('latitude', models.FloatField()),
+                ('longitude', models.FloatField()),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PlaceAlias',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alias', models.CharField(max_length=100, unique=True)),
+                ('place', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='core.place')),
+            ],
+            options={
+                'verbose_name_plural': 'Place aliases',
+                'ordering': ['alias'],
+            },
+        ),
+    ]
@@ -1,3 +1,121 @@
 from django.db import models
+from django.utils import timezone
 
-# Create your models here.
+
+class TaskWatermark(models.Model):
+    """High-water mark for periodic jobs so each run resumes where the last one stopped"""
+    name = models.CharField(max_length=100, unique=True)
+    value = models.DateTimeField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} @ {self.value:%Y-%m-%d %H:%M}"
+
+    @classmethod
+    def get_value(cls, name, default=None):
+        value = cls.objects.filter(name=name).values_list('value', flat=True).first()
+        return value if value is not None else default
+
+    @classmethod
+    def set_value(cls, name, value):
+        cls.objects.update_or_create(name=name, defaults={'value': value})
+
+    class Meta:
+        ordering = ['name']
+        verbose_name = "Task Watermark"
+        verbose_name_plural = "Task Watermarks"
+
+
+class CacheVersion(models.Model):
+    """
+    Change counter for data cached inside each process (see core.versions).
+    Every worker reads the same row, so a bump in one reaches them all.
+    """
+    name = models.CharField(max_length=100, unique=True)
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} v{self.version}"
+
+    class Meta:
+        ordering = ['name']
+
+
+class AutocompleteChange(models.Model):
+    """
+    A row that changed in one of the autocomplete sources (see core.autocomplete).
+    Each worker replays the changes past the last id it saw onto its own index.
+    """
+    kind = models.CharField(max_length=20)
+    object_id = models.PositiveBigIntegerField()
+    created_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id} changed"
+
+    class Meta:
+        ordering = ['id']
+
+
+class ImageVariant(models.Model):
+    """A resized, EXIF-free copy of an uploaded image, built by core.images"""
+    FORMAT_CHOICES = (
+        ('webp', 'WebP'),
+        ('jpeg', 'JPEG'),
+    )
+
+    source_name = models.CharField(max_length=255, db_index=True)  # storage name of the original
+    file = models.FileField(upload_to='variants/', max_length=255)
+    format = models.CharField(max_length=10, choices=FORMAT_CHOICES)
+    width = models.PositiveIntegerField()
+    height = models.PositiveIntegerField()
+    size = models.PositiveIntegerField(help_text="Bytes")
+    created_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"{self.source_name} {self.width}w {self.format}"
+
+    class Meta:
+        ordering = ['source_name', 'format', 'width']
+        constraints = [
+            models.UniqueConstraint(fields=['source_name', 'format', 'width'], name='unique_image_variant'),
+        ]
+
+
+class Place(models.Model):
+    """A named spot on campus; free-text locations are resolved to these by core.places"""
+    KIND_CHOICES = (
+        ('building', 'Building'),
+        ('hall', 'Hall of Residence'),
+        ('library', 'Library'),
+        ('dining', 'Cafeteria/Dining'),
+        ('sports', 'Sports Facility'),
+        ('gate', 'Gate'),
+        ('area', 'Area'),
+    )
+
+    name = models.CharField(max_length=100)
+    slug = models.SlugField(max_length=100, unique=True)
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, default='building')
+    latitude = models.FloatField()
+    longitude = models.FloatField()
+
+    def __str__(self):
+        return self.name
+
+    class Meta:
+        ordering = ['name']
+
+
+class PlaceAlias(models.Model):
+    """Another way people write a place's name, stored normalized ("lib", "hall six")"""
+    place = models.ForeignKey(Place, on_delete=models.CASCADE, related_name='aliases')
+    alias = models.CharField(max_length=100, unique=True)
+
+    def __str__(self):
+        return f"{self.alias} -> {self.place}"
+
+    class Meta:
+        ordering = ['alias']
+        verbose_name_plural = "Place aliases"
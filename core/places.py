@@ -0,0 +1,140 @@
+# core/places.py
+import math
+import re
+
+from django.core.cache import cache
+
+from .models import Place, PlaceAlias
+
+GAZETTEER_KEY = 'core:gazetteer'
+# Edits clear only the editing process's cache; other workers reload after this long
+GAZETTEER_TIMEOUT = 300
+EARTH_RADIUS_KM = 6371.0
+# "Near" for recommendations and filters: a few minutes' walk
+NEARBY_KM = 0.5
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Free-text location fields and the place foreign key each one resolves to
+LOCATION_FIELDS = {
+    'lost_found.LostItem': (('location_lost', 'place_lost'), ('location_found', 'place_found')),
+    'lost_found.FoundItem': (('location_found', 'place_found'),),
+    'jobs.Job': (('location', 'place'),),
+    'services.Service': (('location', 'place'),),
+    'accounts.CustomUser': (('location', 'place'),),
+}
+
+
+def normalize(text):
+    return ' '.join(TOKEN_RE.findall((text or '').lower()))
+
+
+def get_gazetteer():
+    """
+    {'names': {normalized name or alias: place id}, 'coords': {place id: (lat, lon)},
+    'longest': words in the longest name}, cached for five minutes or until a place or alias changes
+    """
+    gazetteer = cache.get(GAZETTEER_KEY)
+    if gazetteer is None:
+        names, coords = {}, {}
+        for pk, name, slug, latitude, longitude in Place.objects.values_list(
+                'pk', 'name', 'slug', 'latitude', 'longitude'):
+            names[normalize(name)] = pk
+            names[normalize(slug)] = pk
+            coords[pk] = (latitude, longitude)
+        # Aliases win over names when they collide: they were added on purpose
+        names.update((normalize(alias), pk) for alias, pk in PlaceAlias.objects.values_list('alias', 'place_id'))
+        names.pop('', None)
+        gazetteer = {
+            'names': names,
+            'coords': coords,
+            'longest': max((len(name.split()) for name in names), default=0),
+        }
+        cache.set(GAZETTEER_KEY, gazetteer, GAZETTEER_TIMEOUT)
+    return gazetteer
+
+
+def invalidate_gazetteer():
+    cache.delete(GAZETTEER_KEY)
+
+
+def resolve_place(text, gazetteer=None):
+    """
+    Place id named in a free-text location, or None. The longest known name
+    wins, so "room 4, hall 6 annex" picks "hall 6 annex" over "hall 6".
+    """
+    gazetteer = gazetteer or get_gazetteer()
+    words = normalize(text).split()
+    names = gazetteer['names']
+    for size in range(min(gazetteer['longest'], len(words)), 0, -1):
+        for start in range(len(words) - size + 1):
+            pk = names.get(' '.join(words[start:start + size]))
+            if pk is not None:
+                return pk
+    return None
+
+
+def haversine_km(a, b):
+    """Great-circle distance between two (lat, lon) pairs"""
+    lat1, lon1, lat2, lon2 = map(math.radians, (*a, *b))
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(h))
+
+
+def distance_km(place_a, place_b):
+    """Distance between two place ids, or None if either is unknown"""
+    coords = get_gazetteer()['coords']
+    if place_a not in coords or place_b not in coords:
+        return None
+    return haversine_km(coords[place_a], coords[place_b])
+
+
+def places_near(place_id, radius_km=NEARBY_KM):
+    """Ids of places within radius_km of a place (itself included), nearest first"""
+    coords = get_gazetteer()['coords']
+    if place_id not in coords:
+        return []
+    origin = coords[place_id]
+    distances = ((haversine_km(origin, point), pk) for pk, point in coords.items())
+    return [pk for distance, pk in sorted(distances) if distance <= radius_km]
+
+
+def resolve_instance(instance, update_fields=None):
+    """Set the place keys of a model instance from its location text"""
+    gazetteer = get_gazetteer()
+    for text_field, place_field in LOCATION_FIELDS[instance._meta.label]:
+        if update_fields is None or text_field in update_fields:
+            setattr(instance, f'{place_field}_id', resolve_place(getattr(instance, text_field), gazetteer))
+
+
+def backfill_places(chunk_size=500):
+    """Re-resolve every stored location (after loading or editing the gazetteer); returns rows changed"""
+    from django.apps import apps
+
+    gazetteer = get_gazetteer()
+    changed = 0
+    for label, fields in LOCATION_FIELDS.items():
+        model = apps.get_model(label)
+        columns = [name for pair in fields for name in (pair[0], f'{pair[1]}_id')]
+        batch = []
+        for row in model.objects.only('pk', *columns).order_by('pk').iterator(chunk_size=chunk_size):
+            dirty = False
+            for text_field, place_field in fields:
+                pk = resolve_place(getattr(row, text_field), gazetteer)
+                if pk != getattr(row, f'{place_field}_id'):
+                    setattr(row, f'{place_field}_id', pk)
+                    dirty = True
+            if dirty:
+                batch.append(row)
+            if len(batch) >= chunk_size:
+                changed += _save_places(model, batch, fields)
+                batch = []
+        if batch:
+            changed += _save_places(model, batch, fields)
+    return changed
+
+
+def _save_places(model, rows, fields):
+    # bulk_update skips save() and its signals, which is what a backfill wants
+    model.objects.bulk_update(rows, [place_field for _, place_field in fields])
+    return len(rows)
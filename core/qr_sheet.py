@@ -0,0 +1,143 @@
+# core/qr_sheet.py
+from PIL import Image
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import mm
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfgen import canvas
+
+from .tasks import run_in_background
+from .utils import QR_BOX_SIZE, tutor_qr_payload, service_qr_payload, qr_code_is_stale
+
+SHEET_COLUMNS = 3
+SHEET_ROWS = 4
+PAGE_MARGIN = 12 * mm
+QR_SIZE = 45 * mm
+PER_PAGE = SHEET_COLUMNS * SHEET_ROWS
+
+
+def _open_qr(field):
+    """
+    Stored QR PNG shrunk to one grey pixel per module. The PDF scales it back
+    up without interpolation, so it prints as sharp as the original at a
+    fraction of the size.
+    """
+    with field.open('rb') as f:
+        image = Image.open(f)
+        image.load()
+    modules = (image.width // QR_BOX_SIZE, image.height // QR_BOX_SIZE)
+    return ImageReader(image.resize(modules, Image.NEAREST).convert('L'))
+
+
+def _service_entries():
+    from services.models import Service
+    from .utils import refresh_service_qr_code
+
+    services = Service.objects.order_by('category', 'name', 'pk')
+    return services, lambda service: (
+        service.name, service.get_category_display(), service.qr_code,
+        qr_code_is_stale(service, service_qr_payload(service)), refresh_service_qr_code,
+    )
+
+
+def _tutor_entries():
+    from tutoring.models import Tutor
+    from .utils import refresh_tutor_qr_code
+
+    tutors = Tutor.objects.filter(is_verified=True).select_related(
+        'user', 'primary_subject'
+    ).order_by('primary_subject__name', 'user__first_name', 'pk')
+
+    def entry(tutor):
+        subject = tutor.primary_subject.name if tutor.primary_subject else 'Tutor'
+        return (tutor.full_name, f"Tutor - {subject}", tutor.qr_code,
+                qr_code_is_stale(tutor, tutor_qr_payload(tutor)), refresh_tutor_qr_code)
+    return tutors, entry
+
+
+SOURCES = {'services': _service_entries, 'tutors': _tutor_entries}
+
+
+def iter_entries(include):
+    """
+    (name, category, qr field) for every entry of the kinds in order, read
+    in chunks. Only stored QR images are used: stale or missing ones are
+    queued for re-rendering in the background rather than drawn here.
+    """
+    for kind in include:
+        queryset, to_entry = SOURCES[kind]()
+        for obj in queryset.iterator(chunk_size=200):
+            name, category, qr_field, stale, refresh = to_entry(obj)
+            if stale:
+                run_in_background(refresh, obj.pk)
+            yield name, category, qr_field
+
+
+def _fit(c, text, font, size, width):
+    """Truncate text with an ellipsis so it fits in `width` points"""
+    if c.stringWidth(text, font, size) <= width:
+        return text
+    while text and c.stringWidth(text + '...', font, size) > width:
+        text = text[:-1]
+    return text + '...'
+
+
+def build_qr_sheet(output, include=('services', 'tutors'), title='Campus Essentials Hub'):
+    """
+    Write a printable PDF of QR codes to `output` (path or binary file).
+
+    Entries are read in chunks and drawn page by page from stored QR
+    images, each opened only while its cell is drawn; codes that are
+    missing get a placeholder and are rendered in the background. Returns
+    the entry count.
+    """
+    page_width, page_height = A4
+    cell_width = (page_width - 2 * PAGE_MARGIN) / SHEET_COLUMNS
+    cell_height = (page_height - 2 * PAGE_MARGIN - 10 * mm) / SHEET_ROWS
+    entries = iter_entries(include)
+
+    c = canvas.Canvas(output, pagesize=A4, pageCompression=1)
+    c.setTitle(f"{title} QR codes")
+    count = 0
+
+    for name, category, qr_field in entries:
+        slot = count % PER_PAGE
+        if slot == 0:
+            if count:
+                c.showPage()
+            c.setFont('Helvetica-Bold', 11)
+            c.drawString(PAGE_MARGIN, page_height - PAGE_MARGIN, title)
+            c.setFont('Helvetica', 8)
+            c.drawRightString(page_width - PAGE_MARGIN, page_height - PAGE_MARGIN,
+                              f"Page {count // PER_PAGE + 1}")
+
+        column, row = slot % SHEET_COLUMNS, slot // SHEET_COLUMNS
+        x = PAGE_MARGIN + column * cell_width
+        y = page_height - PAGE_MARGIN - 10 * mm - (row + 1) * cell_height
+        qr_x = x + (cell_width - QR_SIZE) / 2
+        qr_y = y + cell_height - QR_SIZE - 2 * mm
+
+        try:
+            c.drawImage(_open_qr(qr_field), qr_x, qr_y, QR_SIZE, QR_SIZE)
+        except (OSError, ValueError):
+            # Not rendered yet; iter_entries queued it
+            c.setFont('Helvetica', 8)
+            c.drawCentredString(qr_x + QR_SIZE / 2, qr_y + QR_SIZE / 2, "QR code pending")
+
+        text_width = cell_width - 6 * mm
+        c.setFont('Helvetica-Bold', 10)
+        c.drawCentredString(x + cell_width / 2, qr_y - 5 * mm,
+                            _fit(c, name, 'Helvetica-Bold', 10, text_width))
+        c.setFont('Helvetica', 8)
+        c.drawCentredString(x + cell_width / 2, qr_y - 9 * mm,
+                            _fit(c, category, 'Helvetica', 8, text_width))
+        c.setDash(2, 2)
+        c.rect(x + 1 * mm, y + 1 * mm, cell_width - 2 * mm, cell_height - 2 * mm)
+        c.setDash()
+        count += 1
+
+    if not count:
+        c.setFont('Helvetica', 12)
+        c.drawString(PAGE_MARGIN, page_height - PAGE_MARGIN, "No QR codes to print.")
+
+    c.save()
+    return count
@@ -2,10 +2,12 @@
 from django.db.models import Q, Count
 from accounts.models import CustomUser
 from lost_found.models import LostItem
-from tutoring.models import Tutor
+from tutoring.models import Tutor, Subject
+from tutoring.matching import TutorMatcher
 from jobs.models import Job
 from resources.models import Resource
 from services.models import Service
+from .places import places_near
 import random
 
 
@@ -49,20 +51,29 @@ class RecommendationEngine:
     def get_course_based_recommendations(self):
         """Get recommendations based on user's course"""
         recommendations = []
-
-        # Find tutors for similar courses
-        tutors = Tutor.objects.filter(
-            user__course__icontains=self.user.course
-        ).exclude(user=self.user).order_by('-rating')[:3]
-
-        for tutor in tutors:
+        course = self.user.course.strip()
+        if not course:
+            return recommendations
+
+        # Rank tutors teaching subjects that match the course; with no such
+        # subject every tutor would score as a match, so recommend none
+        subject_ids = list(Subject.objects.filter(
+            Q(name__icontains=course) | Q(category__icontains=course)
+        ).values_list('id', flat=True))
+        if not subject_ids:
+            return recommendations
+        matches = TutorMatcher().match(student=self.user, subject_ids=subject_ids, limit=3, subject_required=True)
+
+        for match in matches:
+            tutor = match['tutor']
+            subject = tutor.primary_subject.name if tutor.primary_subject else 'General'
             recommendations.append({
                 'type': 'tutor',
                 'id': tutor.id,
-                'title': f"{tutor.user.username} - {tutor.get_primary_subject_display()} Tutor",
+                'title': f"{tutor.user.username} - {subject} Tutor",
                 'description': tutor.bio[:100] + '...',
-                'score': 0.8,
-                'link': f'/tutoring/{tutor.id}/'
+                'score': match['score'],
+                'link': f'/tutoring/tutor/{tutor.id}/'
             })
 
         # Find resources for the course
@@ -108,15 +119,19 @@ class RecommendationEngine:
 
     def get_location_based_recommendations(self):
         """Get recommendations based on user's location"""
-        if not self.user.location:
-            return []
+        if self.user.place_id:
+            near = Q(place__in=places_near(self.user.place_id))
+        else:
+            # Not a known place: fall back to matching the text
+            area = (self.user.location or '').split(',')[0].strip()
+            if not area:
+                return []
+            near = Q(location__icontains=area)
 
         recommendations = []
 
         # Find services near user's location
-        services = Service.objects.filter(
-            location__icontains=self.user.location.split(',')[0]
-        ).order_by('-average_rating')[:2]
+        services = Service.objects.filter(near).order_by('-average_rating')[:2]
 
         for service in services:
             recommendations.append({
@@ -129,10 +144,7 @@ class RecommendationEngine:
             })
 
         # Find jobs near user's location
-        jobs = Job.objects.filter(
-            location__icontains=self.user.location.split(',')[0],
-            status='open'
-        ).order_by('-created_at')[:2]
+        jobs = Job.objects.filter(near, status='open').order_by('-created_at')[:2]
 
         for job in jobs:
             recommendations.append({
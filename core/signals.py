@@ -0,0 +1,90 @@
+# core/signals.py
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
+
+from . import autocomplete
+from .images import IMAGE_FIELDS, delete_variants, replace_variants, strip_metadata
+from .models import Place, PlaceAlias
+from .places import LOCATION_FIELDS, invalidate_gazetteer, resolve_instance
+from .tasks import run_in_background
+
+
+def _field_name(instance, field):
+    value = instance.__dict__.get(field)
+    return getattr(value, 'name', value) or ''
+
+
+def _connect(label, field):
+    def remember_image(sender, instance, **kwargs):
+        instance._variant_source = _field_name(instance, field)
+
+    def strip_upload(sender, instance, **kwargs):
+        # Before the file field stores a new upload, so the original never keeps its EXIF
+        strip_metadata(getattr(instance, field))
+
+    def queue_variants(sender, instance, **kwargs):
+        name = _field_name(instance, field)
+        if name != instance._variant_source:
+            run_in_background(replace_variants, instance._variant_source, name)
+        instance._variant_source = name
+
+    def drop_variants(sender, instance, **kwargs):
+        if _field_name(instance, field):
+            run_in_background(delete_variants, _field_name(instance, field))
+
+    # Lazy "app_label.Model" senders: core loads before the apps it serves
+    post_init.connect(remember_image, sender=label, weak=False)
+    pre_save.connect(strip_upload, sender=label, weak=False)
+    post_save.connect(queue_variants, sender=label, weak=False)
+    post_delete.connect(drop_variants, sender=label, weak=False)
+
+
+for label, field in IMAGE_FIELDS.items():
+    _connect(label, field)
+
+
+def _connect_autocomplete(kind, label):
+    def index_entry(sender, instance, update_fields=None, **kwargs):
+        shared = update_fields is None or not autocomplete.RANKING_FIELDS.issuperset(update_fields)
+        transaction.on_commit(lambda: autocomplete.update_entry(kind, instance, shared))
+
+    def unindex_entry(sender, instance, **kwargs):
+        pk = instance.pk
+        transaction.on_commit(lambda: autocomplete.remove_entry(kind, pk))
+
+    post_save.connect(index_entry, sender=label, weak=False)
+    post_delete.connect(unindex_entry, sender=label, weak=False)
+
+
+for kind, (label, _, _) in autocomplete.SOURCES.items():
+    _connect_autocomplete(kind, label)
+
+
+def reindex_tutor_name(sender, instance, created, update_fields=None, **kwargs):
+    """Tutor entries are titled with the user's name"""
+    if created or (update_fields is not None and not {'first_name', 'last_name', 'username'} & set(update_fields)):
+        return
+    tutor = getattr(instance, 'tutor_profile', None)
+    if tutor is not None:
+        transaction.on_commit(lambda: autocomplete.update_entry('tutor', tutor))
+
+
+post_save.connect(reindex_tutor_name, sender='accounts.CustomUser', weak=False)
+
+
+def resolve_places(sender, instance, update_fields=None, **kwargs):
+    """Normalize free-text locations to place ids on every write"""
+    resolve_instance(instance, update_fields)
+
+
+for label in LOCATION_FIELDS:
+    pre_save.connect(resolve_places, sender=label, weak=False)
+
+
+def refresh_gazetteer(sender, **kwargs):
+    invalidate_gazetteer()
+
+
+for model in (Place, PlaceAlias):
+    post_save.connect(refresh_gazetteer, sender=model)
+    post_delete.connect(refresh_gazetteer, sender=model)
@@ -0,0 +1,35 @@
+from django import template
+from django.forms.utils import flatatt
+from django.utils.html import format_html
+
+from core.images import get_variants
+
+register = template.Library()
+
+
+def _srcset(variants):
+    return ', '.join(f"{variant.file.url} {variant.width}w" for variant in variants)
+
+
+@register.simple_tag
+def responsive_image(image, sizes='100vw', **attrs):
+    """
+    <picture> with WebP and JPEG srcsets from the image's variants, or a
+    plain <img> of the original until the variants have been built.
+    Usage: {% responsive_image item.image sizes="(min-width: 768px) 33vw, 100vw" class="..." alt=item.title %}
+    """
+    attrs.setdefault('loading', 'lazy')
+    variants = get_variants(image)
+    if not variants:
+        return format_html('<img src="{}"{}>', image.url, flatatt(attrs))
+
+    webp = sorted((v for v in variants if v.format == 'webp'), key=lambda v: v.width)
+    jpeg = sorted((v for v in variants if v.format == 'jpeg'), key=lambda v: v.width)
+    largest = jpeg[-1]
+    if 'width' not in attrs and 'height' not in attrs:
+        # Intrinsic size lets the browser reserve space before the image loads
+        attrs.update(width=largest.width, height=largest.height)
+    return format_html(
+        '<picture><source type="image/webp" srcset="{}" sizes="{}"><img src="{}" srcset="{}" sizes="{}"{}></picture>',
+        _srcset(webp), sizes, largest.file.url, _srcset(jpeg), sizes, flatatt(attrs),
+    )
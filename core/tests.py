@@ -1,3 +1,17 @@
-from django.test import TestCase
+from decimal import Decimal
 
-# Create your tests here.
+from django.test import SimpleTestCase
+
+from .exports import _csv_cell
+
+
+class CsvCellTests(SimpleTestCase):
+    def test_formula_like_text_is_quoted(self):
+        for value in ['=HYPERLINK("http://x")', '+1', '-2+3', '@SUM(A1)', '\t=1', '\r=1']:
+            with self.subTest(value=value):
+                self.assertEqual(_csv_cell(value), f"'{value}")
+
+    def test_other_values_are_untouched(self):
+        for value in ['Plain text', 'a=b', '', -5, Decimal('-1.50'), None]:
+            with self.subTest(value=value):
+                self.assertEqual(_csv_cell(value), value)
@@ -1,10 +1,16 @@
 # core/utils.py
 import qrcode
+import qrcode.image.svg
+import hashlib
 from io import BytesIO
+from django.conf import settings
 from django.core.files import File
 from PIL import Image
 import os
 
+# Pixels per QR module in the stored PNGs
+QR_BOX_SIZE = 10
+
 
 def generate_qr_code(data, filename):
     """
@@ -13,7 +19,7 @@ def generate_qr_code(data, filename):
     qr = qrcode.QRCode(
         version=1,
         error_correction=qrcode.constants.ERROR_CORRECT_L,
-        box_size=10,
+        box_size=QR_BOX_SIZE,
         border=4,
     )
     qr.add_data(data)
@@ -29,43 +35,110 @@ def generate_qr_code(data, filename):
     return File(buffer, name=f'{filename}.png')
 
 
-def generate_tutor_qr_code(tutor):
-    """
-    Generate QR code for tutor profile
+def generate_qr_svg(data, filename):
     """
-    data = f"""
-    Tutor: {tutor.user.get_full_name()}
-    Subject: {tutor.get_primary_subject_display()}
-    Rate: KSH {tutor.hourly_rate}/hr
-    Contact: {tutor.user.email}
-    Platform: Campus Essentials Hub
-    Profile: https://yourdomain.com/tutoring/{tutor.id}/
+    Generate a QR code as a scalable SVG file (for print)
     """
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        border=4,
+        image_factory=qrcode.image.svg.SvgPathImage,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+
+    buffer = BytesIO(qr.make_image().to_string())
+    return File(buffer, name=f'{filename}.svg')
+
+
+def qr_payload_hash(data):
+    """Hash of the encoded text; the QR image only changes when this does"""
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def tutor_qr_payload(tutor):
+    subject = tutor.primary_subject.name if tutor.primary_subject else 'General'
+    return '\n'.join([
+        f"Tutor: {tutor.user.get_full_name() or tutor.user.username}",
+        f"Subject: {subject}",
+        f"Rate: KSH {tutor.hourly_rate}/hr",
+        f"Contact: {tutor.contact_email or tutor.user.email}",
+        "Platform: Campus Essentials Hub",
+        f"Profile: {settings.SITE_URL}/tutoring/tutor/{tutor.id}/",
+    ])
+
 
-    filename = f'tutor_{tutor.id}_qr'
-    qr_file = generate_qr_code(data, filename)
+def service_qr_payload(service):
+    return '\n'.join([
+        f"Service: {service.name}",
+        f"Category: {service.get_category_display()}",
+        f"Location: {service.location}",
+        f"Contact: {service.contact_number}",
+        f"Hours: {service.opening_hours}",
+        "Platform: Campus Essentials Hub",
+        f"Profile: {settings.SITE_URL}/services/{service.id}/",
+    ])
 
-    # Save to tutor model
-    tutor.qr_code.save(f'{filename}.png', qr_file, save=True)
-    return tutor.qr_code.url
 
+def qr_code_is_stale(instance, data, check_files=False):
+    if not (instance.qr_code and instance.qr_code_svg and
+            instance.qr_payload_hash == qr_payload_hash(data)):
+        return True
+    if check_files:
+        storage = instance.qr_code.storage
+        return not (storage.exists(instance.qr_code.name) and storage.exists(instance.qr_code_svg.name))
+    return False
 
-def generate_service_qr_code(service):
+
+def _refresh_qr_code(instance, filename, data, force=False):
+    """Render PNG and SVG for `data` unless the stored ones already match it"""
+    if not force and not qr_code_is_stale(instance, data):
+        return instance.qr_code.url
+
+    # Replace rather than accumulate suffixed copies in storage
+    for field in (instance.qr_code, instance.qr_code_svg):
+        if field and field.storage.exists(field.name):
+            field.delete(save=False)
+
+    instance.qr_code.save(f'{filename}.png', generate_qr_code(data, filename), save=False)
+    instance.qr_code_svg.save(f'{filename}.svg', generate_qr_svg(data, filename), save=False)
+    instance.qr_payload_hash = qr_payload_hash(data)
+
+    # update() so saving the QR doesn't fire post_save and schedule itself again
+    type(instance).objects.filter(pk=instance.pk).update(
+        qr_code=instance.qr_code.name,
+        qr_code_svg=instance.qr_code_svg.name,
+        qr_payload_hash=instance.qr_payload_hash,
+    )
+    return instance.qr_code.url
+
+
+def generate_tutor_qr_code(tutor, force=False):
     """
-    Generate QR code for service
+    Generate QR code for tutor profile
     """
-    data = f"""
-    Service: {service.name}
-    Category: {service.get_category_display()}
-    Location: {service.location}
-    Contact: {service.contact_number}
-    Hours: {service.opening_hours}
-    Platform: Campus Essentials Hub
-    Profile: https://yourdomain.com/services/{service.id}/
+    return _refresh_qr_code(tutor, f'tutor_{tutor.id}_qr', tutor_qr_payload(tutor), force)
+
+
+def generate_service_qr_code(service, force=False):
     """
+    Generate QR code for service
+    """
+    return _refresh_qr_code(service, f'service_{service.id}_qr', service_qr_payload(service), force)
+
+
+def refresh_tutor_qr_code(tutor_id, force=False):
+    """Background entry point: (re)build a tutor's QR code if its payload changed"""
+    from tutoring.models import Tutor
+    tutor = Tutor.objects.select_related('user', 'primary_subject').filter(pk=tutor_id).first()
+    if tutor:
+        generate_tutor_qr_code(tutor, force)
 
-    filename = f'service_{service.id}_qr'
-    qr_file = generate_qr_code(data, filename)
 
-    service.qr_code.save(f'{filename}.png', qr_file, save=True)
-    return service.qr_code.url
\ No newline at end of file
+def refresh_service_qr_code(service_id, force=False):
+    """Background entry point: (re)build a service's QR code if its payload changed"""
+    from services.models import Service
+    service = Service.objects.filter(pk=service_id).first()
+    if service:
+        generate_service_qr_code(service, force)
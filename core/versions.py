@@ -0,0 +1,36 @@
+# core/versions.py
+import time
+
+from django.db import transaction
+from django.db.models import F
+
+from .models import CacheVersion
+
+# name -> (checked at, version) for this process
+_seen = {}
+
+
+def get_version(name, max_age=0):
+    """
+    Current version of `name` from the database. With max_age, a value read
+    in this process less than max_age seconds ago is reused.
+    """
+    checked_at, version = _seen.get(name, (0, None))
+    now = time.monotonic()
+    if version is None or now - checked_at >= max_age:
+        version = CacheVersion.objects.filter(name=name).values_list('version', flat=True).first() or 0
+        _seen[name] = (now, version)
+    return version
+
+
+def increment_version(name):
+    """Bump `name` right away; returns the new version"""
+    if not CacheVersion.objects.filter(name=name).update(version=F('version') + 1):
+        CacheVersion.objects.get_or_create(name=name, defaults={'version': 1})
+    _seen.pop(name, None)
+    return get_version(name)
+
+
+def bump_version(name):
+    """Tell every process its copy of `name` is stale (once the transaction commits)"""
+    transaction.on_commit(lambda: increment_version(name))
@@ -2,6 +2,8 @@
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import FileResponse
 from django.db.models import Count
 from accounts.models import CustomUser
 from lost_found.models import LostItem
@@ -9,6 +11,10 @@ from tutoring.models import Tutor
 from jobs.models import Job
 from resources.models import Resource
 import random
+import tempfile
+from .qr_sheet import build_qr_sheet
+
+QR_SHEET_SPOOL_SIZE = 5 * 1024 * 1024
 
 
 def home(request):
@@ -82,6 +88,20 @@ def contact(request):
     return render(request, 'core/contact.html')
 
 
+@staff_member_required
+def qr_sheet(request):
+    """Printable PDF of QR codes for services and verified tutors, as one document"""
+    include = [kind for kind in request.GET.get('include', 'services,tutors').split(',')
+               if kind in ('services', 'tutors')] or ['services', 'tutors']
+
+    # Small sheets stay in memory; larger ones spill to disk and stream back from there
+    output = tempfile.SpooledTemporaryFile(max_size=QR_SHEET_SPOOL_SIZE)
+    build_qr_sheet(output, include=include)
+    output.seek(0)
+    return FileResponse(output, as_attachment=True, filename='campus-qr-codes.pdf',
+                        content_type='application/pdf')
+
+
 # Context processors
 def notification_count(request):
     """Add notification count to all templates"""
@@ -0,0 +1,129 @@
+# jobs/alerts.py
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from messaging.models import Notification
+from .models import Job, JobSearchTerm, SavedJobSearch, SavedSearchKey, SavedSearchMatch
+from .search import tokenize
+
+DIGEST_PREVIEW = 5
+
+
+def search_terms(search):
+    return set(tokenize(search.keywords))
+
+
+def index_key(search):
+    """The search's most selective key: its rarest keyword or its category, else 'all'"""
+    candidates = []
+    terms = search_terms(search)
+    if terms:
+        frequency = dict(
+            JobSearchTerm.objects.filter(term__in=terms).values_list('term')
+            .annotate(n=Count('id')).values_list('term', 'n')
+        )
+        rarest = min(terms, key=lambda term: (frequency.get(term, 0), term))
+        candidates.append((frequency.get(rarest, 0), f'term:{rarest}'))
+    if search.category:
+        candidates.append((Job.objects.filter(category=search.category).count(), f'category:{search.category}'))
+    return min(candidates)[1] if candidates else 'all'
+
+
+def index_search(search):
+    SavedSearchKey.objects.update_or_create(search=search, defaults={'key': index_key(search)})
+
+
+def search_matches_job(search, job, job_terms):
+    if search.category and search.category != job.category:
+        return False
+    if search.budget_min is not None and job.budget < search.budget_min:
+        return False
+    if search.remote_only and not job.is_remote:
+        return False
+    return search_terms(search) <= job_terms
+
+
+def match_job(job):
+    """
+    Active saved searches a job satisfies. Only searches filed under one of
+    the job's own keys are loaded, so the cost follows the number of
+    plausible matches rather than the number of subscriptions.
+    """
+    job_terms = set(JobSearchTerm.objects.filter(job=job).values_list('term', flat=True))
+    keys = [f'term:{term}' for term in job_terms] + [f'category:{job.category}', 'all']
+    candidates = SavedJobSearch.objects.filter(
+        is_active=True, index_key__key__in=keys
+    ).exclude(user_id=job.user_id)
+    return [search for search in candidates if search_matches_job(search, job, job_terms)]
+
+
+@transaction.atomic
+def deliver_job_alerts(job_id):
+    """Record matches for a new job and notify instant subscribers, one notification per user"""
+    job = Job.objects.filter(pk=job_id, status='open').first()
+    if job is None:
+        return 0
+    searches = match_job(job)
+    if not searches:
+        return 0
+
+    now = timezone.now()
+    SavedSearchMatch.objects.bulk_create([
+        SavedSearchMatch(search=search, job=job, notified_at=now if search.frequency == 'instant' else None)
+        for search in searches
+    ], ignore_conflicts=True)
+
+    instant = {}
+    for search in searches:
+        if search.frequency == 'instant':
+            instant.setdefault(search.user_id, search)
+    Notification.objects.bulk_create([
+        Notification(
+            user_id=user_id,
+            notification_type='job_alert',
+            title=f"New job: {job.title}"[:200],
+            message=f"{job.get_category_display()} - ${job.budget}. Matches your saved search: {search}.",
+            link=f'/jobs/{job.id}/',
+        )
+        for user_id, search in instant.items()
+    ])
+    return len(searches)
+
+
+def send_daily_digests(now=None):
+    """One notification per user summarizing their pending daily-digest matches"""
+    now = now or timezone.now()
+    pending = SavedSearchMatch.objects.filter(
+        notified_at__isnull=True, created_at__lte=now,
+        search__frequency='daily', search__is_active=True,
+    )
+
+    jobs_by_user = defaultdict(dict)
+    for user_id, job_id, title in pending.filter(job__status='open').order_by('-job__created_at').values_list(
+        'search__user_id', 'job_id', 'job__title'
+    ).iterator(chunk_size=2000):
+        jobs_by_user[user_id].setdefault(job_id, title)
+
+    notifications = []
+    for user_id, jobs in jobs_by_user.items():
+        titles = list(jobs.values())
+        message = '\n'.join(f"- {title}" for title in titles[:DIGEST_PREVIEW])
+        if len(titles) > DIGEST_PREVIEW:
+            message += f"\n...and {len(titles) - DIGEST_PREVIEW} more"
+        notifications.append(Notification(
+            user_id=user_id,
+            notification_type='job_alert',
+            title=f"{len(titles)} new job{'s' if len(titles) != 1 else ''} match your saved searches",
+            message=message,
+            link='/jobs/saved-searches/',
+        ))
+
+    with transaction.atomic():
+        Notification.objects.bulk_create(notifications, batch_size=500)
+        # Matches on jobs that closed since are dropped rather than sent late
+        pending.update(notified_at=now)
+        SavedJobSearch.objects.filter(frequency='daily', is_active=True).update(last_digest_at=now)
+    return len(notifications)
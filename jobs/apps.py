@@ -3,4 +3,7 @@ from django.apps import AppConfig
 
 class JobsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'jobs'
\ No newline at end of file
+    name = 'jobs'
+
+    def ready(self):
+        from . import signals  # noqa: F401
\ No newline at end of file
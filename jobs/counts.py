@@ -0,0 +1,26 @@
+# jobs/counts.py
+from django.core.cache import cache
+from django.db.models import Count
+
+from .models import Job
+
+CATEGORY_COUNTS_KEY = 'jobs:open_category_counts'
+# The cache is per process and saves only clear the local copy, so other
+# workers pick up changes when this runs out
+CATEGORY_COUNTS_TIMEOUT = 60
+
+
+def get_open_category_counts():
+    """{category: open job count}, from one grouped query cached for a minute or until a job changes here"""
+    counts = cache.get(CATEGORY_COUNTS_KEY)
+    if counts is None:
+        counts = dict(
+            Job.objects.filter(status='open').values_list('category').annotate(n=Count('id'))
+            .values_list('category', 'n')
+        )
+        cache.set(CATEGORY_COUNTS_KEY, counts, CATEGORY_COUNTS_TIMEOUT)
+    return counts
+
+
+def invalidate_category_counts():
+    cache.delete(CATEGORY_COUNTS_KEY)
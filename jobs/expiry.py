@@ -0,0 +1,60 @@
+# jobs/expiry.py
+from django.db import transaction
+from django.utils import timezone
+
+from core import autocomplete
+from messaging.models import Notification
+from .counts import invalidate_category_counts
+from .models import Job
+
+CHUNK_SIZE = 500
+
+
+def expired_jobs(today):
+    """Open jobs whose application deadline has passed, via the (status, application_deadline) index"""
+    return Job.objects.filter(status='open', application_deadline__lt=today)
+
+
+def expire_jobs(today=None, chunk_size=CHUNK_SIZE, dry_run=False):
+    """
+    Move open jobs past their deadline to 'expired' and tell their owners.
+    Each chunk is one transaction: a bulk UPDATE plus one bulk INSERT of
+    notifications. Expired rows leave the open set, so every pass reads the
+    head of the index again instead of paging through it. Returns the
+    number of jobs expired.
+    """
+    today = today or timezone.localdate()
+    if dry_run:
+        return expired_jobs(today).count()
+
+    total = 0
+    expired_ids = []
+    while True:
+        with transaction.atomic():
+            chunk = list(expired_jobs(today).select_for_update().order_by(
+                'application_deadline', 'id'
+            ).values_list('id', 'user_id', 'title', 'application_deadline')[:chunk_size])
+            if not chunk:
+                break
+            # Re-check the status so a job reopened meanwhile is left alone
+            Job.objects.filter(pk__in=[row[0] for row in chunk], status='open').update(
+                status='expired', updated_at=timezone.now()
+            )
+            Notification.objects.bulk_create([
+                Notification(
+                    user_id=user_id,
+                    notification_type='job_expired',
+                    title=f"Job expired: {title}"[:200],
+                    message=f"Applications closed on {deadline:%b %d, %Y}, so the job was taken off the job board.",
+                    link=f'/jobs/{job_id}/',
+                )
+                for job_id, user_id, title, deadline in chunk
+            ])
+        total += len(chunk)
+        expired_ids.extend(row[0] for row in chunk)
+
+    if total:
+        # The UPDATE bypasses Job.save, so the post_save invalidation never ran
+        invalidate_category_counts()
+        autocomplete.remove_entries('job', expired_ids)
+    return total
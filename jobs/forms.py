@@ -1,6 +1,6 @@
 from django import forms
 from django.utils import timezone
-from .models import Job, JobApplication
+from .models import Job, JobApplication, SavedJobSearch
 
 
 class JobForm(forms.ModelForm):
@@ -87,6 +87,20 @@ class ApplicationForm(forms.ModelForm):
 
 
 class JobFilterForm(forms.Form):
+    search = forms.CharField(
+        required=False,
+        widget=forms.TextInput(attrs={
+            'class': 'form-control',
+            'placeholder': 'Search jobs...'
+        })
+    )
+    skills = forms.CharField(
+        required=False,
+        widget=forms.TextInput(attrs={
+            'class': 'form-control',
+            'placeholder': 'e.g. Excel, Photoshop'
+        })
+    )
     category = forms.ChoiceField(
         choices=[('', 'All Categories')] + list(Job.CATEGORY_CHOICES),
         required=False,
@@ -117,14 +131,46 @@ class JobFilterForm(forms.Form):
             'step': '0.01'
         })
     )
+    remote = forms.BooleanField(
+        required=False,
+        widget=forms.CheckboxInput(attrs={'class': 'form-check-input'})
+    )
+    deadline_after = forms.DateField(
+        required=False,
+        widget=forms.DateInput(attrs={'class': 'form-control', 'type': 'date'})
+    )
     sort_by = forms.ChoiceField(
         choices=[
+            ('relevance', 'Best Match'),
             ('-created_at', 'Newest First'),
             ('created_at', 'Oldest First'),
             ('budget', 'Budget: Low to High'),
             ('-budget', 'Budget: High to Low'),
         ],
         required=False,
-        initial='-created_at',
+        initial='relevance',
         widget=forms.Select(attrs={'class': 'form-select'})
-    )
\ No newline at end of file
+    )
+
+class SavedJobSearchForm(forms.ModelForm):
+    class Meta:
+        model = SavedJobSearch
+        fields = ['name', 'keywords', 'category', 'budget_min', 'remote_only', 'frequency']
+        widgets = {
+            'name': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., Weekend tutoring gigs'
+            }),
+            'keywords': forms.TextInput(attrs={
+                'class': 'form-control',
+                'placeholder': 'e.g., python data entry'
+            }),
+            'category': forms.Select(attrs={'class': 'form-select'}),
+            'budget_min': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'step': '0.01',
+                'min': '0'
+            }),
+            'remote_only': forms.CheckboxInput(attrs={'class': 'form-check-input'}),
+            'frequency': forms.Select(attrs={'class': 'form-select'}),
+        }
@@ -0,0 +1,18 @@
+# jobs/management/commands/expire_jobs.py
+from django.core.management.base import BaseCommand
+from jobs.expiry import expire_jobs, CHUNK_SIZE
+
+
+class Command(BaseCommand):
+    help = 'Closes open jobs whose application deadline has passed (run from cron)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE,
+                            help='Jobs updated per transaction')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Count expired jobs without changing them')
+
+    def handle(self, *args, **options):
+        count = expire_jobs(chunk_size=options['chunk_size'], dry_run=options['dry_run'])
+        verb = 'Would expire' if options['dry_run'] else 'Expired'
+        self.stdout.write(self.style.SUCCESS(f'{verb} {count} jobs'))
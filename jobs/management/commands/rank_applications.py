@@ -0,0 +1,20 @@
+# jobs/management/commands/rank_applications.py
+from django.core.management.base import BaseCommand
+from jobs.models import JobApplication
+from jobs.ranking import rank_applications, CHUNK_SIZE
+
+
+class Command(BaseCommand):
+    help = 'Recomputes applicant ranking scores (new applications are scored as they arrive)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--pending-only', action='store_true',
+                            help='Only rescore applications still awaiting a decision')
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        ids = None
+        if options['pending_only']:
+            ids = JobApplication.objects.filter(status='pending').values('id')
+        count = rank_applications(ids, chunk_size=options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(f'Ranked {count} applications'))
@@ -0,0 +1,11 @@
+# jobs/management/commands/rebuild_job_search.py
+from django.core.management.base import BaseCommand
+from jobs.search import rebuild_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the job full-text index and normalized skill links'
+
+    def handle(self, *args, **options):
+        count = rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f'Indexed {count} jobs'))
@@ -0,0 +1,11 @@
+# jobs/management/commands/send_job_digests.py
+from django.core.management.base import BaseCommand
+from jobs.alerts import send_daily_digests
+
+
+class Command(BaseCommand):
+    help = 'Sends the daily job alert digests (run from cron once a day)'
+
+    def handle(self, *args, **options):
+        count = send_daily_digests()
+        self.stdout.write(self.style.SUCCESS(f'Sent {count} job alert digests'))
@@ -0,0 +1,79 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:19
+
+import django.core.validators
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=200)),
+                ('description', models.TextField()),
+                ('category', models.CharField(choices=[('typing', 'Typing Work'), ('design', 'Design'), ('errands', 'Errands'), ('academic', 'Academic Support'), ('photography', 'Photography'), ('tutoring', 'Tutoring'), ('tech', 'Tech Support'), ('writing', 'Writing'), ('other', 'Other')], max_length=50)),
+                ('location', models.CharField(max_length=200)),
+                ('budget', models.DecimalField(decimal_places=2, max_digits=10, validators=[django.core.validators.MinValueValidator(0.01)])),
+                ('budget_type', models.CharField(choices=[('fixed', 'Fixed'), ('hourly', 'Hourly')], max_length=20)),
+                ('duration', models.CharField(blank=True, max_length=100)),
+                ('skills_required', models.TextField(blank=True)),
+                ('status', models.CharField(choices=[('open', 'Open'), ('in_progress', 'In Progress'), ('completed', 'Completed'), ('cancelled', 'Cancelled')], default='open', max_length=20)),
+                ('is_remote', models.BooleanField(default=False, verbose_name='Remote work available')),
+                ('application_deadline', models.DateField(blank=True, null=True)),
+                ('contact_email', models.EmailField(blank=True, max_length=254, null=True)),
+                ('contact_phone', models.CharField(blank=True, max_length=20, null=True)),
+                ('views_count', models.PositiveIntegerField(default=0, editable=False)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='posted_jobs', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='JobApplication',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cover_letter', models.TextField()),
+                ('proposed_rate', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True, validators=[django.core.validators.MinValueValidator(0.01)])),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('accepted', 'Accepted'), ('rejected', 'Rejected'), ('withdrawn', 'Withdrawn')], default='pending', max_length=20)),
+                ('applicant_message', models.TextField(blank=True)),
+                ('attachments', models.FileField(blank=True, null=True, upload_to='job_applications/%Y/%m/%d/')),
+                ('applied_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('applicant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_applications', to=settings.AUTH_USER_MODEL)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='applications', to='jobs.job')),
+            ],
+            options={
+                'ordering': ['-applied_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['status', 'created_at'], name='jobs_job_status_277b31_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['category', 'status'], name='jobs_job_categor_d88068_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['status', 'applied_at'], name='jobs_jobapp_status_6642d6_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='jobapplication',
+            unique_together={('job', 'applicant')},
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:20
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0002_skill_jobsearchterm_jobskill'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SavedJobSearch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(blank=True, max_length=100)),
+                ('keywords', models.CharField(blank=True, help_text='Every word must appear in the job', max_length=200)),
+                ('category', models.CharField(blank=True, choices=[('typing', 'Typing Work'), ('design', 'Design'), ('errands', 'Errands'), ('academic', 'Academic Support'), ('photography', 'Photography'), ('tutoring', 'Tutoring'), ('tech', 'Tech Support'), ('writing', 'Writing'), ('other', 'Other')], max_length=50)),
+                ('budget_min', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('remote_only', models.BooleanField(default=False)),
+                ('frequency', models.CharField(choices=[('instant', 'As jobs are posted'), ('daily', 'Daily digest')], default='instant', max_length=10)),
+                ('is_active', models.BooleanField(default=True)),
+                ('last_digest_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='saved_job_searches', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SavedSearchKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(db_index=True, max_length=70)),
+                ('search', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='index_key', to='jobs.savedjobsearch')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='SavedSearchMatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('notified_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_matches', to='jobs.job')),
+                ('search', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='matches', to='jobs.savedjobsearch')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['search', 'notified_at'], name='jobs_saveds_search__4dd630_idx')],
+                'constraints': [models.UniqueConstraint(fields=('search', 'job'), name='unique_saved_search_match')],
+            },
+        ),
+    ]
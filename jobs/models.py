@@ -18,11 +18,36 @@ class Job(models.Model):
         ('other', 'Other'),
     )
 
+    # Bootstrap color and FontAwesome icon per category
+    CATEGORY_COLORS = {
+        'typing': 'primary',
+        'design': 'success',
+        'errands': 'warning',
+        'academic': 'info',
+        'photography': 'danger',
+        'tutoring': 'purple',
+        'tech': 'dark',
+        'writing': 'secondary',
+        'other': 'secondary'
+    }
+    CATEGORY_ICONS = {
+        'typing': 'keyboard',
+        'design': 'paint-brush',
+        'errands': 'running',
+        'academic': 'graduation-cap',
+        'photography': 'camera',
+        'tutoring': 'chalkboard-teacher',
+        'tech': 'laptop-code',
+        'writing': 'pen-fancy',
+        'other': 'ellipsis-h'
+    }
+
     STATUS_CHOICES = (
         ('open', 'Open'),
         ('in_progress', 'In Progress'),
         ('completed', 'Completed'),
         ('cancelled', 'Cancelled'),
+        ('expired', 'Expired'),
     )
 
     user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='posted_jobs')
@@ -30,6 +55,8 @@ class Job(models.Model):
     description = models.TextField()
     category = models.CharField(max_length=50, choices=CATEGORY_CHOICES)
     location = models.CharField(max_length=200)
+    place = models.ForeignKey('core.Place', on_delete=models.SET_NULL, null=True, blank=True,
+                              editable=False, related_name='+')
     budget = models.DecimalField(
         max_digits=10,
         decimal_places=2,
@@ -64,11 +91,18 @@ class Job(models.Model):
     def get_absolute_url(self):
         return reverse('jobs:detail', kwargs={'pk': self.pk})
 
+    def get_category_color(self):
+        return self.CATEGORY_COLORS.get(self.category, 'secondary')
+
+    def get_category_icon(self):
+        return self.CATEGORY_ICONS.get(self.category, 'briefcase')
+
     class Meta:
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['status', 'created_at']),
             models.Index(fields=['category', 'status']),
+            models.Index(fields=['status', 'application_deadline']),
         ]
 
 
@@ -95,6 +129,9 @@ class JobApplication(models.Model):
     attachments = models.FileField(upload_to='job_applications/%Y/%m/%d/', blank=True, null=True)
     applied_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
+    # Filled in by jobs.ranking after the application arrives
+    rank_score = models.FloatField(default=0, editable=False)
+    score_breakdown = models.JSONField(default=dict, blank=True, editable=False)
 
     def __str__(self):
         return f"Application by {self.applicant.username} for {self.job.title}"
@@ -116,4 +153,99 @@ class JobApplication(models.Model):
         unique_together = ['job', 'applicant']
         indexes = [
             models.Index(fields=['status', 'applied_at']),
-        ]
\ No newline at end of file
+            models.Index(fields=['job', '-rank_score']),
+        ]
+
+class Skill(models.Model):
+    """Normalized skill parsed from jobs' free-text skills_required"""
+    name = models.CharField(max_length=60, unique=True)
+
+    def __str__(self):
+        return self.name
+
+    class Meta:
+        ordering = ['name']
+
+
+class JobSkill(models.Model):
+    """Inverted index from a skill to the jobs that ask for it"""
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='job_links')
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='skill_links')
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['skill', 'job'], name='unique_job_skill'),
+        ]
+
+
+class JobSearchTerm(models.Model):
+    """
+    Full-text posting: a normalized term and its field-weighted frequency in
+    one job's title, description and skills.
+    """
+    term = models.CharField(max_length=50)
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='search_terms')
+    weight = models.FloatField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['term', 'job'], name='unique_job_search_term'),
+        ]
+
+
+class SavedJobSearch(models.Model):
+    """A student's job alert: new open jobs matching it are sent to them"""
+    FREQUENCY_CHOICES = (
+        ('instant', 'As jobs are posted'),
+        ('daily', 'Daily digest'),
+    )
+
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='saved_job_searches')
+    name = models.CharField(max_length=100, blank=True)
+    keywords = models.CharField(max_length=200, blank=True, help_text="Every word must appear in the job")
+    category = models.CharField(max_length=50, choices=Job.CATEGORY_CHOICES, blank=True)
+    budget_min = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    remote_only = models.BooleanField(default=False)
+    frequency = models.CharField(max_length=10, choices=FREQUENCY_CHOICES, default='instant')
+    is_active = models.BooleanField(default=True)
+    last_digest_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return self.name or self.describe()
+
+    def describe(self):
+        parts = [f'"{self.keywords}"' if self.keywords else '',
+                 self.get_category_display() if self.category else '',
+                 f'from ${self.budget_min}' if self.budget_min else '',
+                 'remote' if self.remote_only else '']
+        return ', '.join(part for part in parts if part) or 'All new jobs'
+
+    class Meta:
+        ordering = ['-created_at']
+
+
+class SavedSearchKey(models.Model):
+    """
+    Inverted index for the alert matcher. Each saved search is filed under
+    its single most selective key ('term:<word>', 'category:<slug>' or 'all'),
+    so a new job only loads searches filed under keys it actually has.
+    """
+    search = models.OneToOneField(SavedJobSearch, on_delete=models.CASCADE, related_name='index_key')
+    key = models.CharField(max_length=70, db_index=True)
+
+
+class SavedSearchMatch(models.Model):
+    """A job that matched a saved search; digest matches wait here until sent"""
+    search = models.ForeignKey(SavedJobSearch, on_delete=models.CASCADE, related_name='matches')
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='search_matches')
+    notified_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['search', 'job'], name='unique_saved_search_match'),
+        ]
+        indexes = [
+            models.Index(fields=['search', 'notified_at']),
+        ]
@@ -0,0 +1,126 @@
+# jobs/ranking.py
+from collections import defaultdict
+
+from django.db.models import Count, Q
+
+from .models import JobApplication, JobSkill
+from .search import parse_skills, tokenize
+
+CHUNK_SIZE = 500
+
+# Share of the 0-100 rank score each signal contributes
+WEIGHTS = {
+    'skills': 0.40,
+    'rate': 0.25,
+    'history': 0.25,
+    'points': 0.10,
+}
+
+STATUS_ORDER = ['pending', 'accepted', 'rejected', 'withdrawn']
+
+
+def skills_score(required, evidence):
+    """Share of required skills whose every word appears in the applicant's evidence"""
+    if not required:
+        return 0.5
+    matched = sum(1 for skill in required if set(tokenize(skill)) <= evidence)
+    return matched / len(required)
+
+
+def rate_score(job, proposed_rate):
+    """1 at or under budget, falling to 0 at 50% over it"""
+    if not proposed_rate:
+        return 1.0 if job.budget_type == 'fixed' else 0.5
+    ratio = float(proposed_rate) / float(job.budget)
+    return 1.0 if ratio <= 1 else max(0.0, 1 - (ratio - 1) * 2)
+
+
+def history_score(completed, accepted):
+    """Diminishing credit for past work: completed jobs count double"""
+    return 1 - 1 / (1 + completed + accepted / 2)
+
+
+def points_score(points):
+    return max(points, 0) / (max(points, 0) + 100)
+
+
+def _applicant_history(applicant_ids):
+    """{applicant id: (completed, accepted)} from one grouped query"""
+    rows = JobApplication.objects.filter(
+        applicant_id__in=applicant_ids, status='accepted'
+    ).values('applicant_id').annotate(
+        accepted=Count('id'),
+        completed=Count('id', filter=Q(job__status='completed')),
+    ).values_list('applicant_id', 'completed', 'accepted')
+    return {applicant_id: (completed, accepted) for applicant_id, completed, accepted in rows}
+
+
+def _applicant_skills(applicant_ids):
+    """{applicant id: words from the skills of jobs they were hired for}"""
+    words = defaultdict(set)
+    for applicant_id, name in JobSkill.objects.filter(
+        job__applications__applicant_id__in=applicant_ids, job__applications__status='accepted'
+    ).values_list('job__applications__applicant_id', 'skill__name'):
+        words[applicant_id].update(tokenize(name))
+    return words
+
+
+def score_applications(applications):
+    """Score a batch of applications in memory; returns them with rank_score and score_breakdown set"""
+    applicant_ids = {application.applicant_id for application in applications}
+    history = _applicant_history(applicant_ids)
+    past_skills = _applicant_skills(applicant_ids)
+    required = {}
+
+    for application in applications:
+        job, applicant = application.job, application.applicant
+        if job.pk not in required:
+            required[job.pk] = parse_skills(job.skills_required)
+        evidence = set(tokenize(' '.join([
+            application.cover_letter, application.applicant_message, applicant.bio, applicant.course,
+        ]))) | past_skills.get(applicant.pk, set())
+
+        components = {
+            'skills': skills_score(required[job.pk], evidence),
+            'rate': rate_score(job, application.proposed_rate),
+            'history': history_score(*history.get(applicant.pk, (0, 0))),
+            'points': points_score(applicant.points),
+        }
+        application.score_breakdown = {name: round(value * 100) for name, value in components.items()}
+        application.rank_score = round(sum(WEIGHTS[name] * value for name, value in components.items()) * 100, 2)
+    return applications
+
+
+def rank_applications(application_ids=None, chunk_size=CHUNK_SIZE):
+    """Recompute and store scores (all applications when no ids are given); returns the count"""
+    applications = JobApplication.objects.select_related('job', 'applicant').only(
+        'cover_letter', 'applicant_message', 'proposed_rate', 'applicant_id', 'job_id',
+        'job__budget', 'job__budget_type', 'job__skills_required',
+        'applicant__bio', 'applicant__course', 'applicant__points',
+    ).order_by('pk')
+    if application_ids is not None:
+        applications = applications.filter(pk__in=application_ids)
+
+    count = 0
+    chunk = []
+    for application in applications.iterator(chunk_size=chunk_size):
+        chunk.append(application)
+        if len(chunk) >= chunk_size:
+            count += _save_scores(chunk)
+            chunk = []
+    if chunk:
+        count += _save_scores(chunk)
+    return count
+
+
+def _save_scores(chunk):
+    JobApplication.objects.bulk_update(score_applications(chunk), ['rank_score', 'score_breakdown'])
+    return len(chunk)
+
+
+def status_counts(job):
+    """{'total': n, <status>: n, ...} for a job's applications from one grouped query"""
+    counts = dict.fromkeys(STATUS_ORDER, 0)
+    counts.update(job.applications.order_by().values_list('status').annotate(n=Count('id')))
+    counts['total'] = sum(counts.values())
+    return counts
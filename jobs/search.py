@@ -0,0 +1,191 @@
+# jobs/search.py
+import math
+import re
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import Count, Q
+
+from core.places import places_near, resolve_place
+from .models import Job, JobSearchTerm, JobSkill, Skill
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+SKILL_SPLIT_RE = re.compile(r"[,;\n|/]+")
+
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'is', 'it', 'of',
+    'on', 'or', 'the', 'this', 'to', 'we', 'with', 'you', 'your', 'will', 'our',
+}
+
+FIELD_WEIGHTS = {'title': 3.0, 'skills': 2.0, 'description': 1.0}
+
+SKILL_ALIASES = {
+    'js': 'javascript',
+    'ms word': 'word',
+    'microsoft word': 'word',
+    'ms excel': 'excel',
+    'microsoft excel': 'excel',
+    'ms office': 'office',
+    'microsoft office': 'office',
+    'ps': 'photoshop',
+    'adobe photoshop': 'photoshop',
+    'py': 'python',
+}
+
+
+def normalize_term(token):
+    """Lowercase token with simple plural folding (skills -> skill, studies -> study)"""
+    if len(token) > 4 and token.endswith('ies'):
+        return token[:-3] + 'y'
+    if len(token) > 3 and token.endswith('s') and not token.endswith(('ss', 'us', 'is')):
+        return token[:-1]
+    return token
+
+
+def tokenize(text):
+    return [normalize_term(token)[:50] for token in TOKEN_RE.findall((text or '').lower())
+            if token not in STOPWORDS]
+
+
+def parse_skills(text):
+    """Normalized, de-duplicated skill names from free text like 'MS Word, Typing; js'"""
+    skills = []
+    for part in SKILL_SPLIT_RE.split((text or '').lower()):
+        name = ' '.join(part.split()).strip(' .-')
+        name = SKILL_ALIASES.get(name, name)[:60]
+        if name and name not in skills:
+            skills.append(name)
+    return skills
+
+
+def job_terms(job, skills):
+    weights = Counter()
+    for token in tokenize(job.title):
+        weights[token] += FIELD_WEIGHTS['title']
+    for token in tokenize(job.description):
+        weights[token] += FIELD_WEIGHTS['description']
+    for skill in skills:
+        for token in tokenize(skill):
+            weights[token] += FIELD_WEIGHTS['skills']
+    return weights
+
+
+def skill_ids(names):
+    """Skill ids for these normalized names, creating the missing ones"""
+    existing = dict(Skill.objects.filter(name__in=names).values_list('name', 'id'))
+    missing = [name for name in names if name not in existing]
+    if missing:
+        Skill.objects.bulk_create([Skill(name=name) for name in missing], ignore_conflicts=True)
+        existing.update(Skill.objects.filter(name__in=missing).values_list('name', 'id'))
+    return [existing[name] for name in names]
+
+
+@transaction.atomic
+def index_job(job):
+    """Replace a job's postings and skill links"""
+    skills = parse_skills(job.skills_required)
+    JobSearchTerm.objects.filter(job=job).delete()
+    JobSearchTerm.objects.bulk_create([
+        JobSearchTerm(term=term, job=job, weight=weight) for term, weight in job_terms(job, skills).items()
+    ])
+    JobSkill.objects.filter(job=job).delete()
+    JobSkill.objects.bulk_create([JobSkill(skill_id=pk, job=job) for pk in skill_ids(skills)])
+
+
+def rebuild_index():
+    count = 0
+    for job in Job.objects.only('id', 'title', 'description', 'skills_required').iterator(chunk_size=500):
+        index_job(job)
+        count += 1
+    Skill.objects.filter(job_links__isnull=True).delete()
+    return count
+
+
+class JobSearch:
+    """
+    Filters open jobs and, when there is a text query, ranks them by the sum
+    over matched terms of log(1 + field weight) * idf, scaled by the share of
+    query terms the job matched. `prefix` lets the last query term match as
+    a prefix (for search-as-you-type).
+    """
+
+    def __init__(self, query='', skills='', category='', location='', budget_min=None,
+                 budget_max=None, remote=False, deadline_after=None, sort='', prefix=False):
+        self.terms = list(dict.fromkeys(tokenize(query)))
+        self.skills = parse_skills(skills) if isinstance(skills, str) else list(skills)
+        self.category = category
+        self.location = location
+        self.budget_min = budget_min
+        self.budget_max = budget_max
+        self.remote = remote
+        self.deadline_after = deadline_after
+        self.sort = sort
+        self.prefix = prefix
+
+    @property
+    def is_ranked(self):
+        return bool(self.terms) and self.sort in ('', 'relevance')
+
+    def queryset(self):
+        """Open jobs matching every filter (not ranked)"""
+        jobs = Job.objects.filter(status='open')
+        if self.category:
+            jobs = jobs.filter(category=self.category)
+        if self.location:
+            # Known places match anything nearby; other text falls back to a substring match
+            place_id = resolve_place(self.location)
+            if place_id is not None:
+                jobs = jobs.filter(place__in=places_near(place_id))
+            else:
+                jobs = jobs.filter(location__icontains=self.location)
+        if self.budget_min is not None:
+            jobs = jobs.filter(budget__gte=self.budget_min)
+        if self.budget_max is not None:
+            jobs = jobs.filter(budget__lte=self.budget_max)
+        if self.remote:
+            jobs = jobs.filter(is_remote=True)
+        if self.deadline_after:
+            jobs = jobs.filter(application_deadline__gte=self.deadline_after)
+        for skill in self.skills:
+            jobs = jobs.filter(pk__in=JobSkill.objects.filter(skill__name=skill).values('job_id'))
+        if self.terms and not self.is_ranked:
+            jobs = jobs.filter(pk__in=self._postings().values('job_id'))
+        return jobs.order_by(self.sort if self.sort not in ('', 'relevance') else '-created_at')
+
+    def _postings(self):
+        if not self.terms:
+            # A query of only stopwords or punctuation matches nothing
+            return JobSearchTerm.objects.none()
+        if self.prefix:
+            *whole, last = self.terms
+            return JobSearchTerm.objects.filter(Q(term__in=whole) | Q(term__startswith=last))
+        return JobSearchTerm.objects.filter(term__in=self.terms)
+
+    def ranked_ids(self):
+        """[(job id, score)] best first"""
+        postings = list(self._postings().filter(
+            job__in=self.queryset().order_by().values('id')
+        ).values_list('job_id', 'term', 'weight'))
+        if not postings:
+            return []
+
+        total = Job.objects.count() or 1
+        document_frequency = dict(
+            JobSearchTerm.objects.filter(term__in={term for _, term, _ in postings})
+            .values_list('term').annotate(n=Count('id')).values_list('term', 'n')
+        )
+
+        scores = defaultdict(float)
+        matched = defaultdict(set)
+        for job_id, term, weight in postings:
+            idf = math.log(1 + total / document_frequency.get(term, 1))
+            scores[job_id] += math.log1p(weight) * idf
+            query_term = term if term in self.terms else self.terms[-1]
+            matched[job_id].add(query_term)
+
+        ranked = [
+            (job_id, score * len(matched[job_id]) / len(self.terms))
+            for job_id, score in scores.items()
+        ]
+        ranked.sort(key=lambda item: (-item[1], -item[0]))
+        return ranked
@@ -0,0 +1,59 @@
+# jobs/signals.py
+from django.db.models.signals import post_init, post_save, post_delete
+from django.dispatch import receiver
+
+from core.tasks import run_in_background
+from .alerts import deliver_job_alerts, index_search
+from .counts import invalidate_category_counts
+from .ranking import rank_applications
+from .search import index_job
+from .models import Job, JobApplication, SavedJobSearch
+
+# Fields that feed the full-text and skill index
+INDEXED_FIELDS = ('title', 'description', 'skills_required')
+
+
+@receiver(post_init, sender=Job)
+def remember_counted_fields(sender, instance, **kwargs):
+    instance._counted_state = (instance.__dict__.get('status'), instance.__dict__.get('category'))
+    instance._indexed_state = tuple(instance.__dict__.get(f) for f in INDEXED_FIELDS)
+
+
+@receiver(post_save, sender=Job)
+def refresh_category_counts(sender, instance, created, **kwargs):
+    """Only status and category affect the open-job counts"""
+    state = (instance.status, instance.category)
+    if created or state != instance._counted_state:
+        invalidate_category_counts()
+    instance._counted_state = state
+
+
+@receiver(post_save, sender=Job)
+def refresh_search_index(sender, instance, created, **kwargs):
+    state = tuple(getattr(instance, f) for f in INDEXED_FIELDS)
+    if created or state != instance._indexed_state:
+        index_job(instance)
+    instance._indexed_state = state
+
+
+@receiver(post_save, sender=Job)
+def queue_job_alerts(sender, instance, created, **kwargs):
+    # Runs after commit, once the job's search terms are indexed
+    if created and instance.status == 'open':
+        run_in_background(deliver_job_alerts, instance.pk)
+
+
+@receiver(post_save, sender=SavedJobSearch)
+def file_saved_search(sender, instance, **kwargs):
+    index_search(instance)
+
+
+@receiver(post_save, sender=JobApplication)
+def queue_application_ranking(sender, instance, created, **kwargs):
+    if created:
+        run_in_background(rank_applications, [instance.pk])
+
+
+@receiver(post_delete, sender=Job)
+def refresh_category_counts_on_delete(sender, instance, **kwargs):
+    invalidate_category_counts()
@@ -1,36 +1,15 @@
 from django import template
+from jobs.models import Job
 
 register = template.Library()
 
 @register.filter
 def get_category_color(category):
-    colors = {
-        'typing': 'primary',
-        'design': 'success',
-        'errands': 'warning',
-        'academic': 'info',
-        'photography': 'danger',
-        'tutoring': 'purple',
-        'tech': 'dark',
-        'writing': 'secondary',
-        'other': 'secondary'
-    }
-    return colors.get(category, 'secondary')
+    return Job.CATEGORY_COLORS.get(category, 'secondary')
 
 @register.filter
 def get_category_icon(category):
-    icons = {
-        'typing': 'keyboard',
-        'design': 'paint-brush',
-        'errands': 'running',
-        'academic': 'graduation-cap',
-        'photography': 'camera',
-        'tutoring': 'chalkboard-teacher',
-        'tech': 'laptop-code',
-        'writing': 'pen-fancy',
-        'other': 'ellipsis-h'
-    }
-    return icons.get(category, 'briefcase')
+    return Job.CATEGORY_ICONS.get(category, 'briefcase')
 
 @register.filter
 def split(value, delimiter):
@@ -1,3 +1,159 @@
-from django.test import TestCase
+from datetime import date, timedelta
+from decimal import Decimal
 
-# Create your tests here.
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from accounts.models import CustomUser
+from messaging.models import Notification
+from .alerts import deliver_job_alerts, match_job, send_daily_digests
+from .expiry import expire_jobs
+from .models import Job, JobSearchTerm, SavedJobSearch, SavedSearchMatch
+from .search import JobSearch, parse_skills, tokenize
+
+
+class TokenizerTests(SimpleTestCase):
+    def test_tokenize(self):
+        self.assertEqual(tokenize('The Photographers, for Studies in C++ and ASP.NET!'),
+                         ['photographer', 'study', 'c++', 'asp.net'])
+        self.assertEqual(tokenize('Class status analysis'), ['class', 'status', 'analysis'])
+        self.assertEqual(tokenize('the and of'), [])
+        self.assertEqual(tokenize(None), [])
+
+    def test_parse_skills(self):
+        self.assertEqual(parse_skills('MS Word, Typing; js | Microsoft Word\nAdobe  Photoshop.'),
+                         ['word', 'typing', 'javascript', 'photoshop'])
+        self.assertEqual(parse_skills(''), [])
+
+
+class JobsTestCase(TestCase):
+    def setUp(self):
+        self.owner = CustomUser.objects.create(username='owner', email='owner@example.com')
+
+    def make_job(self, title, description='Help needed', **fields):
+        fields.setdefault('category', 'design')
+        fields.setdefault('budget', Decimal('50.00'))
+        return Job.objects.create(
+            user=self.owner, title=title, description=description, location='Library',
+            budget_type='fixed', **fields
+        )
+
+
+class JobSearchTests(JobsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.poster = self.make_job('Poster designer', 'Design a poster for the photography club',
+                                    skills_required='Photoshop, Illustrator')
+        self.photographer = self.make_job('Event photographer', 'Photos of the poster launch',
+                                          category='photography', skills_required='Photography')
+        self.typist = self.make_job('Typist', 'Type up lecture notes', category='typing',
+                                    skills_required='MS Word, typing')
+
+    def ids(self, **criteria):
+        return [job_id for job_id, _ in JobSearch(**criteria).ranked_ids()]
+
+    def test_index_weights_title_over_description(self):
+        weights = dict(JobSearchTerm.objects.filter(job=self.poster).values_list('term', 'weight'))
+        self.assertEqual(weights['poster'], 4.0)
+        self.assertEqual(weights['photoshop'], 2.0)
+        self.assertNotIn('the', weights)
+
+    def test_ranking(self):
+        self.assertEqual(self.ids(query='poster'), [self.poster.pk, self.photographer.pk])
+        self.assertEqual(self.ids(query='posters photography'), [self.poster.pk, self.photographer.pk])
+        self.assertEqual(self.ids(query='poster', category='photography'), [self.photographer.pk])
+
+    def test_stopword_query_matches_nothing(self):
+        search = JobSearch(query='the and of')
+        self.assertEqual(search.terms, [])
+        self.assertEqual(search.ranked_ids(), [])
+
+    def test_prefix_and_skills(self):
+        self.assertEqual(self.ids(query='lecture typ', prefix=True), [self.typist.pk])
+        self.assertEqual(list(JobSearch(skills='ms word').queryset()), [self.typist])
+
+    def test_reindex_on_edit(self):
+        self.typist.title = 'Transcriber'
+        self.typist.save()
+        self.assertEqual(self.ids(query='transcriber'), [self.typist.pk])
+        self.assertEqual(self.ids(query='typist'), [])
+
+
+class SavedSearchAlertTests(JobsTestCase):
+    def setUp(self):
+        super().setUp()
+        self.student = CustomUser.objects.create(username='student', email='student@example.com')
+        self.other = CustomUser.objects.create(username='other', email='other@example.com')
+        self.make_job('Logo design', 'A logo for a startup')
+
+    def save_search(self, user=None, **fields):
+        return SavedJobSearch.objects.create(user=user or self.student, **fields)
+
+    def test_search_filed_under_rarest_key(self):
+        self.make_job('Logo animation', 'Animate the logo')
+        self.assertEqual(self.save_search(keywords='logo startups').index_key.key, 'term:startup')
+        self.assertEqual(self.save_search(keywords='origami').index_key.key, 'term:origami')
+        self.assertEqual(self.save_search(category='writing').index_key.key, 'category:writing')
+        self.assertEqual(self.save_search().index_key.key, 'all')
+
+    def test_match_job(self):
+        keywords = self.save_search(keywords='poster designs')
+        category = self.save_search(user=self.other, category='design', budget_min=Decimal('40'))
+        self.save_search(keywords='poster', remote_only=True)
+        self.save_search(keywords='poster', budget_min=Decimal('80'))
+        self.save_search(keywords='poster flyer')
+        self.save_search(user=self.owner)
+        self.save_search(keywords='poster', is_active=False)
+
+        job = self.make_job('Poster design', 'Design a poster')
+        self.assertEqual(set(match_job(job)), {keywords, category})
+
+    def test_instant_alert_and_daily_digest(self):
+        instant = self.save_search(keywords='poster')
+        self.save_search(keywords='design')
+        digest = self.save_search(user=self.other, keywords='poster', frequency='daily')
+        job = self.make_job('Poster design', 'Design a poster')
+
+        self.assertEqual(deliver_job_alerts(job.pk), 3)
+        # Two instant searches from one student still make one notification
+        alerts = Notification.objects.filter(notification_type='job_alert')
+        self.assertEqual(list(alerts.values_list('user__username', flat=True)), ['student'])
+        self.assertEqual(SavedSearchMatch.objects.filter(search=instant, notified_at__isnull=False).count(), 1)
+        self.assertFalse(SavedSearchMatch.objects.get(search=digest).notified_at)
+
+        self.assertEqual(send_daily_digests(), 1)
+        self.assertEqual(alerts.get(user=self.other).title, '1 new job match your saved searches')
+        self.assertEqual(send_daily_digests(), 0)
+
+
+class ExpiryTests(JobsTestCase):
+    TODAY = date(2024, 5, 10)
+
+    def test_expired_jobs_leave_the_board(self):
+        late = [self.make_job(f'Poster {n}', application_deadline=self.TODAY - timedelta(days=n)) for n in (1, 2, 3)]
+        due_today = self.make_job('Poster today', application_deadline=self.TODAY)
+        undated = self.make_job('Poster anytime')
+        closed = self.make_job('Poster done', application_deadline=self.TODAY - timedelta(days=1),
+                               status='completed')
+
+        self.assertEqual(expire_jobs(self.TODAY, dry_run=True), 3)
+        self.assertEqual(expire_jobs(self.TODAY, chunk_size=2), 3)
+        self.assertEqual(expire_jobs(self.TODAY), 0)
+
+        self.assertEqual(set(Job.objects.filter(status='expired')), set(late))
+        self.assertEqual(Job.objects.get(pk=closed.pk).status, 'completed')
+        self.assertEqual(set(JobSearch(query='poster').queryset()), {due_today, undated})
+        self.assertEqual(Notification.objects.filter(user=self.owner, notification_type='job_expired').count(), 3)
+
+    def test_expired_job_is_not_alerted(self):
+        student = CustomUser.objects.create(username='student', email='student@example.com')
+        SavedJobSearch.objects.create(user=student, keywords='poster', frequency='daily')
+        job = self.make_job('Poster design', application_deadline=timezone.localdate() - timedelta(days=1))
+        self.assertEqual(deliver_job_alerts(job.pk), 1)
+
+        expire_jobs()
+        self.assertEqual(deliver_job_alerts(job.pk), 0)
+        # The pending digest match is dropped rather than sent late
+        self.assertEqual(send_daily_digests(), 0)
+        self.assertFalse(SavedSearchMatch.objects.filter(notified_at__isnull=True).exists())
+        self.assertFalse(Notification.objects.filter(user=student).exists())
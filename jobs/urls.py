@@ -12,7 +12,10 @@ urlpatterns = [
     path('<int:job_id>/update/', views.update_job, name='update'),
     path('<int:job_id>/delete/', views.delete_job, name='delete'),
     path('<int:job_id>/applications/', views.job_applications, name='applications'),
+    path('<int:job_id>/applications/export/', views.export_applications, name='export_applications'),
     path('my-jobs/', views.my_jobs, name='my_jobs'),
+    path('saved-searches/', views.saved_searches, name='saved_searches'),
+    path('saved-searches/<int:search_id>/delete/', views.delete_saved_search, name='delete_saved_search'),
     path('applications/<int:app_id>/update/', views.update_application_status, name='update_application'),
     path('applications/<int:app_id>/withdraw/', views.withdraw_application, name='withdraw_application'),
 ]
\ No newline at end of file
@@ -1,70 +1,76 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.db.models import Q
-from .models import Job, JobApplication
-from .forms import JobForm, ApplicationForm
+from django.db.models import Count
+from django.core.paginator import Paginator
+from core.exports import export_response
+from .models import Job, JobApplication, SavedJobSearch
+from .forms import JobForm, ApplicationForm, JobFilterForm, SavedJobSearchForm
+from .counts import get_open_category_counts
+from .search import JobSearch
+from .ranking import STATUS_ORDER, status_counts
 
 
 def job_list(request):
     """List all jobs"""
-    jobs = Job.objects.filter(status='open').order_by('-created_at')
-
-    # Filtering
-    category = request.GET.get('category', '')
-    if category:
-        jobs = jobs.filter(category=category)
-
-    # Prepare categories with counts and icons
-    categories = []
-    for cat_value, cat_name in Job.CATEGORY_CHOICES:
-        count = Job.objects.filter(category=cat_value, status='open').count()
-
-        # Simple color mapping (you can move this to template filters later)
-        color_map = {
-            'typing': 'primary',
-            'design': 'success',
-            'errands': 'warning',
-            'academic': 'info',
-            'photography': 'danger',
-            'tutoring': 'purple',
-            'tech': 'dark',
-            'writing': 'secondary',
-            'other': 'secondary'
-        }
-        icon_map = {
-            'typing': 'keyboard',
-            'design': 'paint-brush',
-            'errands': 'running',
-            'academic': 'graduation-cap',
-            'photography': 'camera',
-            'tutoring': 'chalkboard-teacher',
-            'tech': 'laptop-code',
-            'writing': 'pen-fancy',
-            'other': 'ellipsis-h'
-        }
-
-        categories.append({
+    form = JobFilterForm(request.GET)
+    form.is_valid()  # invalid fields are simply left out of cleaned_data
+    filters = form.cleaned_data
+
+    category = filters.get('category', '')
+    search = JobSearch(
+        query=filters.get('search', ''),
+        skills=filters.get('skills', ''),
+        category=category,
+        location=filters.get('location', ''),
+        budget_min=filters.get('budget_min'),
+        budget_max=filters.get('budget_max'),
+        remote=filters.get('remote', False),
+        deadline_after=filters.get('deadline_after'),
+        sort=filters.get('sort_by', ''),
+    )
+
+    # Prepare categories with counts and icons (counts are cached)
+    counts = get_open_category_counts()
+    categories = [
+        {
             'value': cat_value,
             'name': cat_name,
-            'count': count,
-            'icon': icon_map.get(cat_value, 'briefcase'),
-            'color': color_map.get(cat_value, 'secondary')
-        })
+            'count': counts.get(cat_value, 0),
+            'icon': get_category_icon(cat_value),
+            'color': get_category_color(cat_value),
+        }
+        for cat_value, cat_name in Job.CATEGORY_CHOICES
+    ]
+
+    if search.is_ranked:
+        # Rank ids first, then load only the jobs on this page
+        page_obj = Paginator(search.ranked_ids(), 12).get_page(request.GET.get('page'))
+        jobs = Job.objects.select_related('user').in_bulk([job_id for job_id, _ in page_obj.object_list])
+        page_obj.object_list = [jobs[job_id] for job_id, _ in page_obj.object_list if job_id in jobs]
+    else:
+        paginator = Paginator(search.queryset().select_related('user'), 12)
+        if not any(value for key, value in filters.items() if key not in ('category', 'sort_by')):
+            # Only a category filter: the total comes from the cached counts
+            paginator.count = counts.get(category, 0) if category else sum(counts.values())
+        page_obj = paginator.get_page(request.GET.get('page'))
 
     return render(request, 'jobs/list.html', {
-        'jobs': jobs,
+        'jobs': page_obj,
         'categories': categories,
-        'selected_category': category
+        'selected_category': category,
+        'filter_form': form,
     })
+
+
 def job_detail(request, job_id):
     """View job details"""
     job = get_object_or_404(Job, id=job_id)
 
-    # Get applications if user is owner
-    applications = None
+    # Application counts if user is owner
+    application_counts = None
     if request.user.is_authenticated and job.user == request.user:
-        applications = job.applications.all().order_by('-applied_at')
+        application_counts = status_counts(job)
 
     # Check if user has applied
     has_applied = False
@@ -82,7 +88,7 @@ def job_detail(request, job_id):
 
     return render(request, 'jobs/detail.html', {
         'job': job,
-        'applications': applications,
+        'application_counts': application_counts,
         'related_jobs': related_jobs,
         'is_owner': job.user == request.user,
         'has_applied': has_applied,
@@ -182,14 +188,49 @@ def apply_job(request, job_id):
 def job_applications(request, job_id):
     """View applications for a job (owner only)"""
     job = get_object_or_404(Job, id=job_id, user=request.user)
-    applications = job.applications.all().order_by('-applied_at')
+    counts = status_counts(job)
+
+    applications = job.applications.select_related('applicant').order_by('-rank_score', 'applied_at')
+    status = request.GET.get('status', '')
+    if status not in STATUS_ORDER:
+        status = ''
+    if status:
+        applications = applications.filter(status=status)
+
+    # Best-ranked first; the total comes from the grouped counts
+    paginator = Paginator(applications, 20)
+    paginator.count = counts[status or 'total']
+    page_obj = paginator.get_page(request.GET.get('page'))
 
     return render(request, 'jobs/applications.html', {
         'job': job,
-        'applications': applications,
+        'applications': page_obj,
+        'counts': counts,
+        'selected_status': status,
     })
 
 
+@login_required
+def export_applications(request, job_id):
+    """Stream a job's applications as CSV or JSON lines (owner or staff)"""
+    jobs = Job.objects.all() if request.user.is_staff else Job.objects.filter(user=request.user)
+    job = get_object_or_404(jobs, id=job_id)
+    applications = job.applications.select_related('applicant')
+    columns = [
+        ('id', lambda a: a.id),
+        ('applicant', lambda a: a.applicant.username),
+        ('name', lambda a: a.applicant.get_full_name()),
+        ('email', lambda a: a.applicant.email),
+        ('status', lambda a: a.status),
+        ('proposed_rate', lambda a: a.proposed_rate),
+        ('rank_score', lambda a: a.rank_score),
+        ('cover_letter', lambda a: a.cover_letter),
+        ('applied_at', lambda a: a.applied_at),
+        ('updated_at', lambda a: a.updated_at),
+    ]
+    return export_response(request, applications, columns, f'job-{job.id}-applications')
+
+
 @login_required
 def my_jobs(request):
     """View user's jobs"""
@@ -250,34 +291,45 @@ def withdraw_application(request, app_id):
     return render(request, 'jobs/withdraw.html', {'application': application})
 
 
+@login_required
+def saved_searches(request):
+    """List the user's job alerts; POST saves a new one (also used by the job board's filters)"""
+    if request.method == 'POST':
+        form = SavedJobSearchForm(request.POST)
+        if form.is_valid():
+            saved = form.save(commit=False)
+            saved.user = request.user
+            saved.save()
+            messages.success(request, f'✅ Job alert saved: {saved}')
+            return redirect('jobs:saved_searches')
+    else:
+        form = SavedJobSearchForm()
+
+    searches = request.user.saved_job_searches.annotate(
+        match_count=Count('matches')
+    )
+    return render(request, 'jobs/saved_searches.html', {
+        'form': form,
+        'searches': searches,
+    })
+
+
+@login_required
+def delete_saved_search(request, search_id):
+    """Delete a job alert"""
+    saved = get_object_or_404(SavedJobSearch, id=search_id, user=request.user)
+    if request.method == 'POST':
+        saved.delete()
+        messages.success(request, '✅ Job alert deleted.')
+    return redirect('jobs:saved_searches')
+
+
 # Helper functions
 def get_category_icon(category):
     """Get FontAwesome icon for category"""
-    icons = {
-        'typing': 'keyboard',
-        'design': 'paint-brush',
-        'errands': 'running',
-        'academic': 'graduation-cap',
-        'photography': 'camera',
-        'tutoring': 'chalkboard-teacher',
-        'tech': 'laptop-code',
-        'writing': 'pen-fancy',
-        'other': 'ellipsis-h'
-    }
-    return icons.get(category, 'briefcase')
+    return Job.CATEGORY_ICONS.get(category, 'briefcase')
 
 
 def get_category_color(category):
     """Get Bootstrap color class for category"""
-    colors = {
-        'typing': 'primary',
-        'design': 'success',
-        'errands': 'warning',
-        'academic': 'info',
-        'photography': 'danger',
-        'tutoring': 'purple',
-        'tech': 'dark',
-        'writing': 'secondary',
-        'other': 'secondary'
-    }
-    return colors.get(category, 'secondary')
\ No newline at end of file
+    return Job.CATEGORY_COLORS.get(category, 'secondary')
@@ -1,6 +1,9 @@
-# jobs/apps.py
+# lost_found/apps.py
 from django.apps import AppConfig
 
 class LostFoundConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'lost_found'
\ No newline at end of file
+    name = 'lost_found'
+
+    def ready(self):
+        from . import signals  # noqa: F401
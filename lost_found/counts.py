@@ -0,0 +1,33 @@
+# lost_found/counts.py
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from .models import LostItem
+
+BOARD_COUNTS_KEY = 'lost_found:board_counts'
+# The cache is per process and saves only clear the local copy, so other
+# workers pick up changes when this runs out
+BOARD_COUNTS_TIMEOUT = 60
+
+
+def status_counts(items):
+    """{'total', 'lost', 'found', 'resolved'} for a LostItem queryset from one conditional aggregate"""
+    return items.order_by().aggregate(
+        total=Count('id'),
+        lost=Count('id', filter=Q(status='lost')),
+        found=Count('id', filter=Q(status='found')),
+        resolved=Count('id', filter=Q(is_resolved=True)),
+    )
+
+
+def get_board_counts():
+    """Counts for the unfiltered board, cached for a minute or until an item's status changes here"""
+    counts = cache.get(BOARD_COUNTS_KEY)
+    if counts is None:
+        counts = status_counts(LostItem.objects.all())
+        cache.set(BOARD_COUNTS_KEY, counts, BOARD_COUNTS_TIMEOUT)
+    return counts
+
+
+def invalidate_board_counts():
+    cache.delete(BOARD_COUNTS_KEY)
@@ -0,0 +1,137 @@
+# lost_found/images.py
+from itertools import combinations
+
+from django.db.models import Q
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from .models import FoundItem, ItemImageHash, LostItem
+
+BANDS = 4
+BAND_BITS = 16
+HASH_BITS = BANDS * BAND_BITS
+# Photos of the same object rarely differ by more than this many bits
+MAX_DISTANCE = 11
+
+
+def dhash(image):
+    """64-bit difference hash: is each pixel brighter than its right neighbour in a 9x8 thumbnail"""
+    image = ImageOps.exif_transpose(image).convert('L').resize((9, 8), Image.LANCZOS)
+    pixels = list(image.getdata())
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            value = (value << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+    return value
+
+
+def to_signed(value):
+    """Fit an unsigned 64-bit hash into a BigIntegerField"""
+    return value - (1 << HASH_BITS) if value >= 1 << (HASH_BITS - 1) else value
+
+
+def bands(value):
+    value &= (1 << HASH_BITS) - 1
+    return [(value >> (BAND_BITS * i)) & ((1 << BAND_BITS) - 1) for i in range(BANDS)]
+
+
+def hamming(a, b):
+    return bin((a ^ b) & ((1 << HASH_BITS) - 1)).count('1')
+
+
+def band_neighbours(band, radius):
+    """Every 16-bit value within `radius` bits of `band`"""
+    values = [band]
+    for flips in range(1, radius + 1):
+        for positions in combinations(range(BAND_BITS), flips):
+            flipped = band
+            for position in positions:
+                flipped ^= 1 << position
+            values.append(flipped)
+    return values
+
+
+def hash_item_image(item):
+    """Store (or refresh) the hash for a LostItem/FoundItem photo; None if it has no readable image"""
+    field = 'lost_item' if isinstance(item, LostItem) else 'found_item'
+    if not item.image:
+        ItemImageHash.objects.filter(**{field: item}).delete()
+        return None
+    existing = ItemImageHash.objects.filter(**{field: item}).first()
+    if existing and existing.image_name == item.image.name:
+        return existing
+
+    try:
+        with item.image.open('rb') as f, Image.open(f) as image:
+            value = dhash(image)
+    except (OSError, UnidentifiedImageError):
+        return None
+
+    band_values = bands(value)
+    record, _ = ItemImageHash.objects.update_or_create(**{field: item}, defaults={
+        'image_name': item.image.name,
+        'hash': to_signed(value),
+        **{f'band{i}': band for i, band in enumerate(band_values)},
+    })
+    return record
+
+
+def similar_hashes(value, queryset=None, max_distance=MAX_DISTANCE):
+    """
+    [(ItemImageHash, distance)] within max_distance of `value`, nearest first.
+    By pigeonhole, a match agrees with `value` within max_distance // 4 bits
+    on some band, so the candidates come from indexed IN lookups per band.
+    """
+    queryset = queryset if queryset is not None else ItemImageHash.objects.all()
+    radius = max_distance // BANDS
+    lookup = Q()
+    for i, band in enumerate(bands(value)):
+        lookup |= Q(**{f'band{i}__in': band_neighbours(band, radius)})
+
+    results = []
+    for record in queryset.filter(lookup):
+        distance = hamming(value, record.hash)
+        if distance <= max_distance:
+            results.append((record, distance))
+    results.sort(key=lambda pair: pair[1])
+    return results
+
+
+def similar_found_items(lost, max_distance=MAX_DISTANCE):
+    """{found item id: distance} for unclaimed found items whose photo looks like the lost item's"""
+    record = getattr(lost, 'image_hash', None)
+    if record is None:
+        return {}
+    return {
+        match.found_item_id: distance for match, distance in similar_hashes(
+            record.hash, ItemImageHash.objects.filter(found_item__is_claimed=False), max_distance
+        )
+    }
+
+
+def similar_lost_items(found, max_distance=MAX_DISTANCE):
+    record = getattr(found, 'image_hash', None)
+    if record is None:
+        return {}
+    return {
+        match.lost_item_id: distance for match, distance in similar_hashes(
+            record.hash, ItemImageHash.objects.filter(lost_item__status='lost', lost_item__is_resolved=False),
+            max_distance,
+        )
+    }
+
+
+def image_score(a, b):
+    """1 for identical photos, 0 at half the bits differing (unrelated); None if either is missing"""
+    hash_a, hash_b = getattr(a, 'image_hash', None), getattr(b, 'image_hash', None)
+    if hash_a is None or hash_b is None:
+        return None
+    return max(0.0, 1 - hamming(hash_a.hash, hash_b.hash) / (HASH_BITS / 2))
+
+
+def hash_all_images():
+    count = 0
+    for model in (LostItem, FoundItem):
+        for item in model.objects.exclude(image='').select_related('image_hash').iterator(chunk_size=500):
+            if hash_item_image(item):
+                count += 1
+    return count
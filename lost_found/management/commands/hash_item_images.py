@@ -0,0 +1,11 @@
+# lost_found/management/commands/hash_item_images.py
+from django.core.management.base import BaseCommand
+from lost_found.images import hash_all_images
+
+
+class Command(BaseCommand):
+    help = 'Computes perceptual hashes for lost/found photos uploaded before hashing existed'
+
+    def handle(self, *args, **options):
+        count = hash_all_images()
+        self.stdout.write(self.style.SUCCESS(f'Hashed {count} item images'))
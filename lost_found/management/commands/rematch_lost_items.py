@@ -0,0 +1,11 @@
+# lost_found/management/commands/rematch_lost_items.py
+from django.core.management.base import BaseCommand
+from lost_found.matching import rematch_all
+
+
+class Command(BaseCommand):
+    help = 'Rescores lost/found matches for every open lost report (new items are matched as they arrive)'
+
+    def handle(self, *args, **options):
+        count = rematch_all()
+        self.stdout.write(self.style.SUCCESS(f'Found {count} new matches'))
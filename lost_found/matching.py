@@ -0,0 +1,228 @@
+# lost_found/matching.py
+import math
+import re
+from collections import Counter
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Q
+
+from core.places import NEARBY_KM, distance_km
+from messaging.models import Notification
+from .images import hash_item_image, image_score, similar_found_items, similar_lost_items
+from .models import FoundItem, ItemMatch, LostItem
+
+# Found items are compared with lost reports from this far back (and vice versa)
+DATE_WINDOW_DAYS = 30
+# Found a little "before" it was lost still counts: people misremember dates
+DATE_SLACK_DAYS = 2
+TOP_MATCHES = 5
+MIN_SCORE = 0.3
+
+# Image similarity only counts when both reports have a photo; otherwise the
+# remaining weights are rescaled
+WEIGHTS = {'text': 0.5, 'date': 0.15, 'location': 0.15, 'image': 0.2}
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = {
+    'a', 'an', 'and', 'at', 'by', 'for', 'from', 'has', 'have', 'in', 'is', 'it', 'its', 'my', 'near',
+    'of', 'on', 'or', 'the', 'to', 'was', 'with', 'i', 'lost', 'found', 'left', 'inside', 'around',
+}
+LOCATION_ALIASES = {
+    'lib': 'library',
+    'caf': 'cafeteria',
+    'cafe': 'cafeteria',
+    'canteen': 'cafeteria',
+    'gym': 'gymnasium',
+    'bldg': 'building',
+    'blk': 'block',
+    'rm': 'room',
+    'lab': 'laboratory',
+    'labs': 'laboratory',
+    'hostel': 'residence',
+    'dorm': 'residence',
+    'dorms': 'residence',
+}
+
+
+def tokens(text):
+    return [token for token in TOKEN_RE.findall((text or '').lower()) if token not in STOPWORDS]
+
+
+def location_tokens(text):
+    """Normalized place words: aliases folded, filler dropped"""
+    return {LOCATION_ALIASES.get(token, token) for token in tokens(text)}
+
+
+def location_score(a, b):
+    a, b = location_tokens(a), location_tokens(b)
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def place_score(lost, found):
+    """
+    Distance between the resolved places: 1 for the same place, falling to 0
+    at twice the "nearby" radius. Word overlap stands in when either report
+    names somewhere the gazetteer doesn't know.
+    """
+    distance = None
+    if lost.place_lost_id and found.place_found_id:
+        distance = distance_km(lost.place_lost_id, found.place_found_id)
+    if distance is None:
+        return location_score(lost.location_lost, found.location_found)
+    return max(0.0, 1 - distance / (2 * NEARBY_KM))
+
+
+def date_score(date_lost, date_found):
+    gap = (date_found - date_lost).days
+    if gap < -DATE_SLACK_DAYS:
+        return 0.0
+    return max(0.0, 1 - max(gap, 0) / DATE_WINDOW_DAYS)
+
+
+def item_text(item):
+    # Title words count double: they name the object
+    return tokens(item.title) * 2 + tokens(item.description)
+
+
+def tfidf_vectors(documents):
+    """Unit-length TF-IDF vectors; IDF comes from the block, so words common to the category weigh less"""
+    frequency = Counter(term for document in documents for term in set(document))
+    total = len(documents)
+    vectors = []
+    for document in documents:
+        vector = {term: count * math.log(1 + total / frequency[term]) for term, count in Counter(document).items()}
+        norm = math.sqrt(sum(weight * weight for weight in vector.values())) or 1
+        vectors.append({term: weight / norm for term, weight in vector.items()})
+    return vectors
+
+
+def cosine(a, b):
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b.get(term, 0) for term, weight in a.items())
+
+
+def candidate_found_items(lost):
+    """
+    Blocking: unclaimed items found within the date window after the loss,
+    in the same category or with a near-identical photo (in case either
+    report picked the wrong category)
+    """
+    return FoundItem.objects.filter(
+        Q(category=lost.category) | Q(pk__in=list(similar_found_items(lost))),
+        is_claimed=False,
+        date_found__gte=lost.date_lost - timedelta(days=DATE_SLACK_DAYS),
+        date_found__lte=lost.date_lost + timedelta(days=DATE_WINDOW_DAYS),
+    ).exclude(user_id=lost.user_id).select_related('image_hash')
+
+
+def candidate_lost_items(found):
+    return LostItem.objects.filter(
+        Q(category=found.category) | Q(pk__in=list(similar_lost_items(found))),
+        status='lost', is_resolved=False,
+        date_lost__gte=found.date_found - timedelta(days=DATE_WINDOW_DAYS),
+        date_lost__lte=found.date_found + timedelta(days=DATE_SLACK_DAYS),
+    ).exclude(user_id=found.user_id).select_related('image_hash')
+
+
+def combined_score(components):
+    present = {name: value for name, value in components.items() if value is not None}
+    return sum(WEIGHTS[name] * value for name, value in present.items()) / sum(WEIGHTS[name] for name in present)
+
+
+def score_pairs(item, candidates, item_is_lost):
+    """[(lost, found, components)] for candidates scoring at least MIN_SCORE, best first"""
+    if not candidates:
+        return []
+    vectors = tfidf_vectors([item_text(item)] + [item_text(candidate) for candidate in candidates])
+    scored = []
+    for candidate, vector in zip(candidates, vectors[1:]):
+        lost, found = (item, candidate) if item_is_lost else (candidate, item)
+        components = {
+            'text': cosine(vectors[0], vector),
+            'date': date_score(lost.date_lost, found.date_found),
+            'location': place_score(lost, found),
+            'image': image_score(lost, found),
+        }
+        score = combined_score(components)
+        if score >= MIN_SCORE:
+            scored.append((score, lost, found, components))
+    scored.sort(key=lambda entry: -entry[0])
+    return [(lost, found, components) for _, lost, found, components in scored[:TOP_MATCHES]]
+
+
+@transaction.atomic
+def save_matches(pairs):
+    """Upsert scored pairs; new pairs notify both people in one bulk insert. Returns new pair count."""
+    if not pairs:
+        return 0
+    existing = set(ItemMatch.objects.filter(
+        lost_item__in={lost.pk for lost, _, _ in pairs},
+        found_item__in={found.pk for _, found, _ in pairs},
+    ).values_list('lost_item_id', 'found_item_id'))
+
+    ItemMatch.objects.bulk_create([
+        ItemMatch(
+            lost_item=lost, found_item=found,
+            score=combined_score(components),
+            text_score=components['text'], date_score=components['date'],
+            location_score=components['location'], image_score=components['image'],
+        )
+        for lost, found, components in pairs
+    ], update_conflicts=True, unique_fields=['lost_item', 'found_item'],
+        update_fields=['score', 'text_score', 'date_score', 'location_score', 'image_score', 'updated_at'])
+
+    notifications = []
+    new_pairs = [(lost, found) for lost, found, _ in pairs if (lost.pk, found.pk) not in existing]
+    for lost, found in new_pairs:
+        notifications.append(Notification(
+            user_id=lost.user_id,
+            notification_type='match',
+            title=f"Possible match for your {lost.title}"[:200],
+            message=f"Someone found \"{found.title}\" at {found.location_found} on {found.date_found:%b %d}.",
+            link=f'/lost-found/{lost.pk}/',
+        ))
+        notifications.append(Notification(
+            user_id=found.user_id,
+            notification_type='match',
+            title=f"Someone may have lost the {found.title} you found"[:200],
+            message=f"\"{lost.title}\" was reported lost at {lost.location_lost} on {lost.date_lost:%b %d}.",
+            link=f'/lost-found/{lost.pk}/',
+        ))
+    Notification.objects.bulk_create(notifications)
+    return len(new_pairs)
+
+
+def _with_image_hash(item):
+    """Hash the item's photo if that hasn't happened yet, caching it on the instance"""
+    record = hash_item_image(item)
+    if record is not None:
+        item.image_hash = record
+    return item
+
+
+def match_lost_item(lost_id):
+    lost = LostItem.objects.filter(pk=lost_id, status='lost', is_resolved=False).first()
+    if lost is None:
+        return 0
+    _with_image_hash(lost)
+    return save_matches(score_pairs(lost, list(candidate_found_items(lost)), item_is_lost=True))
+
+
+def match_found_item(found_id):
+    found = FoundItem.objects.filter(pk=found_id, is_claimed=False).first()
+    if found is None:
+        return 0
+    _with_image_hash(found)
+    return save_matches(score_pairs(found, list(candidate_lost_items(found)), item_is_lost=False))
+
+
+def rematch_all():
+    """Rescore every open lost report (for backfills); returns new pairs found"""
+    total = 0
+    for lost_id in LostItem.objects.filter(status='lost', is_resolved=False).values_list('id', flat=True).iterator():
+        total += match_lost_item(lost_id)
+    return total
@@ -0,0 +1,62 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:20
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lost_found', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ItemMatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('text_score', models.FloatField(default=0)),
+                ('date_score', models.FloatField(default=0)),
+                ('location_score', models.FloatField(default=0)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['-score'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='founditem',
+            index=models.Index(fields=['category', 'is_claimed', 'date_found'], name='lost_found__categor_601052_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lostitem',
+            index=models.Index(fields=['category', 'status', 'date_lost'], name='lost_found__categor_9ad84b_idx'),
+        ),
+        migrations.AddField(
+            model_name='itemmatch',
+            name='found_item',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='matches', to='lost_found.founditem'),
+        ),
+        migrations.AddField(
+            model_name='itemmatch',
+            name='lost_item',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='matches', to='lost_found.lostitem'),
+        ),
+        migrations.AddIndex(
+            model_name='itemmatch',
+            index=models.Index(fields=['lost_item', '-score'], name='lost_found__lost_it_09a406_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='itemmatch',
+            index=models.Index(fields=['found_item', '-score'], name='lost_found__found_i_41dbf6_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='itemmatch',
+            constraint=models.UniqueConstraint(fields=('lost_item', 'found_item'), name='unique_item_match'),
+        ),
+    ]
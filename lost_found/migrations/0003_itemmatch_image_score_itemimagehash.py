@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:20
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lost_found', '0002_itemmatch_founditem_lost_found__categor_601052_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='itemmatch',
+            name='image_score',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='ItemImageHash',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('image_name', models.CharField(max_length=255)),
+                ('hash', models.BigIntegerField()),
+                ('band0', models.PositiveIntegerField()),
+                ('band1', models.PositiveIntegerField()),
+                ('band2', models.PositiveIntegerField()),
+                ('band3', models.PositiveIntegerField()),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('found_item', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='image_hash', to='lost_found.founditem')),
+                ('lost_item', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='image_hash', to='lost_found.lostitem')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['band0'], name='lost_found__band0_7ed4d7_idx'), models.Index(fields=['band1'], name='lost_found__band1_b5f243_idx'), models.Index(fields=['band2'], name='lost_found__band2_5f0121_idx'), models.Index(fields=['band3'], name='lost_found__band3_40e69a_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lost_found', '0003_itemmatch_image_score_itemimagehash'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lostitem',
+            index=models.Index(fields=['-created_at'], name='lost_found__created_cb4238_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lostitem',
+            index=models.Index(fields=['category', '-created_at'], name='lost_found__categor_71d098_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_place_placealias'),
+        ('lost_found', '0004_lostitem_lost_found__created_cb4238_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='founditem',
+            name='place_found',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='core.place'),
+        ),
+        migrations.AddField(
+            model_name='lostitem',
+            name='place_found',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='core.place'),
+        ),
+        migrations.AddField(
+            model_name='lostitem',
+            name='place_lost',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='core.place'),
+        ),
+    ]
@@ -30,6 +30,10 @@ class LostItem(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='lost')
     location_lost = models.CharField(max_length=200)
     location_found = models.CharField(max_length=200, blank=True)
+    place_lost = models.ForeignKey('core.Place', on_delete=models.SET_NULL, null=True, blank=True,
+                                   editable=False, related_name='+')
+    place_found = models.ForeignKey('core.Place', on_delete=models.SET_NULL, null=True, blank=True,
+                                    editable=False, related_name='+')
     date_lost = models.DateField()
     date_found = models.DateField(blank=True, null=True)
     image = models.ImageField(upload_to='lost_found/', blank=True)
@@ -47,6 +51,9 @@ class LostItem(models.Model):
         indexes = [
             models.Index(fields=['status']),
             models.Index(fields=['category']),
+            models.Index(fields=['category', 'status', 'date_lost']),
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['category', '-created_at']),
         ]
 
 
@@ -58,6 +65,8 @@ class FoundItem(models.Model):
     description = models.TextField()
     category = models.CharField(max_length=50, choices=LostItem.CATEGORY_CHOICES)
     location_found = models.CharField(max_length=200)
+    place_found = models.ForeignKey('core.Place', on_delete=models.SET_NULL, null=True, blank=True,
+                                    editable=False, related_name='+')
     date_found = models.DateField()
     image = models.ImageField(upload_to='lost_found/', blank=True)
     contact_info = models.CharField(max_length=200)
@@ -69,4 +78,67 @@ class FoundItem(models.Model):
         return f"{self.title} - Found"
 
     class Meta:
-        ordering = ['-date_found']
\ No newline at end of file
+        ordering = ['-date_found']
+        indexes = [
+            models.Index(fields=['category', 'is_claimed', 'date_found']),
+        ]
+
+class ItemMatch(models.Model):
+    """A scored lost/found pair kept by lost_found.matching (top few per item)"""
+    lost_item = models.ForeignKey(LostItem, on_delete=models.CASCADE, related_name='matches')
+    found_item = models.ForeignKey(FoundItem, on_delete=models.CASCADE, related_name='matches')
+    score = models.FloatField()
+    text_score = models.FloatField(default=0)
+    date_score = models.FloatField(default=0)
+    location_score = models.FloatField(default=0)
+    image_score = models.FloatField(null=True, blank=True)  # None when either photo is missing
+    created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.lost_item.title} ~ {self.found_item.title} ({self.score:.2f})"
+
+    @property
+    def percentage(self):
+        return round(self.score * 100)
+
+    class Meta:
+        ordering = ['-score']
+        constraints = [
+            models.UniqueConstraint(fields=['lost_item', 'found_item'], name='unique_item_match'),
+        ]
+        indexes = [
+            models.Index(fields=['lost_item', '-score']),
+            models.Index(fields=['found_item', '-score']),
+        ]
+
+
+class ItemImageHash(models.Model):
+    """
+    64-bit dHash of a lost or found item's photo. The hash is also stored
+    as four 16-bit bands: two hashes within Hamming distance d agree within
+    d // 4 bits on at least one band, so indexed band lookups find every
+    near-duplicate without scanning all hashes.
+    """
+    lost_item = models.OneToOneField(LostItem, on_delete=models.CASCADE, null=True, blank=True,
+                                     related_name='image_hash')
+    found_item = models.OneToOneField(FoundItem, on_delete=models.CASCADE, null=True, blank=True,
+                                      related_name='image_hash')
+    image_name = models.CharField(max_length=255)
+    hash = models.BigIntegerField()
+    band0 = models.PositiveIntegerField()
+    band1 = models.PositiveIntegerField()
+    band2 = models.PositiveIntegerField()
+    band3 = models.PositiveIntegerField()
+    created_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"{self.image_name} {self.hash & 0xFFFFFFFFFFFFFFFF:016x}"
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['band0']),
+            models.Index(fields=['band1']),
+            models.Index(fields=['band2']),
+            models.Index(fields=['band3']),
+        ]
@@ -0,0 +1,49 @@
+# lost_found/signals.py
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from core.tasks import run_in_background
+from .counts import invalidate_board_counts
+from .matching import match_found_item, match_lost_item
+from .models import FoundItem, LostItem
+
+
+@receiver(post_init, sender=LostItem)
+@receiver(post_init, sender=FoundItem)
+def remember_image(sender, instance, **kwargs):
+    image = instance.__dict__.get('image')
+    instance._matched_image = getattr(image, 'name', image)
+
+
+# The matchers hash the photo first, so a new or replaced image is scored too
+@receiver(post_save, sender=LostItem)
+def queue_lost_item_matching(sender, instance, created, **kwargs):
+    if created or instance.image.name != instance._matched_image:
+        run_in_background(match_lost_item, instance.pk)
+    instance._matched_image = instance.image.name
+
+
+@receiver(post_save, sender=FoundItem)
+def queue_found_item_matching(sender, instance, created, **kwargs):
+    if created or instance.image.name != instance._matched_image:
+        run_in_background(match_found_item, instance.pk)
+    instance._matched_image = instance.image.name
+
+
+@receiver(post_init, sender=LostItem)
+def remember_counted_fields(sender, instance, **kwargs):
+    instance._counted_state = (instance.__dict__.get('status'), instance.__dict__.get('is_resolved'))
+
+
+@receiver(post_save, sender=LostItem)
+def refresh_board_counts(sender, instance, created, **kwargs):
+    """Only status and is_resolved affect the board counts"""
+    state = (instance.status, instance.is_resolved)
+    if created or state != instance._counted_state:
+        invalidate_board_counts()
+    instance._counted_state = state
+
+
+@receiver(post_delete, sender=LostItem)
+def refresh_board_counts_on_delete(sender, instance, **kwargs):
+    invalidate_board_counts()
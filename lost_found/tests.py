@@ -1,3 +1,162 @@
-from django.test import TestCase
+import math
+import shutil
+import tempfile
+from datetime import date, timedelta
+from io import BytesIO
 
-# Create your tests here.
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase, override_settings
+from PIL import Image, ImageEnhance
+
+from accounts.models import CustomUser
+from messaging.models import Notification
+from .images import MAX_DISTANCE, bands, dhash, hamming, similar_hashes, to_signed
+from .matching import date_score, location_score, match_found_item, match_lost_item
+from .models import FoundItem, ItemImageHash, ItemMatch, LostItem
+
+LOST_ON = date(2024, 4, 2)
+
+
+class ScoreTests(SimpleTestCase):
+    def test_location_score(self):
+        self.assertEqual(location_score('Lib, 2nd floor', 'Library 2nd floor'), 1.0)
+        self.assertEqual(location_score('near the caf', 'Cafeteria block B'), 1 / 3)
+        self.assertEqual(location_score('around', 'Library'), 0.0)
+
+    def test_date_score(self):
+        self.assertEqual(date_score(LOST_ON, LOST_ON), 1.0)
+        self.assertEqual(date_score(LOST_ON, LOST_ON - timedelta(days=2)), 1.0)
+        self.assertEqual(date_score(LOST_ON, LOST_ON - timedelta(days=3)), 0.0)
+        self.assertEqual(date_score(LOST_ON, LOST_ON + timedelta(days=15)), 0.5)
+        self.assertEqual(date_score(LOST_ON, LOST_ON + timedelta(days=40)), 0.0)
+
+
+class LostFoundTestCase(TestCase):
+    def setUp(self):
+        self.owner = CustomUser.objects.create(username='owner', email='owner@example.com')
+        self.finder = CustomUser.objects.create(username='finder', email='finder@example.com')
+
+    def make_lost(self, title, description='', **fields):
+        fields.setdefault('category', 'electronics')
+        fields.setdefault('location_lost', 'Library')
+        fields.setdefault('date_lost', LOST_ON)
+        return LostItem.objects.create(user=self.owner, title=title, description=description,
+                                       contact_info='owner@example.com', **fields)
+
+    def make_found(self, title, description='', **fields):
+        fields.setdefault('category', 'electronics')
+        fields.setdefault('location_found', 'Library')
+        fields.setdefault('date_found', LOST_ON + timedelta(days=1))
+        return FoundItem.objects.create(user=self.finder, title=title, description=description,
+                                        contact_info='finder@example.com', **fields)
+
+
+class MatcherTests(LostFoundTestCase):
+    def test_match_lost_item(self):
+        lost = self.make_lost('Black Dell laptop', 'Dell Latitude in a grey sleeve')
+        best = self.make_found('Dell laptop', 'Black laptop in a grey sleeve')
+        weaker = self.make_found('Laptop charger', 'Dell charger', location_found='Gym')
+        self.make_found('Dell laptop', 'Black', date_found=LOST_ON + timedelta(days=31))
+        self.make_found('Dell laptop', 'Black', is_claimed=True)
+        self.make_found('Dell laptop', 'Black', category='books')
+        self.make_found('Red umbrella', 'Folding umbrella', location_found='Gym', date_found=LOST_ON + timedelta(days=29))
+
+        self.assertEqual(match_lost_item(lost.pk), 2)
+        matches = list(ItemMatch.objects.filter(lost_item=lost))
+        self.assertEqual([match.found_item for match in matches], [best, weaker])
+        self.assertEqual(matches[0].location_score, 1.0)
+        self.assertIsNone(matches[0].image_score)
+        self.assertEqual(Notification.objects.filter(notification_type='match', user=self.owner).count(), 2)
+        self.assertEqual(Notification.objects.filter(notification_type='match', user=self.finder).count(), 2)
+
+        # Matching again from the found side rescores without notifying again
+        self.assertEqual(match_found_item(best.pk), 0)
+        self.assertEqual(ItemMatch.objects.count(), 2)
+        self.assertEqual(Notification.objects.filter(notification_type='match').count(), 4)
+
+    def test_own_and_resolved_reports_are_skipped(self):
+        self.make_lost('Blue water bottle', is_resolved=True)
+        found = FoundItem.objects.create(user=self.owner, title='Blue water bottle', description='',
+                                         category='electronics', location_found='Library',
+                                         date_found=LOST_ON, contact_info='owner@example.com')
+        self.assertEqual(match_found_item(found.pk), 0)
+
+
+def photo(seed, brightness=1.0, format='PNG'):
+    """A smooth 64x64 test pattern; seeds far apart give unrelated dHashes"""
+    image = Image.new('L', (64, 64))
+    image.putdata([int(127 + 60 * math.sin(x / (5 + seed)) + 60 * math.cos((x + y * seed) / 9))
+                   for y in range(64) for x in range(64)])
+    image = ImageEnhance.Brightness(image.convert('RGB')).enhance(brightness)
+    buffer = BytesIO()
+    image.save(buffer, format)
+    return buffer.getvalue()
+
+
+def flip_bits(value, positions):
+    for position in positions:
+        value ^= 1 << position
+    return value
+
+
+class ImageHashTests(LostFoundTestCase):
+    BASE = 0xF0F0_1234_ABCD_8001
+
+    def make_hash(self, value):
+        item = self.make_lost('Phone')
+        return ItemImageHash.objects.create(
+            lost_item=item, image_name=f'{value:x}.png', hash=to_signed(value),
+            **{f'band{i}': band for i, band in enumerate(bands(value))}
+        )
+
+    def test_signed_storage_round_trip(self):
+        stored = to_signed(self.BASE)
+        self.assertLess(stored, 0)
+        self.assertEqual(bands(stored), bands(self.BASE))
+        self.assertEqual(hamming(stored, self.BASE), 0)
+
+    def test_band_index_finds_near_duplicates(self):
+        # 11 bits spread 3/3/3/2 over the bands: only the last band is within
+        # MAX_DISTANCE // 4 bits, which is enough to find it
+        spread = self.make_hash(flip_bits(self.BASE, [0, 1, 2, 16, 17, 18, 32, 33, 34, 48, 49]))
+        close = self.make_hash(flip_bits(self.BASE, [5]))
+        self.make_hash(flip_bits(self.BASE, range(0, 64, 5)))
+        self.make_hash(self.BASE ^ ((1 << 64) - 1))
+
+        self.assertEqual(
+            [(record, distance) for record, distance in similar_hashes(self.BASE)],
+            [(close, 1), (spread, MAX_DISTANCE)],
+        )
+        self.assertEqual([record for record, _ in similar_hashes(self.BASE, max_distance=4)], [close])
+
+    def test_dhash_survives_reencoding(self):
+        original = dhash(Image.open(BytesIO(photo(5))))
+        self.assertLessEqual(hamming(original, dhash(Image.open(BytesIO(photo(5, 1.2, 'JPEG'))))), 4)
+        self.assertGreater(hamming(original, dhash(Image.open(BytesIO(photo(11))))), MAX_DISTANCE)
+
+
+class ImageMatchTests(LostFoundTestCase):
+    def setUp(self):
+        super().setUp()
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        settings = override_settings(MEDIA_ROOT=self.media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def upload(self, data, name='photo.png'):
+        return SimpleUploadedFile(name, data, content_type='image/png')
+
+    def test_photo_match_across_categories(self):
+        found = self.make_found('Black case', 'Zipped case with something inside', category='other',
+                                image=self.upload(photo(5, 1.1, 'JPEG'), 'case.jpg'))
+        scarf = self.make_found('Scarf', 'Wool', category='clothing', image=self.upload(photo(11)))
+        # Matching a new report hashes its photo first
+        self.assertEqual(match_found_item(found.pk) + match_found_item(scarf.pk), 0)
+
+        lost = self.make_lost('Headphones', 'Over-ear', image=self.upload(photo(5)))
+        self.assertEqual(match_lost_item(lost.pk), 1)
+        match = ItemMatch.objects.get()
+        self.assertEqual(match.found_item, found)
+        self.assertGreater(match.image_score, 0.85)
+        self.assertEqual(ItemImageHash.objects.count(), 3)
@@ -4,14 +4,21 @@ from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.db.models import Q
 from django.http import JsonResponse
+from django.core.paginator import Paginator
+from core import autocomplete
+from core.images import prefetch_variants
+from .counts import get_board_counts, status_counts
 from .models import LostItem, FoundItem
 from .forms import LostItemForm, FoundItemForm, SearchForm
 
+ITEMS_PER_PAGE = 12
+
 
 def item_list(request):
     """List all lost and found items"""
     form = SearchForm(request.GET or None)
     items = LostItem.objects.all().order_by('-created_at')
+    filtered = False
 
     if form.is_valid():
         query = form.cleaned_data.get('query')
@@ -32,12 +39,22 @@ def item_list(request):
         if status:
             items = items.filter(status=status)
 
+        filtered = bool(query or category or status)
+
+    # One conditional aggregate when filtered; the whole board's counts are cached
+    counts = status_counts(items) if filtered else get_board_counts()
+    paginator = Paginator(items, ITEMS_PER_PAGE)
+    paginator.count = counts['total']
+    page_obj = paginator.get_page(request.GET.get('page'))
+    prefetch_variants([item.image for item in page_obj])
+
     context = {
-        'items': items,
+        'items': page_obj,
         'form': form,
-        'total_items': items.count(),
-        'found_items': items.filter(status='found').count(),
-        'lost_items': items.filter(status='lost').count(),
+        'total_items': counts['total'],
+        'found_items': counts['found'],
+        'lost_items': counts['lost'],
+        'resolved_items': counts['resolved'],
     }
     return render(request, 'lost_found/list.html', context)
 
@@ -80,13 +97,12 @@ def item_detail(request, item_id):
     """View item details"""
     item = get_object_or_404(LostItem, id=item_id)
 
-    # Find potential matches
+    # Best stored matches (scored in the background by lost_found.matching)
     potential_matches = []
     if item.status == 'lost':
-        potential_matches = FoundItem.objects.filter(
-            category=item.category,
-            is_claimed=False
-        ).exclude(user=item.user)[:3]
+        potential_matches = item.matches.filter(
+            found_item__is_claimed=False
+        ).select_related('found_item').order_by('-score')[:3]
 
     context = {
         'item': item,
@@ -145,17 +161,9 @@ def mark_as_resolved(request, item_id):
 
 def search_autocomplete(request):
     """Autocomplete search for lost and found items"""
-    query = request.GET.get('q', '')
-    if query:
-        items = LostItem.objects.filter(
-            Q(title__icontains=query) |
-            Q(description__icontains=query)
-        )[:10]
-
-        results = [{'id': item.id, 'title': item.title} for item in items]
-        return JsonResponse({'results': results})
-
-    return JsonResponse({'results': []})
+    entries = autocomplete.search(request.GET.get('q', ''), kinds=['lost_item'])
+    results = [{'id': entry['id'], 'title': entry['title']} for entry in entries]
+    return JsonResponse({'results': results})
 
 
 @login_required
@@ -168,7 +176,17 @@ def my_items(request):
 def items_by_category(request, category):
     """View items by category"""
     items = LostItem.objects.filter(category=category).order_by('-created_at')
+    counts = status_counts(items)
+    paginator = Paginator(items, ITEMS_PER_PAGE)
+    paginator.count = counts['total']
+    page_obj = paginator.get_page(request.GET.get('page'))
+    prefetch_variants([item.image for item in page_obj])
+
     return render(request, 'lost_found/list.html', {
-        'items': items,
+        'items': page_obj,
         'category': category,
-    })
\ No newline at end of file
+        'total_items': counts['total'],
+        'found_items': counts['found'],
+        'lost_items': counts['lost'],
+        'resolved_items': counts['resolved'],
+    })
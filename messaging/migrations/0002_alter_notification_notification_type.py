@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('messaging', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='notification',
+            name='notification_type',
+            field=models.CharField(choices=[('message', 'New Message'), ('application', 'Job Application'), ('booking', 'Tutoring Booking'), ('session_reminder', 'Session Reminder'), ('match', 'Lost Item Match'), ('review', 'New Review'), ('system', 'System Notification')], max_length=20),
+        ),
+    ]
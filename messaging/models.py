@@ -23,7 +23,10 @@ class Notification(models.Model):
     NOTIFICATION_TYPES = (
         ('message', 'New Message'),
         ('application', 'Job Application'),
+        ('job_alert', 'Job Alert'),
+        ('job_expired', 'Job Expired'),
         ('booking', 'Tutoring Booking'),
+        ('session_reminder', 'Session Reminder'),
         ('match', 'Lost Item Match'),
         ('review', 'New Review'),
         ('system', 'System Notification'),
@@ -0,0 +1,121 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:19
+
+import django.core.validators
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Resource',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=200)),
+                ('description', models.TextField()),
+                ('resource_type', models.CharField(choices=[('notes', '📝 Notes'), ('past_paper', '📄 Past Paper'), ('slides', '📊 Slides'), ('textbook', '📚 Textbook'), ('assignment', '📋 Assignment'), ('project', '💼 Project'), ('code', '💻 Code'), ('video', '🎥 Video'), ('other', '📦 Other')], max_length=50)),
+                ('subject', models.CharField(choices=[('programming', '💻 Programming'), ('mathematics', '🧮 Mathematics'), ('physics', '⚛️ Physics'), ('chemistry', '🧪 Chemistry'), ('biology', '🧬 Biology'), ('business', '💼 Business'), ('engineering', '⚙️ Engineering'), ('languages', '🗣️ Languages'), ('arts', '🎨 Arts & Humanities'), ('social_sciences', '🌍 Social Sciences'), ('health', '🏥 Health Sciences'), ('other', '📚 Other')], max_length=100)),
+                ('course_code', models.CharField(help_text='e.g., CS101, MATH202', max_length=20)),
+                ('course_name', models.CharField(blank=True, help_text='Optional: Full course name', max_length=100)),
+                ('file', models.FileField(upload_to='resources/%Y/%m/%d/')),
+                ('thumbnail', models.ImageField(blank=True, null=True, upload_to='resource_thumbs/%Y/%m/%d/')),
+                ('file_size', models.BigIntegerField(default=0, editable=False)),
+                ('downloads', models.PositiveIntegerField(default=0, editable=False)),
+                ('views', models.PositiveIntegerField(default=0, editable=False)),
+                ('average_rating', models.DecimalField(decimal_places=2, default=0.0, editable=False, max_digits=3)),
+                ('total_ratings', models.PositiveIntegerField(default=0, editable=False)),
+                ('access_level', models.CharField(choices=[('public', 'Public'), ('campus_only', 'Campus Only'), ('private', 'Private')], default='public', max_length=20)),
+                ('is_approved', models.BooleanField(default=False)),
+                ('is_featured', models.BooleanField(default=False)),
+                ('tags', models.CharField(blank=True, help_text='Comma-separated tags', max_length=255)),
+                ('year', models.PositiveIntegerField(blank=True, help_text='Year of resource (e.g., 2023)', null=True)),
+                ('semester', models.CharField(blank=True, choices=[('', 'Not specified'), ('fall', 'Fall'), ('spring', 'Spring'), ('summer', 'Summer'), ('winter', 'Winter')], max_length=20)),
+                ('instructor', models.CharField(blank=True, help_text='Course instructor/professor', max_length=100)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='uploaded_resources', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Resource',
+                'verbose_name_plural': 'Resources',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ResourceBookmark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('resource', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='bookmarks', to='resources.resource')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='bookmarked_resources', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Bookmark',
+                'verbose_name_plural': 'Bookmarks',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ResourceDownload',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('ip_address', models.GenericIPAddressField(blank=True, null=True)),
+                ('user_agent', models.TextField(blank=True)),
+                ('downloaded_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('resource', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='download_history', to='resources.resource')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='downloads', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-downloaded_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ResourceReview',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rating', models.IntegerField(choices=[(1, '1 Star - Poor'), (2, '2 Stars - Fair'), (3, '3 Stars - Good'), (4, '4 Stars - Very Good'), (5, '5 Stars - Excellent')], validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(5)])),
+                ('comment', models.TextField()),
+                ('helpful', models.PositiveIntegerField(default=0, editable=False)),
+                ('not_helpful', models.PositiveIntegerField(default=0, editable=False)),
+                ('is_verified', models.BooleanField(default=False, help_text='Verified downloader')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('resource', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reviews', to='resources.resource')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='resource_reviews', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Resource Review',
+                'verbose_name_plural': 'Resource Reviews',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='resource',
+            index=models.Index(fields=['resource_type', 'is_approved'], name='resources_r_resourc_9dd5d2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resource',
+            index=models.Index(fields=['subject', 'is_approved'], name='resources_r_subject_d34e69_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resource',
+            index=models.Index(fields=['average_rating', 'downloads'], name='resources_r_average_e00e18_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='resourcebookmark',
+            unique_together={('user', 'resource')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='resourcereview',
+            unique_together={('resource', 'user')},
+        ),
+    ]
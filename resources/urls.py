@@ -12,6 +12,7 @@ urlpatterns = [
 
     # User-specific views
     path('my-resources/', views.my_resources, name='my_resources'),
+    path('my-resources/export/', views.export_resources, name='export_resources'),
     path('my-bookmarks/', views.my_bookmarks, name='my_bookmarks'),
 
     # Resource CRUD operations
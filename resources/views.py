@@ -2,10 +2,12 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.http import FileResponse, Http404, HttpResponse
+from accounts.models import CustomUser
 from django.db.models import Q, Count, Avg
 from django.core.paginator import Paginator
 from django.utils import timezone
 import os
+from core.exports import export_response
 from .models import Resource, ResourceReview, ResourceBookmark
 from .forms import ResourceForm, ReviewForm
 from django.db.models import Sum
@@ -332,6 +334,36 @@ def my_resources(request):
     return render(request, 'resources/my_resources.html', context)
 
 
+@login_required
+def export_resources(request):
+    """Stream the user's uploads as CSV or JSON lines; staff may pass ?user=<id>"""
+    user = request.user
+    if request.GET.get('user') and request.user.is_staff:
+        user = get_object_or_404(CustomUser, id=request.GET['user'])
+
+    resources = Resource.objects.filter(user=user)
+    columns = [
+        ('id', lambda r: r.id),
+        ('title', lambda r: r.title),
+        ('resource_type', lambda r: r.resource_type),
+        ('subject', lambda r: r.subject),
+        ('course_code', lambda r: r.course_code),
+        ('course_name', lambda r: r.course_name),
+        ('access_level', lambda r: r.access_level),
+        ('is_approved', lambda r: r.is_approved),
+        ('file', lambda r: r.file.name),
+        ('file_size', lambda r: r.file_size),
+        ('downloads', lambda r: r.downloads),
+        ('views', lambda r: r.views),
+        ('average_rating', lambda r: r.average_rating),
+        ('total_ratings', lambda r: r.total_ratings),
+        ('tags', lambda r: r.tags),
+        ('created_at', lambda r: r.created_at),
+        ('updated_at', lambda r: r.updated_at),
+    ]
+    return export_response(request, resources, columns, f'user-{user.id}-resources')
+
+
 @login_required
 def my_bookmarks(request):
     """View user's bookmarked resources"""
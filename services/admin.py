@@ -1,3 +1,10 @@
 from django.contrib import admin
+from .models import ServiceHoursException
 
-# Register your models here.
+
+@admin.register(ServiceHoursException)
+class ServiceHoursExceptionAdmin(admin.ModelAdmin):
+    list_display = ['service', 'date', 'opens', 'closes', 'note']
+    list_filter = ['date']
+    search_fields = ['service__name', 'note']
+    raw_id_fields = ['service']
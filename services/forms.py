@@ -5,7 +5,7 @@ from .models import Service, ServiceReview
 class ServiceForm(forms.ModelForm):
     class Meta:
         model = Service
-        fields = ['name', 'description', 'category', 'location', 'contact_number', 'contact_email', 'website', 'opening_hours', 'price_range']
+        fields = ['name', 'description', 'category', 'location', 'latitude', 'longitude', 'contact_number', 'contact_email', 'website', 'opening_hours', 'price_range']
 
 class ServiceReviewForm(forms.ModelForm):
     class Meta:
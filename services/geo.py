@@ -0,0 +1,93 @@
+# services/geo.py
+import math
+
+from django.db.models import Q
+
+from core.places import get_gazetteer, haversine_km
+from .models import Service
+
+# Grid cells are CELL_DEGREES on a side (about 280 m of latitude). A cell is
+# stored as one indexed integer, so each grid row of a search square is a
+# single range scan.
+CELL_DEGREES = 0.0025
+_COLUMNS = 200000  # more than 360 / CELL_DEGREES, so rows never overlap
+KM_PER_DEGREE = 111.32
+MAX_RADIUS_KM = 25
+
+
+def cell_position(latitude, longitude):
+    return math.floor(latitude / CELL_DEGREES), math.floor(longitude / CELL_DEGREES)
+
+
+def cell_id(row, column):
+    # Shift columns to be positive so ranges stay contiguous across the meridian
+    return row * _COLUMNS + column + _COLUMNS // 2
+
+
+def cell_for(latitude, longitude):
+    if latitude is None or longitude is None:
+        return None
+    return cell_id(*cell_position(latitude, longitude))
+
+
+def square_filter(row, column, radius):
+    """Q for the cells within `radius` cells of (row, column): one id range per grid row"""
+    condition = Q()
+    for r in range(row - radius, row + radius + 1):
+        condition |= Q(geo_cell__range=(cell_id(r, column - radius), cell_id(r, column + radius)))
+    return condition
+
+
+def locate_service(service):
+    """Fill coordinates from the resolved place when none were given, then the grid cell"""
+    if service.latitude is None or service.longitude is None:
+        service.latitude, service.longitude = get_gazetteer()['coords'].get(service.place_id, (None, None))
+    service.geo_cell = cell_for(service.latitude, service.longitude)
+
+
+def nearest_services(latitude, longitude, k=10, queryset=None, max_km=MAX_RADIUS_KM):
+    """
+    The k services closest to a point, nearest first, each with .distance_km.
+
+    Searches squares of grid cells around the point's cell, doubling the
+    radius each time. Anything outside a square is at least `radius` cells
+    away, so once k services are closer than that they are the answer.
+    """
+    queryset = (queryset if queryset is not None else Service.objects.all()).filter(geo_cell__isnull=False)
+    row, column = cell_position(latitude, longitude)
+    # A cell is narrowest along the longitude; use that as the guaranteed distance per cell
+    cell_km = CELL_DEGREES * KM_PER_DEGREE * max(math.cos(math.radians(abs(latitude) + CELL_DEGREES)), 0.01)
+    max_radius = math.ceil(max_km / cell_km)
+
+    radius = 1
+    while True:
+        found = []
+        for service in queryset.filter(square_filter(row, column, radius)):
+            service.distance_km = haversine_km((latitude, longitude), (service.latitude, service.longitude))
+            if service.distance_km <= max_km:
+                found.append(service)
+        found.sort(key=lambda service: service.distance_km)
+        if radius >= max_radius or (len(found) >= k and found[k - 1].distance_km <= radius * cell_km):
+            return found[:k]
+        radius = min(radius * 2, max_radius)
+
+
+def locate_all_services(chunk_size=500):
+    """Backfill coordinates and grid cells (e.g. after loading the gazetteer); returns rows changed"""
+    changed = []
+    count = 0
+    for service in Service.objects.only('pk', 'place_id', 'latitude', 'longitude', 'geo_cell').iterator(
+            chunk_size=chunk_size):
+        before = (service.latitude, service.longitude, service.geo_cell)
+        locate_service(service)
+        if (service.latitude, service.longitude, service.geo_cell) != before:
+            changed.append(service)
+        if len(changed) >= chunk_size:
+            count += _save_positions(changed)
+            changed = []
+    return count + _save_positions(changed)
+
+
+def _save_positions(services):
+    Service.objects.bulk_update(services, ['latitude', 'longitude', 'geo_cell'])
+    return len(services)
@@ -0,0 +1,274 @@
+# services/hours.py
+import re
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Service, ServiceHoursException, ServiceOpeningInterval
+
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+DAY_NAMES = {
+    'mon': 0, 'monday': 0, 'tue': 1, 'tues': 1, 'tuesday': 1, 'wed': 2, 'weds': 2, 'wednesday': 2,
+    'thu': 3, 'thur': 3, 'thurs': 3, 'thursday': 3, 'fri': 4, 'friday': 4,
+    'sat': 5, 'saturday': 5, 'sun': 6, 'sunday': 6,
+}
+DAY_GROUPS = {
+    'daily': range(7), 'everyday': range(7), 'weekdays': range(5), 'weekends': range(5, 7), 'weekend': range(5, 7),
+}
+
+_DAY = '|'.join(sorted(DAY_NAMES, key=len, reverse=True))
+_TIME = r'(\d{1,2})(?:[:.](\d{2}))?(?:\s*([ap])\.?m\.?)?'
+TOKEN_RE = re.compile(
+    rf'(?P<always>24\s*/\s*7|24\s*hours|always open)'
+    rf'|(?P<range>{_TIME}\s*-\s*{_TIME})'
+    rf'|(?P<days>\b(?:{_DAY})s?\b(?:\s*-\s*\b(?:{_DAY})s?\b)?)'
+    rf'|(?P<group>\b(?:{"|".join(DAY_GROUPS)})\b)'
+    rf'|(?P<closed>\bclosed\b)'
+    rf'|(?P<except>\b(?:except|excluding)\b)'
+)
+# "closed" and "except" only take days from their own part of the text
+SEGMENT_RE = re.compile(r'[,;\n]')
+
+
+def _clean(text):
+    text = (text or '').lower().replace('–', '-').replace('—', '-')
+    text = re.sub(r'\bevery day\b', 'everyday', text)
+    text = re.sub(r'\bnoon\b', '12pm', text)
+    text = re.sub(r'\bmidnight\b', '12am', text)
+    # "9 to 5" and "mon to fri" read like "9-5" and "mon-fri"; "9:00 till 17:00" too
+    return re.sub(r'\s+(?:to|till|until)\s+', '-', text)
+
+
+def _day(name):
+    return DAY_NAMES[name] if name in DAY_NAMES else DAY_NAMES[name[:-1]]  # "sundays"
+
+
+def _day_span(text):
+    first, _, last = text.replace(' ', '').partition('-')
+    first = _day(first)
+    last = _day(last) if last else first
+    return {(first + offset) % 7 for offset in range((last - first) % 7 + 1)}
+
+
+def _hour(hour, meridiem):
+    if meridiem == 'p' and hour < 12:
+        return hour + 12
+    if meridiem == 'a' and hour == 12:
+        return 0
+    return hour
+
+
+def _time_range(groups):
+    """(start, end) minutes of the day from a matched range; end may pass midnight"""
+    start_hour, start_minute, start_mer, end_hour, end_minute, end_mer = groups
+    start_hour, end_hour = int(start_hour), int(end_hour)
+    start_minute, end_minute = int(start_minute or 0), int(end_minute or 0)
+    if start_hour > 24 or end_hour > 24 or start_minute > 59 or end_minute > 59:
+        raise ValueError(groups)
+
+    if end_mer and not start_mer:
+        # "9-5pm" is 9am; "1-5pm" is 1pm
+        start_mer = end_mer if _hour(start_hour, end_mer) <= _hour(end_hour, end_mer) else 'a'
+    start = _hour(start_hour, start_mer) * 60 + start_minute
+    end = _hour(end_hour, end_mer) * 60 + end_minute
+    if end <= start and not end_mer and end_hour < 12 and end + 12 * 60 > start:
+        end += 12 * 60  # "8-5", "9am-1"
+    if end <= start:
+        end += MINUTES_PER_DAY  # overnight, or "00:00-00:00" for the whole day
+    return start, end
+
+
+def _tokens(text):
+    """[kind, value, segment] per recognised token: days sets, (start, end) times, closed, except"""
+    tokens = []
+    for segment, part in enumerate(SEGMENT_RE.split(_clean(text))):
+        for match in TOKEN_RE.finditer(part):
+            kind, value = match.lastgroup, None
+            if kind == 'range':
+                try:
+                    kind, value = 'times', _time_range(match.groups()[2:8])
+                except ValueError:
+                    continue
+            elif kind == 'always':
+                kind, value = 'times', (0, MINUTES_PER_DAY)
+            elif kind == 'group':
+                kind, value = 'days', set(DAY_GROUPS[match.group()])
+            elif kind == 'days':
+                value = _day_span(match.group())
+            tokens.append((kind, value, segment))
+    return tokens
+
+
+def _adjacent_days(tokens, position, step):
+    """Positions of the run of day tokens next to `position` within its segment"""
+    segment = tokens[position][2]
+    run = []
+    position += step
+    while 0 <= position < len(tokens) and tokens[position][0] == 'days' and tokens[position][2] == segment:
+        run.append(position)
+        position += step
+    return run
+
+
+def parse_opening_hours(text):
+    """
+    Weekly intervals [(start, end)] in minutes of the week from free text
+    like "Mon-Fri 8am-6pm, Sat 9:00-13:00, Sun closed", "8am-10pm, Monday to
+    Saturday", "10pm-2am Fri, Sat", "8am-8pm except Sunday" or "24/7".
+
+    Days go with the times after them, or, when the text starts with a
+    time, with the times before them; times with no days apply every day.
+    Returns None when nothing recognisable is found or days are left with
+    no times.
+    """
+    tokens = _tokens(text)
+    closed, excepts, consumed = set(), [], set()
+    for position, (kind, _, _) in enumerate(tokens):
+        if kind == 'closed':
+            run = _adjacent_days(tokens, position, -1) or _adjacent_days(tokens, position, 1)
+        elif kind == 'except':
+            run = _adjacent_days(tokens, position, 1)
+        else:
+            continue
+        days = set().union(*(tokens[other][1] for other in run))
+        consumed.update(run)
+        if kind == 'closed':
+            closed |= days
+        else:
+            excepts.append((position, days))
+
+    # Runs of consecutive day tokens and time tokens: [kind, values, first token position]
+    runs = []
+    for position, (kind, value, _) in enumerate(tokens):
+        if kind not in ('days', 'times') or position in consumed:
+            continue
+        if runs and runs[-1][0] == kind:
+            runs[-1][1].append(value)
+        else:
+            runs.append([kind, [value], position])
+    if not runs:
+        return [] if any(kind == 'closed' for kind, _, _ in tokens) else None
+
+    clauses = []  # (days, times, first token position, first position of the next clause)
+    days_first = runs[0][0] == 'days'
+    for index in range(0, len(runs), 2):
+        pair = runs[index:index + 2]
+        if days_first and len(pair) < 2:
+            return None  # "Mon-Fri 9-5, Sat": which hours does Saturday get?
+        if days_first:
+            days_run, times_run = pair
+        else:
+            times_run, days_run = pair[0], pair[1] if len(pair) > 1 else None
+        days = set().union(*days_run[1]) if days_run else set(range(7))
+        following = runs[index + 2][2] if index + 2 < len(runs) else len(tokens)
+        clauses.append((days, times_run[1], pair[0][2], following))
+
+    intervals = []
+    for days, times, first, following in clauses:
+        days = days - closed
+        for position, excluded in excepts:
+            if first < position < following:
+                days -= excluded
+        for day in days:
+            for start, end in times:
+                intervals.append((day * MINUTES_PER_DAY + start, day * MINUTES_PER_DAY + end))
+    return merge_intervals(intervals)
+
+
+def merge_intervals(intervals):
+    """
+    Sorted intervals with overlaps merged within the day each one starts on.
+    An interval belongs to its start day (see open_at), so one running past
+    Sunday midnight keeps its end beyond the week rather than being split.
+    """
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] and start // MINUTES_PER_DAY == merged[-1][0] // MINUTES_PER_DAY:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def minute_of_week(moment):
+    moment = timezone.localtime(moment)
+    return moment.weekday() * MINUTES_PER_DAY + moment.hour * 60 + moment.minute
+
+
+def open_at(queryset, moment=None):
+    """
+    Services in `queryset` open at `moment` (default now). Regular hours
+    belong to the day they start on, so an exception on a date replaces the
+    intervals starting that day, including their run past midnight, while
+    the previous night's interval still runs into it. An exception's own
+    hours open the service when they cover the time.
+    """
+    moment = timezone.localtime(moment or timezone.now())
+    minute = minute_of_week(moment)
+    day_start = minute - minute % MINUTES_PER_DAY
+    today = moment.date()
+
+    started_today = ServiceOpeningInterval.objects.filter(
+        start_minute__gte=day_start, start_minute__lte=minute, end_minute__gt=minute,
+    )
+    # Intervals from the day before; late on Sunday ones end past the week, so Monday looks there
+    started_yesterday = ServiceOpeningInterval.objects.filter(
+        Q(start_minute__lt=day_start, end_minute__gt=minute)
+        | Q(start_minute__lte=minute + MINUTES_PER_WEEK, end_minute__gt=minute + MINUTES_PER_WEEK)
+    )
+    exceptions = ServiceHoursException.objects.filter(date=today)
+    yesterday_exceptions = ServiceHoursException.objects.filter(date=today - timedelta(days=1))
+
+    regular = (
+        Q(pk__in=started_today.values('service_id')) & ~Q(pk__in=exceptions.values('service_id'))
+    ) | (
+        Q(pk__in=started_yesterday.values('service_id')) & ~Q(pk__in=yesterday_exceptions.values('service_id'))
+    )
+    special = Q(pk__in=exceptions.filter(opens__lte=moment.time(), closes__gt=moment.time()).values('service_id'))
+    return queryset.filter(regular | special)
+
+
+def _interval_rows(service_id, intervals):
+    return [
+        ServiceOpeningInterval(service_id=service_id, start_minute=start, end_minute=end)
+        for start, end in intervals or []
+    ]
+
+
+@transaction.atomic
+def sync_opening_intervals(service):
+    """Replace a service's intervals with ones parsed from its opening_hours"""
+    ServiceOpeningInterval.objects.filter(service=service).delete()
+    ServiceOpeningInterval.objects.bulk_create(
+        _interval_rows(service.pk, parse_opening_hours(service.opening_hours))
+    )
+
+
+def parse_all_opening_hours(chunk_size=500):
+    """Re-parse every service's hours in bulk; returns (services parsed, services not understood)"""
+    parsed = unparsed = 0
+    services = Service.objects.values_list('pk', 'opening_hours').order_by('pk')
+    chunk = []
+    for row in services.iterator(chunk_size=chunk_size):
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            counts = _replace_intervals(chunk)
+            parsed, unparsed, chunk = parsed + counts[0], unparsed + counts[1], []
+    counts = _replace_intervals(chunk)
+    return parsed + counts[0], unparsed + counts[1]
+
+
+@transaction.atomic
+def _replace_intervals(rows):
+    intervals, unparsed = [], 0
+    for service_id, text in rows:
+        parsed = parse_opening_hours(text)
+        unparsed += parsed is None
+        intervals.extend(_interval_rows(service_id, parsed))
+    ServiceOpeningInterval.objects.filter(service_id__in=[service_id for service_id, _ in rows]).delete()
+    ServiceOpeningInterval.objects.bulk_create(intervals)
+    return len(rows) - unparsed, unparsed
@@ -0,0 +1,11 @@
+# services/management/commands/locate_services.py
+from django.core.management.base import BaseCommand
+from services.geo import locate_all_services
+
+
+class Command(BaseCommand):
+    help = 'Fills in service coordinates from their places and rebuilds the nearest-search grid cells'
+
+    def handle(self, *args, **options):
+        count = locate_all_services()
+        self.stdout.write(self.style.SUCCESS(f'Located {count} services'))
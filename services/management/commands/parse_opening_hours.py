@@ -0,0 +1,13 @@
+# services/management/commands/parse_opening_hours.py
+from django.core.management.base import BaseCommand
+from services.hours import parse_all_opening_hours
+
+
+class Command(BaseCommand):
+    help = 'Parses every service\'s free-text opening hours into weekly intervals for the "open now" filter'
+
+    def handle(self, *args, **options):
+        parsed, unparsed = parse_all_opening_hours()
+        self.stdout.write(self.style.SUCCESS(f'Parsed hours for {parsed} services'))
+        if unparsed:
+            self.stdout.write(self.style.WARNING(f'{unparsed} services have hours that could not be read'))
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='service',
+            name='qr_code_svg',
+            field=models.FileField(blank=True, upload_to='service_qr/'),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='qr_payload_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+    ]
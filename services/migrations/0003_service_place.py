@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_place_placealias'),
+        ('services', '0002_service_qr_code_svg_service_qr_payload_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='service',
+            name='place',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='core.place'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services', '0004_service_geo_cell_service_latitude_service_longitude'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ServiceHoursException',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('opens', models.TimeField(blank=True, null=True)),
+                ('closes', models.TimeField(blank=True, null=True)),
+                ('note', models.CharField(blank=True, max_length=200)),
+                ('service', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='hours_exceptions', to='services.service')),
+            ],
+            options={
+                'ordering': ['date'],
+                'indexes': [models.Index(fields=['date', 'opens', 'closes'], name='services_se_date_99d8ad_idx')],
+                'constraints': [models.UniqueConstraint(fields=('service', 'date'), name='unique_service_hours_exception')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ServiceOpeningInterval',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start_minute', models.PositiveIntegerField()),
+                ('end_minute', models.PositiveIntegerField()),
+                ('service', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='opening_intervals', to='services.service')),
+            ],
+            options={
+                'ordering': ['service', 'start_minute'],
+                'indexes': [models.Index(fields=['start_minute', 'end_minute'], name='services_se_start_m_c409ff_idx')],
+            },
+        ),
+    ]
@@ -21,6 +21,11 @@ class Service(models.Model):
     description = models.TextField()
     category = models.CharField(max_length=50, choices=CATEGORY_CHOICES)
     location = models.CharField(max_length=200)
+    place = models.ForeignKey('core.Place', on_delete=models.SET_NULL, null=True, blank=True,
+                              editable=False, related_name='+')
+    latitude = models.FloatField(null=True, blank=True, help_text="Filled from the location when left blank")
+    longitude = models.FloatField(null=True, blank=True)
+    geo_cell = models.BigIntegerField(null=True, blank=True, editable=False, db_index=True)  # see services.geo
     contact_number = models.CharField(max_length=20)
     contact_email = models.EmailField(blank=True)
     website = models.URLField(blank=True)
@@ -29,6 +34,8 @@ class Service(models.Model):
     price_range = models.CharField(max_length=50, blank=True)
     is_verified = models.BooleanField(default=False)
     qr_code = models.ImageField(upload_to='service_qr/', blank=True)
+    qr_code_svg = models.FileField(upload_to='service_qr/', blank=True)
+    qr_payload_hash = models.CharField(max_length=64, blank=True, editable=False)
     created_at = models.DateTimeField(default=timezone.now)
 
     def __str__(self):
@@ -46,4 +53,42 @@ class ServiceReview(models.Model):
     created_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
-        ordering = ['-created_at']
\ No newline at end of file
+        ordering = ['-created_at']
+
+class ServiceOpeningInterval(models.Model):
+    """
+    A weekly opening window parsed from Service.opening_hours, in minutes
+    from Monday 00:00. A window belongs to the day it starts on, so one
+    opening late on Sunday ends past 10080.
+    """
+    service = models.ForeignKey(Service, on_delete=models.CASCADE, related_name='opening_intervals')
+    start_minute = models.PositiveIntegerField()
+    end_minute = models.PositiveIntegerField()
+
+    class Meta:
+        ordering = ['service', 'start_minute']
+        indexes = [
+            models.Index(fields=['start_minute', 'end_minute']),
+        ]
+
+
+class ServiceHoursException(models.Model):
+    """Different hours on one date (holidays, events); no times means closed all day"""
+    service = models.ForeignKey(Service, on_delete=models.CASCADE, related_name='hours_exceptions')
+    date = models.DateField()
+    opens = models.TimeField(null=True, blank=True)
+    closes = models.TimeField(null=True, blank=True)
+    note = models.CharField(max_length=200, blank=True)
+
+    def __str__(self):
+        hours = f"{self.opens:%H:%M}-{self.closes:%H:%M}" if self.opens and self.closes else "closed"
+        return f"{self.service} {self.date}: {hours}"
+
+    class Meta:
+        ordering = ['date']
+        constraints = [
+            models.UniqueConstraint(fields=['service', 'date'], name='unique_service_hours_exception'),
+        ]
+        indexes = [
+            models.Index(fields=['date', 'opens', 'closes']),
+        ]
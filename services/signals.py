@@ -0,0 +1,67 @@
+# services/signals.py
+from django.db.models.signals import post_init, post_save, pre_save
+from django.dispatch import receiver
+
+from core.tasks import run_in_background
+from core.utils import refresh_service_qr_code
+from .geo import locate_service
+from .hours import sync_opening_intervals
+from .models import Service
+
+# Fields that appear on the service's QR card
+QR_FIELDS = {'name', 'category', 'location', 'contact_number', 'opening_hours'}
+# Columns derived from the location before a save
+POSITION_FIELDS = ('place_id', 'latitude', 'longitude', 'geo_cell')
+
+
+@receiver(post_save, sender=Service)
+def schedule_service_qr_code(sender, instance, update_fields=None, **kwargs):
+    """Re-render the QR card in the background; unchanged payloads are skipped there"""
+    if update_fields is not None and not QR_FIELDS.intersection(update_fields):
+        return
+    run_in_background(refresh_service_qr_code, instance.pk)
+
+
+@receiver(post_init, sender=Service)
+def remember_position(sender, instance, **kwargs):
+    instance._geo_state = tuple(instance.__dict__.get(f) for f in ('place_id', 'latitude', 'longitude'))
+
+
+@receiver(pre_save, sender=Service)
+def locate(sender, instance, update_fields=None, **kwargs):
+    """
+    Runs after core resolves the place. Coordinates nobody edited follow the
+    place when the location changes; typed-in coordinates are kept.
+    """
+    if update_fields is not None and not {'location', 'latitude', 'longitude'} & set(update_fields):
+        return
+    place_id, latitude, longitude = instance._geo_state
+    if instance.place_id != place_id and (instance.latitude, instance.longitude) == (latitude, longitude):
+        instance.latitude = instance.longitude = None
+    locate_service(instance)
+    instance._geo_state = (instance.place_id, instance.latitude, instance.longitude)
+    if update_fields is not None:
+        # save() writes only update_fields; the rest is stored after it
+        instance._unsaved_position = [
+            field for field in POSITION_FIELDS
+            if field not in update_fields and field.removesuffix('_id') not in update_fields
+        ]
+
+
+@receiver(post_save, sender=Service)
+def save_position(sender, instance, **kwargs):
+    fields = instance.__dict__.pop('_unsaved_position', None)
+    if fields:
+        Service.objects.filter(pk=instance.pk).update(**{field: getattr(instance, field) for field in fields})
+
+
+@receiver(post_init, sender=Service)
+def remember_opening_hours(sender, instance, **kwargs):
+    instance._parsed_hours = instance.__dict__.get('opening_hours')
+
+
+@receiver(post_save, sender=Service)
+def refresh_opening_intervals(sender, instance, created, **kwargs):
+    if created or instance.opening_hours != instance._parsed_hours:
+        sync_opening_intervals(instance)
+    instance._parsed_hours = instance.opening_hours
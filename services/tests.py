@@ -1,3 +1,149 @@
-from django.test import TestCase
+import random
+from datetime import date, datetime, time
+from unittest import mock
 
-# Create your tests here.
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from accounts.models import CustomUser
+from core.places import haversine_km
+from .geo import CELL_DEGREES, cell_for, cell_id, nearest_services
+from .hours import MINUTES_PER_DAY, open_at, parse_opening_hours
+from .models import Service, ServiceHoursException
+
+DAYS = ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']
+
+
+def week(*spans):
+    """Intervals from ('mon-fri', '08:00', '18:00') style spans; an end before the start runs past midnight"""
+    intervals = []
+    for days, opens, closes in spans:
+        first, _, last = days.partition('-')
+        start = int(opens[:2]) * 60 + int(opens[3:])
+        end = int(closes[:2]) * 60 + int(closes[3:])
+        if end <= start:
+            end += MINUTES_PER_DAY
+        for day in range(DAYS.index(first), DAYS.index(last or first) + 1):
+            intervals.append((day * MINUTES_PER_DAY + start, day * MINUTES_PER_DAY + end))
+    return sorted(intervals)
+
+
+class ParseOpeningHoursTests(SimpleTestCase):
+    CASES = [
+        ('Mon-Fri 8am-6pm, Sat 9:00-13:00, Sun closed', week(('mon-fri', '08:00', '18:00'), ('sat', '09:00', '13:00'))),
+        ('Weekdays 8-5', week(('mon-fri', '08:00', '17:00'))),
+        ('9 to 5 weekdays', week(('mon-fri', '09:00', '17:00'))),
+        ('Mon-Fri 9-12, 1-5pm', week(('mon-fri', '09:00', '12:00'), ('mon-fri', '13:00', '17:00'))),
+        ('24/7', week(('mon-sun', '00:00', '24:00'))),
+        ('Mon-Fri 24 hours', week(('mon-fri', '00:00', '24:00'))),
+        ('8am - 10pm, Monday to Saturday', week(('mon-sat', '08:00', '22:00'))),
+        ('10pm-2am Fri, Sat', week(('fri-sat', '22:00', '02:00'))),
+        ('Sun 10pm-2am', week(('sun', '22:00', '02:00'))),
+        ('8am-8pm except Sunday', week(('mon-sat', '08:00', '20:00'))),
+        ('Daily 9am-5pm except Sundays', week(('mon-sat', '09:00', '17:00'))),
+        ('Mon-Sat except Wed 9-5', week(('mon-tue', '09:00', '17:00'), ('thu-sat', '09:00', '17:00'))),
+        ('Open 24 hours except weekends', week(('mon-fri', '00:00', '24:00'))),
+        ('9-5 Mon-Fri, Sat closed', week(('mon-fri', '09:00', '17:00'))),
+        ('Closed on public holidays, Mon-Fri 9-5', week(('mon-fri', '09:00', '17:00'))),
+        ('Closed', []),
+        ('Mon-Fri 9-5, Sat', None),
+        ('By appointment', None),
+        ('', None),
+    ]
+
+    def test_parse(self):
+        for text, expected in self.CASES:
+            with self.subTest(text=text):
+                self.assertEqual(parse_opening_hours(text), expected)
+
+
+@mock.patch('services.signals.run_in_background')
+class OpenAtTests(TestCase):
+    # 2024-01-05 is a Friday
+    FRIDAY = date(2024, 1, 5)
+
+    def setUp(self):
+        self.user = CustomUser.objects.create(username='owner', email='owner@example.com')
+
+    def make_service(self, hours):
+        return Service.objects.create(
+            user=self.user, name='Late Bar', description='Drinks', category=Service.CATEGORY_CHOICES[0][0],
+            location='Main street', contact_number='123', opening_hours=hours,
+        )
+
+    def is_open(self, service, day, hour):
+        moment = timezone.make_aware(datetime.combine(self.FRIDAY.replace(day=day), time(hour)))
+        return open_at(Service.objects.filter(pk=service.pk), moment).exists()
+
+    def test_overnight_hours(self, run_in_background):
+        service = self.make_service('10pm-2am Fri, Sat')
+        ServiceHoursException.objects.create(service=service, date=date(2024, 1, 6), opens=time(12), closes=time(14))
+        ServiceHoursException.objects.create(service=service, date=date(2024, 1, 12))
+        cases = [
+            (5, 23, True),    # Friday night
+            (6, 1, True),     # Friday night runs into Saturday's exception date
+            (6, 3, False),
+            (6, 13, True),    # Saturday's special hours
+            (6, 23, False),   # the exception replaces Saturday night
+            (7, 1, False),
+            (12, 23, False),  # closed the next Friday...
+            (13, 1, False),   # ...including the part after midnight
+        ]
+        for day, hour, expected in cases:
+            with self.subTest(day=day, hour=hour):
+                self.assertEqual(self.is_open(service, day, hour), expected)
+
+    def test_sunday_night_runs_into_monday(self, run_in_background):
+        service = self.make_service('Sun 10pm-2am')
+        cases = [(7, 23, True), (8, 1, True), (8, 3, False), (1, 1, True)]
+        for day, hour, expected in cases:
+            with self.subTest(day=day, hour=hour):
+                self.assertEqual(self.is_open(service, day, hour), expected)
+
+
+@mock.patch('services.signals.run_in_background')
+class NearestServicesTests(TestCase):
+    # Just north of the equator and either side of the prime meridian
+    ORIGIN = (0.01, 0.0)
+
+    def setUp(self):
+        self.user = CustomUser.objects.create(username='owner', email='owner@example.com')
+
+    def make_service(self, name, latitude, longitude):
+        return Service.objects.create(
+            user=self.user, name=name, description='Copies', category='printing', location='Somewhere',
+            contact_number='123', opening_hours='Mon-Fri 9-5', latitude=latitude, longitude=longitude,
+        )
+
+    def test_cells_are_contiguous_across_the_meridian(self, run_in_background):
+        west, east = cell_for(0.001, -0.001), cell_for(0.001, 0.001)
+        self.assertEqual(east - west, 1)
+        self.assertEqual(cell_for(CELL_DEGREES + 0.001, -0.001) - west, cell_id(1, 0) - cell_id(0, 0))
+        self.assertIsNone(cell_for(None, 0.5))
+
+    def test_matches_brute_force(self, run_in_background):
+        rng = random.Random(49)
+        services = [
+            self.make_service(f'Shop {n}', self.ORIGIN[0] + rng.uniform(-0.2, 0.2) ** 3 * 20,
+                              self.ORIGIN[1] + rng.uniform(-0.2, 0.2) ** 3 * 20)
+            for n in range(60)
+        ]
+        self.make_service('Unplaced', None, None)
+        distance = {service.pk: haversine_km(self.ORIGIN, (service.latitude, service.longitude))
+                    for service in services}
+
+        for k, max_km in [(1, 25), (5, 25), (20, 25), (60, 25), (10, 1)]:
+            with self.subTest(k=k, max_km=max_km):
+                expected = sorted((pk for pk in distance if distance[pk] <= max_km), key=distance.get)[:k]
+                found = nearest_services(*self.ORIGIN, k=k, max_km=max_km)
+                self.assertEqual([service.pk for service in found], expected)
+                self.assertAlmostEqual(found[0].distance_km, distance[expected[0]])
+
+    def test_moving_a_service_moves_its_cell(self, run_in_background):
+        service = self.make_service('Copy Hub', 0.5, 0.5)
+        self.assertEqual(nearest_services(*self.ORIGIN), [])
+
+        service.latitude, service.longitude = 0.011, -0.002
+        service.save(update_fields=['latitude', 'longitude'])
+        self.assertEqual(Service.objects.get(pk=service.pk).geo_cell, cell_for(0.011, -0.002))
+        self.assertEqual(nearest_services(*self.ORIGIN), [service])
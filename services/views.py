@@ -2,9 +2,14 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from core.places import get_gazetteer, resolve_place
+from .geo import nearest_services
+from .hours import open_at
 from .models import Service, ServiceReview
 from .forms import ServiceForm, ServiceReviewForm
 
+NEAREST_LIMIT = 30
+
 
 def service_directory(request):
     """List all services"""
@@ -16,10 +21,20 @@ def service_directory(request):
 
     if category:
         services = services.filter(category=category)
+    if request.GET.get('open_now'):
+        services = open_at(services)
+    near = None
     if location:
-        services = services.filter(location__icontains=location)
-
-    return render(request, 'services/directory.html', {'services': services})
+        # A known place lists the nearest services first; other text is a substring match
+        place_id = resolve_place(location)
+        if place_id is not None:
+            near = location
+            latitude, longitude = get_gazetteer()['coords'][place_id]
+            services = nearest_services(latitude, longitude, k=NEAREST_LIMIT, queryset=services)
+        else:
+            services = services.filter(location__icontains=location)
+
+    return render(request, 'services/directory.html', {'services': services, 'near': near})
 
 
 def service_detail(request, service_id):
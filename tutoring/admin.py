@@ -1,10 +1,22 @@
 from django.contrib import admin
-from .models import Subject, Tutor, Session, Review, TutorApplication
+from .models import (SubjectCategory, Subject, Tutor, Session, Review, TutorApplication, EarningsEntry,
+                     MonthlyEarnings, CalendarFeedToken, SessionReminder, TutorSearchDocument,
+                     SubjectRateSnapshot)
+
+@admin.register(SubjectCategory)
+class SubjectCategoryAdmin(admin.ModelAdmin):
+    list_display = ['name', 'parent', 'tutor_count']
+    list_filter = ['parent']
+    search_fields = ['name']
+    prepopulated_fields = {'slug': ('name',)}
+    readonly_fields = ['tutor_count']
 
 @admin.register(Subject)
 class SubjectAdmin(admin.ModelAdmin):
-    list_display = ['name', 'category', 'icon']
+    list_display = ['name', 'category', 'taxonomy', 'tutor_count', 'icon']
+    list_filter = ['taxonomy']
     search_fields = ['name', 'category']
+    readonly_fields = ['tutor_count']
 
 @admin.register(Tutor)
 class TutorAdmin(admin.ModelAdmin):
@@ -29,3 +41,45 @@ class TutorApplicationAdmin(admin.ModelAdmin):
     list_display = ['user', 'status', 'applied_at', 'reviewed_by']
     list_filter = ['status', 'applied_at']
     search_fields = ['user__username']
+
+@admin.register(EarningsEntry)
+class EarningsEntryAdmin(admin.ModelAdmin):
+    list_display = ['tutor', 'entry_type', 'amount', 'hours', 'month', 'created_at']
+    list_filter = ['entry_type', 'month']
+    search_fields = ['tutor__user__username']
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+@admin.register(MonthlyEarnings)
+class MonthlyEarningsAdmin(admin.ModelAdmin):
+    list_display = ['tutor', 'month', 'sessions_completed', 'hours_taught', 'amount_earned',
+                    'amount_paid', 'amount_refunded', 'net_paid']
+    list_filter = ['month']
+    search_fields = ['tutor__user__username']
+
+@admin.register(CalendarFeedToken)
+class CalendarFeedTokenAdmin(admin.ModelAdmin):
+    list_display = ['user', 'created_at']
+    search_fields = ['user__username']
+
+@admin.register(SessionReminder)
+class SessionReminderAdmin(admin.ModelAdmin):
+    list_display = ['session', 'kind', 'sent_at']
+    list_filter = ['kind']
+
+@admin.register(TutorSearchDocument)
+class TutorSearchDocumentAdmin(admin.ModelAdmin):
+    list_display = ['full_name', 'primary_subject_name', 'hourly_rate', 'rating', 'completion_score',
+                    'is_available', 'updated_at']
+    list_filter = ['is_available', 'is_verified', 'year_of_study']
+    search_fields = ['full_name', 'username', 'subject_names']
+
+@admin.register(SubjectRateSnapshot)
+class SubjectRateSnapshotAdmin(admin.ModelAdmin):
+    list_display = ['__str__', 'tutor_count', 'rate_p25', 'rate_median', 'rate_p75',
+                    'median_session_minutes', 'conversion_rate', 'computed_at']
+    search_fields = ['subject__name']
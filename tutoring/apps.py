@@ -3,4 +3,7 @@ from django.apps import AppConfig
 
 class TutoringConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'tutoring'
\ No newline at end of file
+    name = 'tutoring'
+
+    def ready(self):
+        from . import signals  # noqa: F401
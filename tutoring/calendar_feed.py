@@ -0,0 +1,141 @@
+# tutoring/calendar_feed.py
+import hashlib
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.core.cache import cache
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+
+from .models import Session, Tutor, CalendarFeedToken
+
+FEED_CACHE_TIMEOUT = 60 * 60 * 24
+UPCOMING_STATUSES = ['pending', 'confirmed']
+
+
+def get_feed_version(user_id):
+    """
+    Fingerprint of the user's sessions, read from the database so every
+    worker agrees on it: the latest change plus the count (deletes lower it)
+    """
+    state = Session.objects.filter(
+        Q(student_id=user_id) | Q(tutor__user_id=user_id)
+    ).aggregate(changed=Max('updated_at'), total=Count('id'))
+    changed = state['changed'].timestamp() if state['changed'] else 0
+    return f"{changed:.6f}:{state['total']}"
+
+
+def get_user_id_for_token(token):
+    # Not cached: a reset token must stop working in every worker at once
+    return CalendarFeedToken.objects.filter(token=token).values_list('user_id', flat=True).first()
+
+
+def get_feed_etag(user_id):
+    """ETag changes when a relevant session changes or the day rolls over"""
+    raw = f'{user_id}:{get_feed_version(user_id)}:{timezone.localdate().isoformat()}'
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def get_feed_body(user_id, etag=None):
+    """Rendered .ics body for a user, cached per ETag"""
+    key = f'tutoring:calendar:body:{user_id}:{etag or get_feed_etag(user_id)}'
+    body = cache.get(key)
+    if body is None:
+        body = build_calendar(user_id)
+        cache.set(key, body, FEED_CACHE_TIMEOUT)
+    return body
+
+
+def get_upcoming_sessions(user_id):
+    """Upcoming sessions as student and as tutor, served by the (x, status, date) indexes"""
+    today = timezone.localdate()
+    sessions = list(
+        Session.objects.filter(
+            student_id=user_id, status__in=UPCOMING_STATUSES, date__gte=today
+        ).select_related('tutor__user', 'subject')
+    )
+
+    tutor_id = Tutor.objects.filter(user_id=user_id).values_list('id', flat=True).first()
+    if tutor_id:
+        sessions += list(
+            Session.objects.filter(
+                tutor_id=tutor_id, status__in=UPCOMING_STATUSES, date__gte=today
+            ).select_related('student', 'subject')
+        )
+
+    sessions.sort(key=lambda s: (s.date, s.start_time))
+    return sessions, tutor_id
+
+
+def _escape(text):
+    return (str(text).replace('\\', '\\\\').replace(';', '\\;')
+            .replace(',', '\\,').replace('\r\n', '\\n').replace('\n', '\\n'))
+
+
+def _fold(line):
+    """Fold content lines longer than 75 octets (RFC 5545 3.1)"""
+    encoded = line.encode('utf-8')
+    if len(encoded) <= 75:
+        return line
+    parts = []
+    while encoded:
+        size = 75 if not parts else 74
+        # Don't split a multi-byte character
+        while size < len(encoded) and (encoded[size] & 0xC0) == 0x80:
+            size -= 1
+        chunk = encoded[:size]
+        parts.append(chunk.decode('utf-8'))
+        encoded = encoded[len(chunk):]
+    return '\r\n '.join(parts)
+
+
+def _utc(d, t):
+    value = timezone.make_aware(datetime.combine(d, t), timezone.get_current_timezone())
+    return value.astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+def build_calendar(user_id):
+    sessions, tutor_id = get_upcoming_sessions(user_id)
+    stamp = datetime.now(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+    lines = [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        'PRODID:-//Campus Essentials Hub//Tutoring Sessions//EN',
+        'CALSCALE:GREGORIAN',
+        'METHOD:PUBLISH',
+        'X-WR-CALNAME:Tutoring Sessions',
+    ]
+
+    for session in sessions:
+        as_tutor = session.tutor_id == tutor_id
+        if as_tutor:
+            summary = f"Tutoring {session.student.get_full_name() or session.student.username}"
+        else:
+            summary = f"Session with {session.tutor.full_name}"
+        if session.subject:
+            summary += f" ({session.subject.name})"
+
+        end_date = session.date
+        if session.end_time <= session.start_time:
+            end_date += timedelta(days=1)
+
+        location = session.get_location_display()
+        if session.location_details:
+            location = f"{location} - {session.location_details}"
+
+        lines += [
+            'BEGIN:VEVENT',
+            f'UID:session-{session.id}@campus-essentials-hub',
+            f'DTSTAMP:{stamp}',
+            f'DTSTART:{_utc(session.date, session.start_time)}',
+            f'DTEND:{_utc(end_date, session.end_time)}',
+            f'SUMMARY:{_escape(summary)}',
+            f'LOCATION:{_escape(location)}',
+            f'DESCRIPTION:{_escape(session.topic or session.notes or "")}',
+            f'STATUS:{"CONFIRMED" if session.status == "confirmed" else "TENTATIVE"}',
+            f'URL:/tutoring/sessions/{session.id}/',
+            'END:VEVENT',
+        ]
+
+    lines.append('END:VCALENDAR')
+    return '\r\n'.join(_fold(line) for line in lines) + '\r\n'
@@ -0,0 +1,183 @@
+# tutoring/ledger.py
+from decimal import Decimal
+
+from django.db import IntegrityError, transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from .models import EarningsEntry, MonthlyEarnings, Tutor, TutorSearchDocument
+
+
+def month_start(value):
+    """Return the first day of the month for a date or datetime"""
+    if hasattr(value, 'date'):
+        value = timezone.localtime(value).date() if timezone.is_aware(value) else value.date()
+    return value.replace(day=1)
+
+
+def session_hours(session):
+    return (Decimal(session.duration or 0) / Decimal(60)).quantize(Decimal('0.01'))
+
+
+def _transitions(session, previous):
+    """[(entry_type, when)] produced by moving a session from `previous` to its current state"""
+    old_status = previous['status'] if previous else None
+    old_payment = previous['payment_status'] if previous else None
+
+    entries = []
+    if session.status == 'completed' and old_status != 'completed':
+        entries.append(('completed', session.completed_at))
+    # A refund implies the payment, which may not have been recorded yet
+    # (e.g. paid and refunded within one reconciliation import)
+    if session.payment_status in ('paid', 'refunded') and old_payment not in ('paid', 'refunded'):
+        entries.append(('paid', None))
+    if session.payment_status == 'refunded' and old_payment != 'refunded':
+        entries.append(('refunded', None))
+    return entries
+
+
+def record_session_changes(session, previous=None):
+    """
+    Append ledger entries for the status/payment transitions of a session.
+
+    `previous` is the stored {'status', 'payment_status'} before the save (None
+    for new sessions). Must run inside the transaction that saved the session.
+    """
+    for entry_type, when in _transitions(session, previous):
+        _append_entry(session, entry_type, when)
+
+
+def record_bulk_session_changes(changes):
+    """
+    Ledger entries for many (session, previous) pairs at once: one insert for
+    the entries and one rollup update per tutor/month/type. The sessions must
+    be locked in the current transaction so no concurrent save records them.
+    """
+    now = timezone.now()
+    entries = [
+        _build_entry(session, entry_type, when or now)
+        for session, previous in changes
+        for entry_type, when in _transitions(session, previous)
+    ]
+    if not entries:
+        return 0
+
+    existing = set(EarningsEntry.objects.filter(
+        session_id__in={entry.session_id for entry in entries}
+    ).values_list('session_id', 'entry_type'))
+    entries = [entry for entry in entries if (entry.session_id, entry.entry_type) not in existing]
+    EarningsEntry.objects.bulk_create(entries, batch_size=500)
+
+    groups = {}
+    for entry in entries:
+        key = (entry.tutor_id, entry.month, entry.entry_type)
+        count, amount, hours = groups.get(key, (0, Decimal('0.00'), Decimal('0.00')))
+        groups[key] = (count + 1, amount + entry.amount, hours + entry.hours)
+    for (tutor_id, month, entry_type), (count, amount, hours) in groups.items():
+        _apply_to_rollup(tutor_id, month, entry_type, amount, hours, count)
+    return len(entries)
+
+
+def _build_entry(session, entry_type, when):
+    return EarningsEntry(
+        tutor_id=session.tutor_id,
+        session=session,
+        entry_type=entry_type,
+        amount=session.amount or Decimal('0.00'),
+        hours=session_hours(session) if entry_type == 'completed' else Decimal('0.00'),
+        month=month_start(when),
+        created_at=when,
+    )
+
+
+def _append_entry(session, entry_type, when=None):
+    """Write one ledger entry and apply it to the monthly rollup atomically"""
+    entry = _build_entry(session, entry_type, when or timezone.now())
+
+    try:
+        with transaction.atomic():
+            entry.save(force_insert=True)
+    except IntegrityError:
+        # Already recorded by a concurrent or earlier save
+        return False
+
+    _apply_to_rollup(entry.tutor_id, entry.month, entry_type, entry.amount, entry.hours)
+    return True
+
+
+def _apply_to_rollup(tutor_id, month, entry_type, amount, hours, count=1):
+    MonthlyEarnings.objects.get_or_create(tutor_id=tutor_id, month=month)
+
+    updates = {'version': F('version') + 1}
+    if entry_type == 'completed':
+        updates.update(
+            sessions_completed=F('sessions_completed') + count,
+            hours_taught=F('hours_taught') + hours,
+            amount_earned=F('amount_earned') + amount,
+        )
+        Tutor.objects.filter(pk=tutor_id).update(
+            total_sessions=F('total_sessions') + count,
+            total_hours=F('total_hours') + hours,
+        )
+        TutorSearchDocument.objects.filter(pk=tutor_id).update(
+            total_sessions=F('total_sessions') + count,
+            total_hours=F('total_hours') + hours,
+        )
+    elif entry_type == 'paid':
+        updates['amount_paid'] = F('amount_paid') + amount
+    elif entry_type == 'refunded':
+        updates['amount_refunded'] = F('amount_refunded') + amount
+
+    MonthlyEarnings.objects.filter(tutor_id=tutor_id, month=month).update(**updates)
+
+
+def get_month_rollup(tutor, month=None):
+    """Rollup row for a tutor/month, or an unsaved empty one"""
+    month = month_start(month or timezone.now())
+    rollup = MonthlyEarnings.objects.filter(tutor=tutor, month=month).first()
+    return rollup or MonthlyEarnings(tutor=tutor, month=month)
+
+
+def get_lifetime_totals(tutor):
+    """Totals across all monthly rollups (one row per month, so this stays small)"""
+    totals = MonthlyEarnings.objects.filter(tutor=tutor).aggregate(
+        earned=Sum('amount_earned'),
+        paid=Sum('amount_paid'),
+        refunded=Sum('amount_refunded'),
+    )
+    return {
+        'earned': totals['earned'] or Decimal('0.00'),
+        'net_paid': (totals['paid'] or Decimal('0.00')) - (totals['refunded'] or Decimal('0.00')),
+    }
+
+
+@transaction.atomic
+def rebuild_ledger(tutor=None):
+    """
+    Rebuild ledger, rollups and tutor stats from the session table.
+    Used to backfill sessions that predate the ledger.
+    """
+    from .models import Session
+
+    tutors = Tutor.objects.all() if tutor is None else Tutor.objects.filter(pk=tutor.pk)
+    tutor_ids = list(tutors.values_list('id', flat=True))
+
+    EarningsEntry.objects.filter(tutor_id__in=tutor_ids).delete()
+    MonthlyEarnings.objects.filter(tutor_id__in=tutor_ids).delete()
+    tutors.update(total_sessions=0, total_hours=0)
+    TutorSearchDocument.objects.filter(tutor_id__in=tutor_ids).update(total_sessions=0, total_hours=0)
+
+    sessions = Session.objects.filter(tutor_id__in=tutor_ids).filter(
+        status='completed'
+    ) | Session.objects.filter(tutor_id__in=tutor_ids, payment_status__in=['paid', 'refunded'])
+
+    count = 0
+    for session in sessions.distinct().iterator(chunk_size=500):
+        if session.status == 'completed':
+            _append_entry(session, 'completed', session.completed_at or session.updated_at)
+        if session.payment_status in ('paid', 'refunded'):
+            _append_entry(session, 'paid', session.updated_at)
+        if session.payment_status == 'refunded':
+            _append_entry(session, 'refunded', session.updated_at)
+        count += 1
+    return count
@@ -0,0 +1,51 @@
+# tutoring/management/commands/benchmark_tutor_matching.py
+import time
+import numpy as np
+from django.core.management.base import BaseCommand
+from tutoring.matching import TutorIndex, TutorMatcher, SLOTS_PER_WEEK, DAYS
+
+
+class Command(BaseCommand):
+    help = 'Benchmarks tutor matching on a synthetic index (default 10k tutors)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tutors', type=int, default=10000)
+        parser.add_argument('--subjects', type=int, default=80)
+        parser.add_argument('--runs', type=int, default=200)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = np.random.default_rng(options['seed'])
+        n, n_subjects = options['tutors'], options['subjects']
+
+        index = TutorIndex(
+            tutor_ids=np.arange(1, n + 1),
+            ratings=rng.uniform(0, 5, n),
+            rates=rng.uniform(5, 100, n),
+            subject_ids=np.arange(1, n_subjects + 1),
+            subjects=rng.random((n, n_subjects)) < 0.05,
+            slots=rng.random((n, SLOTS_PER_WEEK)) < 0.15,
+        )
+        matcher = TutorMatcher(index=index)
+
+        timings = []
+        for _ in range(options['runs']):
+            criteria = {
+                'subject_ids': rng.choice(np.arange(1, n_subjects + 1), size=2, replace=False).tolist(),
+                'max_rate': float(rng.uniform(10, 60)),
+                'slots': [(DAYS[int(rng.integers(7))], int(rng.integers(8, 20))) for _ in range(4)],
+                'affinity': {int(t): int(rng.integers(1, 5)) for t in rng.integers(1, n, 5)},
+            }
+            started = time.perf_counter()
+            matcher.top(limit=10, **criteria)
+            timings.append((time.perf_counter() - started) * 1000)
+
+        timings = np.array(timings)
+        self.stdout.write(
+            f"{n} tutors x {options['runs']} requests: "
+            f"mean {timings.mean():.2f}ms, p95 {np.percentile(timings, 95):.2f}ms, max {timings.max():.2f}ms"
+        )
+        if np.percentile(timings, 95) < 20:
+            self.stdout.write(self.style.SUCCESS('Within the 20ms budget'))
+        else:
+            self.stdout.write(self.style.WARNING('Over the 20ms budget'))
@@ -0,0 +1,30 @@
+# tutoring/management/commands/build_earnings_statements.py
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from tutoring.ledger import month_start
+from tutoring.statements import build_month_statements
+
+
+class Command(BaseCommand):
+    help = "Renders every tutor's earnings statement PDF for a month in parallel"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--month', help='YYYY-MM (default: last month)')
+        parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+        parser.add_argument('--tutor', type=int, action='append', help='Only this tutor id (repeatable)')
+
+    def handle(self, *args, **options):
+        if options['month']:
+            try:
+                month = datetime.strptime(options['month'], '%Y-%m').date()
+            except ValueError:
+                raise CommandError('--month must look like 2024-09')
+        else:
+            month = month_start(month_start(timezone.now()) - timedelta(days=1))
+
+        rendered, cached = build_month_statements(month, workers=options['workers'], tutor_ids=options['tutor'])
+        self.stdout.write(self.style.SUCCESS(
+            f'{month:%Y-%m}: rendered {rendered} statements, {cached} already up to date'
+        ))
@@ -0,0 +1,19 @@
+# tutoring/management/commands/build_subject_taxonomy.py
+from django.core.management.base import BaseCommand
+from tutoring.taxonomy import categories_from_subjects, rebuild_taxonomy
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the subject category closure table, tutor memberships and tutor counts'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--from-subjects', action='store_true',
+                            help="First create top-level categories from subjects' category text")
+
+    def handle(self, *args, **options):
+        if options['from_subjects']:
+            created = categories_from_subjects()
+            self.stdout.write(f'Created {created} categories from subject data')
+
+        rebuild_taxonomy()
+        self.stdout.write(self.style.SUCCESS('Subject taxonomy rebuilt'))
@@ -0,0 +1,22 @@
+# tutoring/management/commands/rebuild_earnings_ledger.py
+from django.core.management.base import BaseCommand, CommandError
+from tutoring.models import Tutor
+from tutoring.ledger import rebuild_ledger
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the earnings ledger, monthly rollups and tutor stats from sessions'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tutor', type=int, help='Only rebuild this tutor id')
+
+    def handle(self, *args, **options):
+        tutor = None
+        if options['tutor']:
+            try:
+                tutor = Tutor.objects.get(pk=options['tutor'])
+            except Tutor.DoesNotExist:
+                raise CommandError(f"Tutor {options['tutor']} does not exist")
+
+        count = rebuild_ledger(tutor)
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt ledger from {count} sessions'))
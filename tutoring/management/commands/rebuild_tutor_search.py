@@ -0,0 +1,11 @@
+# tutoring/management/commands/rebuild_tutor_search.py
+from django.core.management.base import BaseCommand
+from tutoring.search import rebuild_all_documents
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the precomputed tutor search documents used by the tutor list'
+
+    def handle(self, *args, **options):
+        count = rebuild_all_documents()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt search documents for {count} tutors'))
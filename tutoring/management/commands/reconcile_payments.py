@@ -0,0 +1,35 @@
+# tutoring/management/commands/reconcile_payments.py
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+from tutoring.reconciliation import reconcile_file, CHUNK_SIZE
+
+
+class Command(BaseCommand):
+    help = 'Marks sessions paid/refunded from a payment provider CSV or JSONL export'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Provider export (.csv, .jsonl or .ndjson)')
+        parser.add_argument('--report', help='Write unmatched rows to this CSV file')
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE,
+                            help='Rows per transaction')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Match and report without changing any sessions')
+
+    def handle(self, *args, **options):
+        if not os.path.exists(options['path']):
+            raise CommandError(f"{options['path']} does not exist")
+
+        report = open(options['report'], 'w', newline='') if options['report'] else None
+        try:
+            stats = reconcile_file(options['path'], report=report, dry_run=options['dry_run'],
+                                   chunk_size=options['chunk_size'])
+        finally:
+            if report:
+                report.close()
+
+        for key in sorted(stats):
+            self.stdout.write(f'{key}: {stats[key]}')
+        mismatches = sum(count for key, count in stats.items() if key.startswith('mismatch_'))
+        style = self.style.WARNING if mismatches else self.style.SUCCESS
+        self.stdout.write(style(f"Processed {stats['rows']} rows, {mismatches} mismatches"))
@@ -0,0 +1,25 @@
+# tutoring/management/commands/send_session_reminders.py
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from tutoring.reminders import SessionReminderScheduler
+
+
+class Command(BaseCommand):
+    help = 'Sends reminder notifications for upcoming tutoring sessions (run from cron)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--window-hours', type=int, default=6,
+                            help='Size of each scan window in hours')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Count due reminders without sending or moving watermarks')
+
+    def handle(self, *args, **options):
+        scheduler = SessionReminderScheduler(
+            window=timedelta(hours=options['window_hours']),
+            dry_run=options['dry_run'],
+        )
+        results = scheduler.run()
+
+        for kind, sent in results.items():
+            self.stdout.write(f'{kind}: {sent} reminder(s)')
+        self.stdout.write(self.style.SUCCESS('Session reminders processed'))
@@ -0,0 +1,15 @@
+# tutoring/management/commands/snapshot_rate_stats.py
+from django.core.management.base import BaseCommand
+from tutoring.market import build_rate_snapshots, LOOKBACK_DAYS
+
+
+class Command(BaseCommand):
+    help = 'Recomputes per-subject rate percentiles and booking stats (run from cron)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--lookback-days', type=int, default=LOOKBACK_DAYS,
+                            help='How far back to look at sessions')
+
+    def handle(self, *args, **options):
+        count = build_rate_snapshots(lookback_days=options['lookback_days'])
+        self.stdout.write(self.style.SUCCESS(f'Wrote {count} rate snapshots'))
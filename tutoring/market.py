@@ -0,0 +1,121 @@
+# tutoring/market.py
+from datetime import timedelta
+from decimal import Decimal
+
+import numpy as np
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Session, Subject, SubjectRateSnapshot, Tutor
+
+LOOKBACK_DAYS = 180
+PERCENTILES = (10, 25, 50, 75, 90)
+
+
+def _group(keys, values):
+    """{key: array of values} with one sort instead of a pass per key"""
+    if not len(keys):
+        return {}
+    order = np.argsort(keys, kind='stable')
+    keys, values = keys[order], values[order]
+    unique, starts = np.unique(keys, return_index=True)
+    return dict(zip(unique.tolist(), np.split(values, starts[1:])))
+
+
+def _money(value):
+    return Decimal(str(round(float(value), 2)))
+
+
+def rate_statistics(rates):
+    """Percentile fields for SubjectRateSnapshot from an array of hourly rates"""
+    if not len(rates):
+        return {'tutor_count': 0}
+    p10, p25, p50, p75, p90 = np.percentile(rates, PERCENTILES)
+    return {
+        'tutor_count': len(rates),
+        'rate_min': _money(rates.min()),
+        'rate_p10': _money(p10),
+        'rate_p25': _money(p25),
+        'rate_median': _money(p50),
+        'rate_p75': _money(p75),
+        'rate_p90': _money(p90),
+        'rate_max': _money(rates.max()),
+    }
+
+
+def session_statistics(durations, completed):
+    """Booking fields from parallel arrays of durations (minutes) and completed flags"""
+    booked = len(durations)
+    done = int(completed.sum()) if booked else 0
+    return {
+        'median_session_minutes': int(np.median(durations[completed])) if done else 0,
+        'sessions_booked': booked,
+        'sessions_completed': done,
+        'conversion_rate': Decimal(str(round(done / booked, 4))) if booked else Decimal('0'),
+    }
+
+
+def build_rate_snapshots(now=None, lookback_days=LOOKBACK_DAYS):
+    """
+    Recompute every subject's snapshot plus the overall one. Reads each table
+    once into arrays and groups them in NumPy; returns the number of rows written.
+    """
+    now = now or timezone.now()
+    today = timezone.localdate(now)
+
+    links = np.array(list(Tutor.subjects.through.objects.filter(
+        tutor__is_available=True
+    ).values_list('subject_id', 'tutor__hourly_rate')), dtype=np.float64).reshape(-1, 2)
+    all_rates = np.array(list(Tutor.objects.filter(is_available=True).values_list(
+        'hourly_rate', flat=True
+    )), dtype=np.float64)
+
+    # Only sessions whose date has passed have a known outcome
+    sessions = np.array(list(Session.objects.filter(
+        date__gte=today - timedelta(days=lookback_days), date__lt=today,
+    ).values_list('subject_id', 'duration', 'status')), dtype=object).reshape(-1, 3)
+    session_subjects = np.array([s if s is not None else -1 for s in sessions[:, 0]], dtype=np.int64)
+    durations = sessions[:, 1].astype(np.float64)
+    completed = sessions[:, 2] == 'completed'
+
+    rates_by_subject = _group(links[:, 0].astype(np.int64), links[:, 1])
+    durations_by_subject = _group(session_subjects, durations)
+    completed_by_subject = _group(session_subjects, completed)
+    empty = np.zeros(0)
+
+    snapshots = [SubjectRateSnapshot(
+        subject=None, computed_at=now,
+        **rate_statistics(all_rates), **session_statistics(durations, completed),
+    )]
+    for subject_id in Subject.objects.values_list('id', flat=True):
+        snapshots.append(SubjectRateSnapshot(
+            subject_id=subject_id, computed_at=now,
+            **rate_statistics(rates_by_subject.get(subject_id, empty)),
+            **session_statistics(durations_by_subject.get(subject_id, empty),
+                                 completed_by_subject.get(subject_id, np.zeros(0, dtype=bool))),
+        ))
+
+    with transaction.atomic():
+        SubjectRateSnapshot.objects.all().delete()
+        SubjectRateSnapshot.objects.bulk_create(snapshots, batch_size=500)
+    return len(snapshots)
+
+
+def get_rate_snapshot(subject_id=None):
+    """Latest snapshot for a subject id, or the overall one; None before the first run"""
+    return SubjectRateSnapshot.objects.filter(subject_id=subject_id).first()
+
+
+def rate_guide():
+    """{subject id or 'all': typical rate band} for the become-tutor form"""
+    guide = {}
+    for snapshot in SubjectRateSnapshot.objects.filter(tutor_count__gt=0):
+        guide[snapshot.subject_id or 'all'] = {
+            'low': float(snapshot.rate_p25),
+            'median': float(snapshot.rate_median),
+            'high': float(snapshot.rate_p75),
+            'tutors': snapshot.tutor_count,
+            'session_minutes': snapshot.median_session_minutes,
+            'conversion': snapshot.conversion_percentage,
+        }
+    return guide
@@ -0,0 +1,219 @@
+# tutoring/matching.py
+import numpy as np
+from django.db.models import Count
+
+from core.versions import bump_version, get_version
+
+from .models import Tutor, Session
+
+DAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+SLOTS_PER_WEEK = 7 * 24
+
+INDEX_VERSION = 'tutoring.matching'
+# Tutor fields the index is built from; saves touching nothing else leave it alone
+INDEX_FIELDS = ('is_available', 'rating', 'hourly_rate', 'availability')
+
+
+def slot_index(day, hour):
+    """Column of a (day name, hour) pair in the weekly availability matrix"""
+    return DAYS.index(day.lower()) * 24 + int(hour)
+
+
+def bump_index_version():
+    """Mark every process's preloaded tutor arrays as stale"""
+    bump_version(INDEX_VERSION)
+
+
+class TutorIndex:
+    """Column arrays describing every available tutor, one row per tutor"""
+
+    def __init__(self, tutor_ids, ratings, rates, subject_ids, subjects, slots, version=None):
+        self.tutor_ids = np.asarray(tutor_ids, dtype=np.int64)
+        self.ratings = np.asarray(ratings, dtype=np.float32)
+        self.rates = np.asarray(rates, dtype=np.float32)
+        self.subject_ids = np.asarray(subject_ids, dtype=np.int64)
+        self.subjects = subjects      # bool[n_tutors, n_subjects]
+        self.slots = slots            # bool[n_tutors, 168]
+        self.version = version
+        self._subject_column = {int(sid): col for col, sid in enumerate(self.subject_ids)}
+        self._row = {int(tid): row for row, tid in enumerate(self.tutor_ids)}
+
+    def __len__(self):
+        return len(self.tutor_ids)
+
+    @classmethod
+    def build(cls, version=None):
+        rows = list(Tutor.objects.filter(is_available=True).values_list(
+            'id', 'rating', 'hourly_rate', 'availability'
+        ).order_by('id'))
+        tutor_ids = [row[0] for row in rows]
+        row_of = {tutor_id: i for i, tutor_id in enumerate(tutor_ids)}
+
+        links = list(Tutor.subjects.through.objects.filter(
+            tutor_id__in=tutor_ids
+        ).values_list('tutor_id', 'subject_id'))
+        subject_ids = sorted({subject_id for _, subject_id in links})
+        column_of = {subject_id: i for i, subject_id in enumerate(subject_ids)}
+
+        subjects = np.zeros((len(rows), len(subject_ids)), dtype=bool)
+        if links:
+            link_rows = np.fromiter((row_of[t] for t, _ in links), dtype=np.int64, count=len(links))
+            link_cols = np.fromiter((column_of[s] for _, s in links), dtype=np.int64, count=len(links))
+            subjects[link_rows, link_cols] = True
+
+        slots = np.zeros((len(rows), SLOTS_PER_WEEK), dtype=bool)
+        for i, (_, _, _, availability) in enumerate(rows):
+            for day, hours in (availability or {}).items():
+                if day not in DAYS or not isinstance(hours, list):
+                    continue
+                for hour in hours:
+                    try:
+                        if 0 <= int(hour) < 24:
+                            slots[i, slot_index(day, hour)] = True
+                    except (TypeError, ValueError):
+                        continue
+
+        return cls(
+            tutor_ids,
+            [float(row[1]) for row in rows],
+            [float(row[2]) for row in rows],
+            subject_ids, subjects, slots, version=version,
+        )
+
+    def subject_columns(self, subject_ids):
+        return [self._subject_column[int(s)] for s in subject_ids if int(s) in self._subject_column]
+
+    def rows_for(self, tutor_ids):
+        return [self._row[int(t)] for t in tutor_ids if int(t) in self._row]
+
+
+_index = None
+
+
+def get_index():
+    """Process-local TutorIndex, rebuilt when the version stored in the database moves"""
+    global _index
+    version = get_version(INDEX_VERSION)
+    if _index is None or _index.version != version:
+        _index = TutorIndex.build(version=version)
+    return _index
+
+
+class TutorMatcher:
+    """
+    Scores every available tutor for a student's request in one vectorized pass.
+
+    Components, each in [0, 1]:
+      subject       share of the requested subjects the tutor teaches
+      rating        rating / 5
+      price         1 within budget, falling to 0 at 1.5x budget
+      availability  share of the requested weekly slots the tutor has free
+      affinity      grows with completed sessions between this student and tutor
+    """
+
+    WEIGHTS = {
+        'subject': 0.35,
+        'rating': 0.20,
+        'price': 0.15,
+        'availability': 0.20,
+        'affinity': 0.10,
+    }
+
+    def __init__(self, index=None):
+        self.index = index if index is not None else get_index()
+
+    def score(self, subject_ids=(), max_rate=None, slots=(), affinity=None):
+        """Return {component: float32[n_tutors]} plus 'total'"""
+        index = self.index
+        n = len(index)
+
+        columns = index.subject_columns(subject_ids)
+        if subject_ids:
+            subject = (index.subjects[:, columns].sum(axis=1, dtype=np.float32) / len(subject_ids)
+                       if columns else np.zeros(n, dtype=np.float32))
+        else:
+            subject = np.ones(n, dtype=np.float32)
+
+        rating = np.clip(index.ratings / 5.0, 0, 1)
+
+        if max_rate:
+            max_rate = float(max_rate)
+            price = np.clip(1.0 - (index.rates - max_rate) / (0.5 * max_rate), 0, 1)
+        elif n:
+            spread = float(index.rates.max() - index.rates.min()) or 1.0
+            price = 1.0 - (index.rates - index.rates.min()) / spread
+        else:
+            price = np.zeros(0, dtype=np.float32)
+
+        slot_columns = [slot_index(day, hour) for day, hour in slots]
+        if slot_columns:
+            availability = index.slots[:, slot_columns].sum(axis=1, dtype=np.float32) / len(slot_columns)
+        else:
+            # No preference: reward having some availability published at all
+            availability = np.minimum(index.slots.sum(axis=1, dtype=np.float32) / 10.0, 1.0)
+
+        affinity_scores = np.zeros(n, dtype=np.float32)
+        if affinity:
+            rows = index.rows_for(affinity.keys())
+            counts = np.array([affinity[int(index.tutor_ids[r])] for r in rows], dtype=np.float32)
+            affinity_scores[rows] = 1.0 - 1.0 / (1.0 + counts)
+
+        components = {
+            'subject': subject,
+            'rating': rating.astype(np.float32),
+            'price': price.astype(np.float32),
+            'availability': availability.astype(np.float32),
+            'affinity': affinity_scores,
+        }
+        total = np.zeros(n, dtype=np.float32)
+        for name, weight in self.WEIGHTS.items():
+            total += weight * components[name]
+        components['total'] = total
+        return components
+
+    def top(self, limit=10, exclude_tutor_ids=(), subject_required=False, **criteria):
+        """
+        [(tutor_id, score, breakdown)] for the best `limit` tutors;
+        subject_required drops tutors teaching none of the requested subjects
+        """
+        components = self.score(**criteria)
+        total = components['total'].copy()
+        if len(total) == 0:
+            return []
+
+        excluded = self.index.rows_for(exclude_tutor_ids)
+        if excluded:
+            total[excluded] = -1.0
+        if subject_required:
+            total[components['subject'] == 0] = -1.0
+
+        limit = min(limit, len(total))
+        best = np.argpartition(-total, limit - 1)[:limit]
+        best = best[np.argsort(-total[best], kind='stable')]
+
+        results = []
+        for row in best:
+            if total[row] < 0:
+                continue
+            breakdown = {name: round(float(components[name][row]), 3) for name in self.WEIGHTS}
+            results.append((int(self.index.tutor_ids[row]), round(float(total[row]), 4), breakdown))
+        return results
+
+    def match(self, student=None, limit=10, **criteria):
+        """Top tutors for a student as [{'tutor', 'score', 'breakdown'}]"""
+        affinity = None
+        exclude = ()
+        if student is not None:
+            affinity = dict(Session.objects.filter(
+                student=student, status='completed'
+            ).values('tutor_id').annotate(n=Count('id')).values_list('tutor_id', 'n'))
+            exclude = Tutor.objects.filter(user=student).values_list('id', flat=True)
+
+        ranked = self.top(limit=limit, exclude_tutor_ids=list(exclude), affinity=affinity, **criteria)
+        tutors = Tutor.objects.select_related('user', 'primary_subject').in_bulk(
+            [tutor_id for tutor_id, _, _ in ranked]
+        )
+        return [
+            {'tutor': tutors[tutor_id], 'score': score, 'breakdown': breakdown}
+            for tutor_id, score, breakdown in ranked if tutor_id in tutors
+        ]
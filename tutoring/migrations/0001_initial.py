@@ -0,0 +1,170 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:19
+
+import django.core.validators
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Subject',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('category', models.CharField(max_length=50)),
+                ('icon', models.CharField(default='fas fa-book', max_length=50)),
+            ],
+            options={
+                'verbose_name': 'Subject',
+                'verbose_name_plural': 'Subjects',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Tutor',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year_of_study', models.CharField(choices=[('freshman', 'Freshman'), ('sophomore', 'Sophomore'), ('junior', 'Junior'), ('senior', 'Senior'), ('graduate', 'Graduate'), ('phd', 'PhD Student'), ('alumni', 'Alumni'), ('professional', 'Professional')], default='freshman', max_length=20)),
+                ('hourly_rate', models.DecimalField(decimal_places=2, default=20.0, max_digits=8, validators=[django.core.validators.MinValueValidator(5)])),
+                ('bio', models.TextField(blank=True, max_length=1000)),
+                ('qualifications', models.TextField(blank=True, max_length=500)),
+                ('teaching_experience', models.TextField(blank=True, max_length=500)),
+                ('availability', models.JSONField(blank=True, default=dict, help_text="JSON format: {'monday': [9,10,11], 'tuesday': [14,15,16], ...}")),
+                ('rating', models.DecimalField(decimal_places=2, default=0.0, max_digits=3)),
+                ('total_reviews', models.IntegerField(default=0)),
+                ('total_sessions', models.IntegerField(default=0)),
+                ('total_hours', models.DecimalField(decimal_places=2, default=0.0, max_digits=8)),
+                ('is_available', models.BooleanField(default=True)),
+                ('is_verified', models.BooleanField(default=False, help_text='Verified by campus staff')),
+                ('profile_picture', models.ImageField(blank=True, null=True, upload_to='tutor_profiles/')),
+                ('qr_code', models.ImageField(blank=True, null=True, upload_to='qr_codes/')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('contact_email', models.EmailField(blank=True, max_length=254)),
+                ('contact_phone', models.CharField(blank=True, max_length=20)),
+                ('preferred_contact', models.CharField(choices=[('email', 'Email'), ('phone', 'Phone'), ('whatsapp', 'WhatsApp'), ('in_app', 'In-App Messaging')], default='in_app', max_length=20)),
+                ('primary_subject', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='primary_tutors', to='tutoring.subject')),
+                ('subjects', models.ManyToManyField(blank=True, related_name='tutors', to='tutoring.subject')),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='tutor_profile', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Tutor',
+                'verbose_name_plural': 'Tutors',
+                'ordering': ['-rating', '-total_sessions'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Session',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('start_time', models.TimeField()),
+                ('end_time', models.TimeField()),
+                ('duration', models.IntegerField(default=60, help_text='Duration in minutes')),
+                ('topic', models.CharField(blank=True, max_length=200)),
+                ('location', models.CharField(choices=[('campus', 'On Campus'), ('online', 'Online'), ('library', 'Library'), ('other', 'Other Location')], default='campus', max_length=20)),
+                ('location_details', models.CharField(blank=True, max_length=200)),
+                ('notes', models.TextField(blank=True, help_text='Specific topics or questions')),
+                ('status', models.CharField(choices=[('pending', '⏳ Pending'), ('confirmed', '✅ Confirmed'), ('completed', '🎓 Completed'), ('cancelled', '❌ Cancelled'), ('no_show', '🚫 No Show')], default='pending', max_length=20)),
+                ('amount', models.DecimalField(decimal_places=2, default=0.0, max_digits=8, validators=[django.core.validators.MinValueValidator(0)])),
+                ('payment_status', models.CharField(choices=[('pending', 'Pending'), ('paid', 'Paid'), ('refunded', 'Refunded'), ('cancelled', 'Cancelled')], default='pending', max_length=20)),
+                ('payment_method', models.CharField(blank=True, max_length=50)),
+                ('transaction_id', models.CharField(blank=True, max_length=100)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('confirmed_at', models.DateTimeField(blank=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('cancelled_at', models.DateTimeField(blank=True, null=True)),
+                ('student_rating', models.IntegerField(blank=True, null=True, validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(5)])),
+                ('student_feedback', models.TextField(blank=True)),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='booked_sessions', to=settings.AUTH_USER_MODEL)),
+                ('subject', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='sessions', to='tutoring.subject')),
+                ('tutor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sessions', to='tutoring.tutor')),
+            ],
+            options={
+                'verbose_name': 'Session',
+                'verbose_name_plural': 'Sessions',
+                'ordering': ['-date', '-start_time'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Review',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rating', models.IntegerField(default=5, validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(5)])),
+                ('comment', models.TextField(blank=True, max_length=1000)),
+                ('knowledge', models.IntegerField(default=5, validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(5)])),
+                ('teaching_skill', models.IntegerField(default=5, validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(5)])),
+                ('communication', models.IntegerField(default=5, validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(5)])),
+                ('punctuality', models.IntegerField(default=5, validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(5)])),
+                ('is_verified', models.BooleanField(default=False, help_text='Review from actual session')),
+                ('helpful_count', models.IntegerField(default=0)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tutor_reviews', to=settings.AUTH_USER_MODEL)),
+                ('session', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='session_review', to='tutoring.session')),
+                ('tutor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reviews', to='tutoring.tutor')),
+            ],
+            options={
+                'verbose_name': 'Tutor Review',
+                'verbose_name_plural': 'Tutor Reviews',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='TutorApplication',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subjects', models.CharField(max_length=500)),
+                ('hourly_rate', models.DecimalField(decimal_places=2, max_digits=8)),
+                ('bio', models.TextField()),
+                ('qualifications', models.TextField()),
+                ('experience', models.TextField()),
+                ('status', models.CharField(choices=[('pending', 'Pending Review'), ('approved', 'Approved'), ('rejected', 'Rejected'), ('more_info', 'Needs More Info')], default='pending', max_length=20)),
+                ('admin_notes', models.TextField(blank=True)),
+                ('applied_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('reviewed_at', models.DateTimeField(blank=True, null=True)),
+                ('reviewed_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='reviewed_applications', to=settings.AUTH_USER_MODEL)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tutor_applications', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Tutor Application',
+                'verbose_name_plural': 'Tutor Applications',
+                'ordering': ['-applied_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='tutor',
+            index=models.Index(fields=['rating', 'is_available'], name='tutoring_tu_rating_93246a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tutor',
+            index=models.Index(fields=['hourly_rate', 'is_available'], name='tutoring_tu_hourly__dec452_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(fields=['tutor', 'status', 'date'], name='tutoring_se_tutor_i_43219c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(fields=['student', 'status', 'date'], name='tutoring_se_student_2b750a_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='session',
+            unique_together={('tutor', 'date', 'start_time')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='review',
+            unique_together={('tutor', 'student')},
+        ),
+    ]
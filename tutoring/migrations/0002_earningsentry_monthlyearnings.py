@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:19
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tutoring', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EarningsEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entry_type', models.CharField(choices=[('completed', 'Session Completed'), ('paid', 'Payment Received'), ('refunded', 'Payment Refunded')], max_length=20)),
+                ('amount', models.DecimalField(decimal_places=2, default=0.0, max_digits=10)),
+                ('hours', models.DecimalField(decimal_places=2, default=0.0, max_digits=8)),
+                ('month', models.DateField(help_text='First day of the month the entry is booked to')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('session', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='earnings_entries', to='tutoring.session')),
+                ('tutor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='earnings_entries', to='tutoring.tutor')),
+            ],
+            options={
+                'verbose_name': 'Earnings Entry',
+                'verbose_name_plural': 'Earnings Ledger',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['tutor', 'month'], name='tutoring_ea_tutor_i_41faec_idx')],
+                'constraints': [models.UniqueConstraint(fields=('session', 'entry_type'), name='unique_session_earnings_entry')],
+            },
+        ),
+        migrations.CreateModel(
+            name='MonthlyEarnings',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField(help_text='First day of the month')),
+                ('sessions_completed', models.IntegerField(default=0)),
+                ('hours_taught', models.DecimalField(decimal_places=2, default=0.0, max_digits=8)),
+                ('amount_earned', models.DecimalField(decimal_places=2, default=0.0, max_digits=10)),
+                ('amount_paid', models.DecimalField(decimal_places=2, default=0.0, max_digits=10)),
+                ('amount_refunded', models.DecimalField(decimal_places=2, default=0.0, max_digits=10)),
+                ('version', models.PositiveIntegerField(default=0, help_text='Bumped on every ledger entry')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('tutor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_earnings', to='tutoring.tutor')),
+            ],
+            options={
+                'verbose_name': 'Monthly Earnings',
+                'verbose_name_plural': 'Monthly Earnings',
+                'ordering': ['-month'],
+                'unique_together': {('tutor', 'month')},
+            },
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:19
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tutoring', '0003_calendarfeedtoken'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SessionReminder',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('day_before', '24 hours before'), ('hour_before', '1 hour before')], max_length=20)),
+                ('sent_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': 'Session Reminder',
+                'verbose_name_plural': 'Session Reminders',
+                'ordering': ['-sent_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(fields=['status', 'date'], name='tutoring_se_status_96ff42_idx'),
+        ),
+        migrations.AddField(
+            model_name='sessionreminder',
+            name='session',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reminders', to='tutoring.session'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='sessionreminder',
+            unique_together={('session', 'kind')},
+        ),
+    ]
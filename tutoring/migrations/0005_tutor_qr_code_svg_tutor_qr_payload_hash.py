@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tutoring', '0004_sessionreminder_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tutor',
+            name='qr_code_svg',
+            field=models.FileField(blank=True, null=True, upload_to='qr_codes/'),
+        ),
+        migrations.AddField(
+            model_name='tutor',
+            name='qr_payload_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+    ]
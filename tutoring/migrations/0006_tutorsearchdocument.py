@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:20
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tutoring', '0005_tutor_qr_code_svg_tutor_qr_payload_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TutorSearchDocument',
+            fields=[
+                ('tutor', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='tutoring.tutor')),
+                ('full_name', models.CharField(max_length=300)),
+                ('username', models.CharField(max_length=150)),
+                ('subject_names', models.CharField(blank=True, max_length=1000)),
+                ('subject_ids', models.CharField(blank=True, help_text='Comma-wrapped ids, e.g. ,3,7,', max_length=1000)),
+                ('primary_subject_id', models.IntegerField(blank=True, null=True)),
+                ('primary_subject_name', models.CharField(blank=True, max_length=100)),
+                ('year_of_study', models.CharField(max_length=20)),
+                ('search_text', models.TextField(blank=True, help_text='Lowercased names, subjects and bio')),
+                ('completion_score', models.IntegerField(default=0)),
+                ('rating', models.DecimalField(decimal_places=2, default=0.0, max_digits=3)),
+                ('total_reviews', models.IntegerField(default=0)),
+                ('hourly_rate', models.DecimalField(decimal_places=2, default=0.0, max_digits=8)),
+                ('total_sessions', models.IntegerField(default=0)),
+                ('total_hours', models.DecimalField(decimal_places=2, default=0.0, max_digits=8)),
+                ('availability_summary', models.CharField(blank=True, max_length=200)),
+                ('weekly_available_hours', models.IntegerField(default=0)),
+                ('is_available', models.BooleanField(default=True)),
+                ('is_verified', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Tutor Search Document',
+                'verbose_name_plural': 'Tutor Search Documents',
+                'ordering': ['-rating', '-total_sessions'],
+                'indexes': [models.Index(fields=['is_available', 'rating'], name='tutoring_tu_is_avai_bebc40_idx'), models.Index(fields=['is_available', 'hourly_rate'], name='tutoring_tu_is_avai_cbd498_idx'), models.Index(fields=['is_available', 'total_sessions'], name='tutoring_tu_is_avai_0ba8e4_idx'), models.Index(fields=['is_available', 'created_at'], name='tutoring_tu_is_avai_45c276_idx'), models.Index(fields=['is_available', 'full_name'], name='tutoring_tu_is_avai_cacc22_idx'), models.Index(fields=['is_available', 'year_of_study'], name='tutoring_tu_is_avai_cec7ba_idx')],
+            },
+        ),
+    ]
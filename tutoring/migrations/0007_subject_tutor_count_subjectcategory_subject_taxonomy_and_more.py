@@ -0,0 +1,64 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tutoring', '0006_tutorsearchdocument'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='subject',
+            name='tutor_count',
+            field=models.IntegerField(default=0, help_text='Available tutors teaching this subject'),
+        ),
+        migrations.CreateModel(
+            name='SubjectCategory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('slug', models.SlugField(max_length=120, unique=True)),
+                ('icon', models.CharField(default='fas fa-folder', max_length=50)),
+                ('tutor_count', models.IntegerField(default=0, help_text='Available tutors teaching anything under this node')),
+                ('parent', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='children', to='tutoring.subjectcategory')),
+            ],
+            options={
+                'verbose_name': 'Subject Category',
+                'verbose_name_plural': 'Subject Categories',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='subject',
+            name='taxonomy',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='subjects', to='tutoring.subjectcategory'),
+        ),
+        migrations.CreateModel(
+            name='SubjectCategoryClosure',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('depth', models.PositiveSmallIntegerField()),
+                ('ancestor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='descendant_links', to='tutoring.subjectcategory')),
+                ('descendant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ancestor_links', to='tutoring.subjectcategory')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['descendant', 'depth'], name='tutoring_su_descend_ee3ee7_idx')],
+                'constraints': [models.UniqueConstraint(fields=('ancestor', 'descendant'), name='unique_category_closure_pair')],
+            },
+        ),
+        migrations.CreateModel(
+            name='TutorCategory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tutor_links', to='tutoring.subjectcategory')),
+                ('tutor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='category_links', to='tutoring.tutor')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('category', 'tutor'), name='unique_tutor_category')],
+            },
+        ),
+    ]
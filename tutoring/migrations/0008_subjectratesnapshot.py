@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:20
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tutoring', '0007_subject_tutor_count_subjectcategory_subject_taxonomy_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubjectRateSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tutor_count', models.IntegerField(default=0)),
+                ('rate_min', models.DecimalField(decimal_places=2, default=0, max_digits=8)),
+                ('rate_p10', models.DecimalField(decimal_places=2, default=0, max_digits=8)),
+                ('rate_p25', models.DecimalField(decimal_places=2, default=0, max_digits=8)),
+                ('rate_median', models.DecimalField(decimal_places=2, default=0, max_digits=8)),
+                ('rate_p75', models.DecimalField(decimal_places=2, default=0, max_digits=8)),
+                ('rate_p90', models.DecimalField(decimal_places=2, default=0, max_digits=8)),
+                ('rate_max', models.DecimalField(decimal_places=2, default=0, max_digits=8)),
+                ('median_session_minutes', models.IntegerField(default=0)),
+                ('sessions_booked', models.IntegerField(default=0, help_text='Past sessions in the lookback window')),
+                ('sessions_completed', models.IntegerField(default=0)),
+                ('conversion_rate', models.DecimalField(decimal_places=4, default=0, help_text='Share of booked sessions that were completed', max_digits=5)),
+                ('computed_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('subject', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='rate_snapshot', to='tutoring.subject')),
+            ],
+            options={
+                'verbose_name': 'Subject Rate Snapshot',
+                'verbose_name_plural': 'Subject Rate Snapshots',
+                'ordering': ['subject__name'],
+            },
+        ),
+    ]
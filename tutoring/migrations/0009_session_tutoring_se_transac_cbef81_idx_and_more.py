@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tutoring', '0008_subjectratesnapshot'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(fields=['transaction_id'], name='tutoring_se_transac_cbef81_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(fields=['amount', 'date'], name='tutoring_se_amount_006c95_idx'),
+        ),
+    ]
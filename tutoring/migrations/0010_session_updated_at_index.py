@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tutoring', '0009_session_tutoring_se_transac_cbef81_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(fields=['updated_at'], name='tutoring_se_updated_45411b_idx'),
+        ),
+    ]
@@ -1,15 +1,60 @@
-from django.db import models
+from django.db import models, transaction
+from django.core.exceptions import ValidationError
 from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
 from accounts.models import CustomUser
 import json
+import secrets
+
+
+class SubjectCategory(models.Model):
+    """Node in the subject taxonomy, e.g. Sciences > Physical Sciences"""
+    name = models.CharField(max_length=100)
+    slug = models.SlugField(max_length=120, unique=True)
+    parent = models.ForeignKey('self', on_delete=models.CASCADE, null=True, blank=True,
+                               related_name='children')
+    icon = models.CharField(max_length=50, default='fas fa-folder')
+    tutor_count = models.IntegerField(default=0, help_text="Available tutors teaching anything under this node")
+
+    def __str__(self):
+        return self.name
+
+    def clean(self):
+        if self.parent_id and self.pk and (
+            self.parent_id == self.pk or
+            SubjectCategoryClosure.objects.filter(ancestor_id=self.pk, descendant_id=self.parent_id).exists()
+        ):
+            raise ValidationError({'parent': "A category can't be moved under itself."})
+
+    class Meta:
+        ordering = ['name']
+        verbose_name = "Subject Category"
+        verbose_name_plural = "Subject Categories"
+
+
+class SubjectCategoryClosure(models.Model):
+    """Every (ancestor, descendant) pair in the taxonomy, including each node paired with itself"""
+    ancestor = models.ForeignKey(SubjectCategory, on_delete=models.CASCADE, related_name='descendant_links')
+    descendant = models.ForeignKey(SubjectCategory, on_delete=models.CASCADE, related_name='ancestor_links')
+    depth = models.PositiveSmallIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['ancestor', 'descendant'], name='unique_category_closure_pair'),
+        ]
+        indexes = [
+            models.Index(fields=['descendant', 'depth']),
+        ]
 
 
 class Subject(models.Model):
     """Separate model for subjects to allow better filtering"""
     name = models.CharField(max_length=100, unique=True)
     category = models.CharField(max_length=50)
+    taxonomy = models.ForeignKey(SubjectCategory, on_delete=models.SET_NULL, null=True, blank=True,
+                                 related_name='subjects')
     icon = models.CharField(max_length=50, default='fas fa-book')
+    tutor_count = models.IntegerField(default=0, help_text="Available tutors teaching this subject")
 
     def __str__(self):
         return self.name
@@ -64,6 +109,8 @@ class Tutor(models.Model):
     is_verified = models.BooleanField(default=False, help_text="Verified by campus staff")
     profile_picture = models.ImageField(upload_to='tutor_profiles/', blank=True, null=True)
     qr_code = models.ImageField(upload_to='qr_codes/', blank=True, null=True)
+    qr_code_svg = models.FileField(upload_to='qr_codes/', blank=True, null=True)
+    qr_payload_hash = models.CharField(max_length=64, blank=True, editable=False)
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -113,9 +160,8 @@ class Tutor(models.Model):
     def full_name(self):
         return self.user.get_full_name() or self.user.username
 
-    @property
-    def profile_completion_percentage(self):
-        """Calculate profile completion percentage"""
+    def compute_profile_completion(self, has_subjects):
+        """Profile completion percentage, given whether the tutor has any subjects"""
         total_fields = 8
         completed = 0
 
@@ -124,12 +170,20 @@ class Tutor(models.Model):
         if self.qualifications: completed += 1
         if self.teaching_experience: completed += 1
         if self.contact_email or self.contact_phone: completed += 1
-        if self.subjects.exists(): completed += 1
+        if has_subjects: completed += 1
         if self.availability: completed += 1
         if self.hourly_rate > 0: completed += 1
 
         return int((completed / total_fields) * 100)
 
+    @property
+    def profile_completion_percentage(self):
+        """Precomputed in the search document; computed live if that's missing"""
+        try:
+            return self.search_document.completion_score
+        except TutorSearchDocument.DoesNotExist:
+            return self.compute_profile_completion(self.subjects.exists())
+
     class Meta:
         ordering = ['-rating', '-total_sessions']
         indexes = [
@@ -140,6 +194,100 @@ class Tutor(models.Model):
         verbose_name_plural = "Tutors"
 
 
+class TutorSearchDocument(models.Model):
+    """
+    Denormalized, single-table view of a tutor for the directory and search.
+    Rebuilt by signals whenever the tutor, their user, or their subjects change.
+    """
+    tutor = models.OneToOneField(Tutor, on_delete=models.CASCADE, primary_key=True,
+                                 related_name='search_document')
+    full_name = models.CharField(max_length=300)
+    username = models.CharField(max_length=150)
+    subject_names = models.CharField(max_length=1000, blank=True)
+    subject_ids = models.CharField(max_length=1000, blank=True, help_text="Comma-wrapped ids, e.g. ,3,7,")
+    primary_subject_id = models.IntegerField(null=True, blank=True)
+    primary_subject_name = models.CharField(max_length=100, blank=True)
+    year_of_study = models.CharField(max_length=20)
+    search_text = models.TextField(blank=True, help_text="Lowercased names, subjects and bio")
+    completion_score = models.IntegerField(default=0)
+    rating = models.DecimalField(max_digits=3, decimal_places=2, default=0.0)
+    total_reviews = models.IntegerField(default=0)
+    hourly_rate = models.DecimalField(max_digits=8, decimal_places=2, default=0.0)
+    total_sessions = models.IntegerField(default=0)
+    total_hours = models.DecimalField(max_digits=8, decimal_places=2, default=0.0)
+    availability_summary = models.CharField(max_length=200, blank=True)
+    weekly_available_hours = models.IntegerField(default=0)
+    is_available = models.BooleanField(default=True)
+    is_verified = models.BooleanField(default=False)
+    created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Search document for {self.full_name}"
+
+    class Meta:
+        ordering = ['-rating', '-total_sessions']
+        indexes = [
+            models.Index(fields=['is_available', 'rating']),
+            models.Index(fields=['is_available', 'hourly_rate']),
+            models.Index(fields=['is_available', 'total_sessions']),
+            models.Index(fields=['is_available', 'created_at']),
+            models.Index(fields=['is_available', 'full_name']),
+            models.Index(fields=['is_available', 'year_of_study']),
+        ]
+        verbose_name = "Tutor Search Document"
+        verbose_name_plural = "Tutor Search Documents"
+
+
+class TutorCategory(models.Model):
+    """
+    A tutor teaches at least one subject under this taxonomy node. Rows exist for
+    every ancestor of every subject, so a category filter is one indexed lookup.
+    """
+    tutor = models.ForeignKey(Tutor, on_delete=models.CASCADE, related_name='category_links')
+    category = models.ForeignKey(SubjectCategory, on_delete=models.CASCADE, related_name='tutor_links')
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['category', 'tutor'], name='unique_tutor_category'),
+        ]
+
+
+class SubjectRateSnapshot(models.Model):
+    """
+    Rate and booking statistics for one subject (subject=None covers every
+    tutor), recomputed periodically by the snapshot_rate_stats command.
+    """
+    subject = models.OneToOneField(Subject, on_delete=models.CASCADE, null=True, blank=True,
+                                   related_name='rate_snapshot')
+    tutor_count = models.IntegerField(default=0)
+    rate_min = models.DecimalField(max_digits=8, decimal_places=2, default=0)
+    rate_p10 = models.DecimalField(max_digits=8, decimal_places=2, default=0)
+    rate_p25 = models.DecimalField(max_digits=8, decimal_places=2, default=0)
+    rate_median = models.DecimalField(max_digits=8, decimal_places=2, default=0)
+    rate_p75 = models.DecimalField(max_digits=8, decimal_places=2, default=0)
+    rate_p90 = models.DecimalField(max_digits=8, decimal_places=2, default=0)
+    rate_max = models.DecimalField(max_digits=8, decimal_places=2, default=0)
+    median_session_minutes = models.IntegerField(default=0)
+    sessions_booked = models.IntegerField(default=0, help_text="Past sessions in the lookback window")
+    sessions_completed = models.IntegerField(default=0)
+    conversion_rate = models.DecimalField(max_digits=5, decimal_places=4, default=0,
+                                          help_text="Share of booked sessions that were completed")
+    computed_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"Rates for {self.subject or 'all subjects'}"
+
+    @property
+    def conversion_percentage(self):
+        return round(float(self.conversion_rate) * 100)
+
+    class Meta:
+        ordering = ['subject__name']
+        verbose_name = "Subject Rate Snapshot"
+        verbose_name_plural = "Subject Rate Snapshots"
+
+
 class Session(models.Model):
     STATUS_CHOICES = [
         ('pending', '⏳ Pending'),
@@ -218,14 +366,23 @@ class Session(models.Model):
             self.confirmed_at = timezone.now()
         elif self.status == 'completed' and not self.completed_at:
             self.completed_at = timezone.now()
-            # Update tutor stats
-            self.tutor.total_sessions += 1
-            self.tutor.total_hours += self.duration / 60
-            self.tutor.save(update_fields=['total_sessions', 'total_hours'])
         elif self.status == 'cancelled' and not self.cancelled_at:
             self.cancelled_at = timezone.now()
 
-        super().save(*args, **kwargs)
+        # Lock the stored row so concurrent status changes are seen in order,
+        # then append any earnings entries the transition produced. Tutor stats
+        # are updated by the ledger, not here.
+        with transaction.atomic():
+            previous = None
+            if self.pk:
+                previous = Session.objects.select_for_update().filter(pk=self.pk).values(
+                    'status', 'payment_status'
+                ).first()
+
+            super().save(*args, **kwargs)
+
+            from .ledger import record_session_changes
+            record_session_changes(self, previous)
 
     @property
     def is_upcoming(self):
@@ -252,6 +409,10 @@ class Session(models.Model):
         indexes = [
             models.Index(fields=['tutor', 'status', 'date']),
             models.Index(fields=['student', 'status', 'date']),
+            models.Index(fields=['status', 'date']),
+            models.Index(fields=['transaction_id']),
+            models.Index(fields=['amount', 'date']),
+            models.Index(fields=['updated_at']),
         ]
         verbose_name = "Session"
         verbose_name_plural = "Sessions"
@@ -302,6 +463,114 @@ class Review(models.Model):
         verbose_name_plural = "Tutor Reviews"
 
 
+class EarningsEntry(models.Model):
+    """Append-only ledger of session earnings events"""
+    ENTRY_TYPES = [
+        ('completed', 'Session Completed'),
+        ('paid', 'Payment Received'),
+        ('refunded', 'Payment Refunded'),
+    ]
+
+    tutor = models.ForeignKey(Tutor, on_delete=models.CASCADE, related_name='earnings_entries')
+    session = models.ForeignKey(Session, on_delete=models.SET_NULL, null=True, blank=True,
+                                related_name='earnings_entries')
+    entry_type = models.CharField(max_length=20, choices=ENTRY_TYPES)
+    amount = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
+    hours = models.DecimalField(max_digits=8, decimal_places=2, default=0.00)
+    month = models.DateField(help_text="First day of the month the entry is booked to")
+    created_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"{self.get_entry_type_display()}: {self.tutor.user.username} {self.amount}"
+
+    class Meta:
+        ordering = ['-created_at']
+        constraints = [
+            models.UniqueConstraint(fields=['session', 'entry_type'], name='unique_session_earnings_entry'),
+        ]
+        indexes = [
+            models.Index(fields=['tutor', 'month']),
+        ]
+        verbose_name = "Earnings Entry"
+        verbose_name_plural = "Earnings Ledger"
+
+
+class MonthlyEarnings(models.Model):
+    """Per-tutor monthly rollup of the earnings ledger"""
+    tutor = models.ForeignKey(Tutor, on_delete=models.CASCADE, related_name='monthly_earnings')
+    month = models.DateField(help_text="First day of the month")
+    sessions_completed = models.IntegerField(default=0)
+    hours_taught = models.DecimalField(max_digits=8, decimal_places=2, default=0.00)
+    amount_earned = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
+    amount_paid = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
+    amount_refunded = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
+    version = models.PositiveIntegerField(default=0, help_text="Bumped on every ledger entry")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.tutor.user.username} - {self.month:%B %Y}"
+
+    @property
+    def net_paid(self):
+        return self.amount_paid - self.amount_refunded
+
+    @property
+    def average_session_rate(self):
+        if not self.sessions_completed:
+            return 0
+        return self.amount_earned / self.sessions_completed
+
+    class Meta:
+        ordering = ['-month']
+        unique_together = ['tutor', 'month']
+        verbose_name = "Monthly Earnings"
+        verbose_name_plural = "Monthly Earnings"
+
+
+class SessionReminder(models.Model):
+    """One row per reminder sent, so the scheduler never sends the same one twice"""
+    KIND_CHOICES = [
+        ('day_before', '24 hours before'),
+        ('hour_before', '1 hour before'),
+    ]
+
+    session = models.ForeignKey(Session, on_delete=models.CASCADE, related_name='reminders')
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    sent_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"{self.get_kind_display()} reminder for session {self.session_id}"
+
+    class Meta:
+        ordering = ['-sent_at']
+        unique_together = ['session', 'kind']
+        verbose_name = "Session Reminder"
+        verbose_name_plural = "Session Reminders"
+
+
+class CalendarFeedToken(models.Model):
+    """Secret token for a user's iCalendar session feed"""
+    user = models.OneToOneField(CustomUser, on_delete=models.CASCADE, related_name='calendar_feed')
+    token = models.CharField(max_length=64, unique=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"Calendar feed for {self.user.username}"
+
+    @classmethod
+    def for_user(cls, user):
+        feed, _ = cls.objects.get_or_create(user=user, defaults={'token': secrets.token_urlsafe(32)})
+        return feed
+
+    def regenerate(self):
+        self.token = secrets.token_urlsafe(32)
+        self.save(update_fields=['token'])
+
+    class Meta:
+        verbose_name = "Calendar Feed Token"
+        verbose_name_plural = "Calendar Feed Tokens"
+
+
 class TutorApplication(models.Model):
     """Track tutor applications"""
     STATUS_CHOICES = [
@@ -0,0 +1,223 @@
+# tutoring/reconciliation.py
+import csv
+import json
+from collections import Counter, namedtuple
+from datetime import date
+from decimal import Decimal, InvalidOperation
+
+from django.db import transaction
+from django.utils import timezone
+
+from .ledger import record_bulk_session_changes
+from .models import Session
+
+CHUNK_SIZE = 1000
+
+FIELD_ALIASES = {
+    'transaction_id': ('transaction_id', 'txn_id', 'reference', 'receipt'),
+    'amount': ('amount',),
+    'date': ('date', 'paid_at', 'timestamp'),
+    'status': ('status',),
+    'method': ('payment_method', 'method', 'channel'),
+}
+
+# Provider status -> Session.payment_status
+PROVIDER_STATUSES = {
+    'paid': 'paid', 'success': 'paid', 'successful': 'paid', 'completed': 'paid', 'settled': 'paid',
+    'refunded': 'refunded', 'refund': 'refunded', 'reversed': 'refunded',
+    'cancelled': 'cancelled', 'canceled': 'cancelled', 'voided': 'cancelled',
+}
+
+ALLOWED_TRANSITIONS = {
+    'pending': {'paid', 'cancelled'},
+    'cancelled': {'paid'},
+    'paid': {'refunded'},
+    'refunded': set(),
+}
+
+REPORT_FIELDS = ['line', 'transaction_id', 'amount', 'date', 'status', 'reason', 'session_id', 'detail']
+
+ProviderRow = namedtuple('ProviderRow', 'transaction_id amount date status method')
+
+
+def read_rows(path):
+    """Yield (line number, raw dict or None) from a CSV or JSONL export, one row at a time"""
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        if path.endswith(('.jsonl', '.ndjson')):
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_number, json.loads(line)
+                except ValueError:
+                    yield line_number, None
+        else:
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+
+
+def parse_row(raw):
+    """Normalize a provider row; raises ValueError with the reason if unusable"""
+    if not isinstance(raw, dict):
+        raise ValueError('unreadable row')
+    lowered = {str(key).strip().lower(): value for key, value in raw.items()}
+    fields = {}
+    for field, aliases in FIELD_ALIASES.items():
+        fields[field] = next((lowered[a] for a in aliases if lowered.get(a) not in (None, '')), '')
+
+    try:
+        amount = Decimal(str(fields['amount']).replace(',', '')).quantize(Decimal('0.01'))
+    except (InvalidOperation, ValueError):
+        raise ValueError(f"bad amount {fields['amount']!r}")
+    try:
+        paid_on = date.fromisoformat(str(fields['date'])[:10])
+    except ValueError:
+        raise ValueError(f"bad date {fields['date']!r}")
+    status = PROVIDER_STATUSES.get(str(fields['status']).strip().lower())
+    if status is None:
+        raise ValueError(f"unknown status {fields['status']!r}")
+
+    return ProviderRow(str(fields['transaction_id']).strip()[:100], amount, paid_on, status,
+                       str(fields['method']).strip()[:50])
+
+
+class PaymentReconciler:
+    """
+    Apply a provider export to sessions in chunks. Rows are matched on
+    transaction_id, falling back to a unique pending session with the same
+    amount and date. Each chunk is one transaction: matched sessions are
+    locked, bulk-updated, and their ledger entries appended. Rows that can't
+    be applied are written to the mismatch report.
+    """
+
+    def __init__(self, report=None, dry_run=False, chunk_size=CHUNK_SIZE):
+        self.report = csv.writer(report) if report is not None else None
+        if self.report:
+            self.report.writerow(REPORT_FIELDS)
+        self.dry_run = dry_run
+        self.chunk_size = chunk_size
+        self.stats = Counter()
+        self._claimed = set()
+
+    def run(self, rows):
+        """Consume (line number, raw row) pairs; returns the stats Counter"""
+        chunk = []
+        for line_number, raw in rows:
+            self.stats['rows'] += 1
+            try:
+                chunk.append((line_number, parse_row(raw)))
+            except ValueError as e:
+                self._mismatch(line_number, None, 'invalid_row', detail=str(e))
+                continue
+            if len(chunk) >= self.chunk_size:
+                self._apply_chunk(chunk)
+                chunk = []
+        if chunk:
+            self._apply_chunk(chunk)
+        return self.stats
+
+    def _mismatch(self, line_number, row, reason, session=None, detail=''):
+        self.stats[f'mismatch_{reason}'] += 1
+        if self.report:
+            self.report.writerow([
+                line_number,
+                row.transaction_id if row else '',
+                row.amount if row else '',
+                row.date if row else '',
+                row.status if row else '',
+                reason,
+                session.pk if session else '',
+                detail,
+            ])
+
+    @transaction.atomic
+    def _apply_chunk(self, chunk):
+        by_transaction = {}
+        for session in Session.objects.select_for_update().filter(
+            transaction_id__in={row.transaction_id for _, row in chunk if row.transaction_id}
+        ):
+            by_transaction.setdefault(session.transaction_id, []).append(session)
+
+        by_amount_date = {}
+        fallback = [row for _, row in chunk if row.transaction_id not in by_transaction]
+        if fallback:
+            for session in Session.objects.select_for_update().filter(
+                transaction_id='', payment_status='pending',
+                amount__in={row.amount for row in fallback}, date__in={row.date for row in fallback},
+            ):
+                by_amount_date.setdefault((session.amount, session.date), []).append(session)
+
+        previous = {}
+        changed = {}
+        learned_ids = []
+        for line_number, row in chunk:
+            matches = by_transaction.get(row.transaction_id) if row.transaction_id else None
+            if matches:
+                if len(matches) > 1:
+                    self._mismatch(line_number, row, 'duplicate_transaction',
+                                   detail=' '.join(str(s.pk) for s in matches))
+                    continue
+                session = matches[0]
+                if session.amount != row.amount:
+                    self._mismatch(line_number, row, 'amount_mismatch', session, f'session amount {session.amount}')
+                    continue
+                self.stats['matched_transaction'] += 1
+            else:
+                candidates = [s for s in by_amount_date.get((row.amount, row.date), [])
+                              if s.pk not in self._claimed]
+                if not candidates:
+                    self._mismatch(line_number, row, 'not_found')
+                    continue
+                if len(candidates) > 1:
+                    self._mismatch(line_number, row, 'ambiguous',
+                                   detail=' '.join(str(s.pk) for s in candidates[:10]))
+                    continue
+                session = candidates[0]
+                self._claimed.add(session.pk)
+                previous.setdefault(session.pk, {'status': session.status,
+                                                 'payment_status': session.payment_status})
+                if row.transaction_id:
+                    session.transaction_id = row.transaction_id
+                    by_transaction[row.transaction_id] = [session]
+                    learned_ids.append(session.pk)
+                changed[session.pk] = session
+                self.stats['matched_amount_date'] += 1
+
+            current = session.payment_status
+            if current == row.status:
+                self.stats['unchanged'] += 1
+                continue
+            if row.status not in ALLOWED_TRANSITIONS.get(current, ()):
+                self._mismatch(line_number, row, 'invalid_transition', session, f'{current} -> {row.status}')
+                continue
+
+            previous.setdefault(session.pk, {'status': session.status, 'payment_status': current})
+            session.payment_status = row.status
+            if row.method:
+                session.payment_method = row.method
+            changed[session.pk] = session
+            self.stats['updated'] += 1
+
+        if self.dry_run or not changed:
+            return
+
+        # Few distinct (status, method) pairs per chunk: one UPDATE each instead
+        # of a per-row CASE; only newly learned transaction ids differ per row
+        groups = {}
+        for session in changed.values():
+            groups.setdefault((session.payment_status, session.payment_method), []).append(session.pk)
+        now = timezone.now()
+        for (payment_status, payment_method), ids in groups.items():
+            Session.objects.filter(pk__in=ids).update(
+                payment_status=payment_status, payment_method=payment_method, updated_at=now
+            )
+        Session.objects.bulk_update(
+            [changed[pk] for pk in learned_ids], ['transaction_id'], batch_size=500
+        )
+        # Neither path calls Session.save, so append the ledger entries here
+        record_bulk_session_changes([(session, previous[session.pk]) for session in changed.values()])
+
+
+def reconcile_file(path, report=None, dry_run=False, chunk_size=CHUNK_SIZE):
+    return PaymentReconciler(report, dry_run, chunk_size).run(read_rows(path))
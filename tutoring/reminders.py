@@ -0,0 +1,151 @@
+# tutoring/reminders.py
+from datetime import datetime, timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import TaskWatermark
+from messaging.models import Notification
+from .models import Session, SessionReminder
+
+REMINDER_STATUSES = ['pending', 'confirmed']
+
+# kind -> how long before the session starts the reminder goes out
+REMINDER_LEADS = {
+    'day_before': timedelta(hours=24),
+    'hour_before': timedelta(hours=1),
+}
+# The changes watermark is re-read this far back, for saves that committed late
+CHANGES_OVERLAP = timedelta(minutes=5)
+
+
+def session_notification(user, session, title, message, notification_type='session_update'):
+    """Build (but don't save) a notification about a session"""
+    return Notification(
+        user=user,
+        title=title,
+        message=message,
+        notification_type=notification_type,
+        link=f"/tutoring/sessions/{session.id}/",
+    )
+
+
+def send_notifications(notifications):
+    """Insert notifications in one query once the surrounding transaction commits"""
+    notifications = list(notifications)
+    if notifications:
+        transaction.on_commit(lambda: Notification.objects.bulk_create(notifications))
+
+
+class SessionReminderScheduler:
+    """
+    Sends reminder notifications ahead of upcoming sessions.
+
+    Each reminder kind keeps a watermark: the latest session start time it has
+    already covered. A run scans (watermark, now + lead] in fixed windows over
+    the (status, date) index, and the SessionReminder table makes re-running
+    a window harmless. Sessions booked or moved behind the watermark are
+    caught by a second watermark on Session.updated_at: each run looks only
+    at sessions saved since the previous one.
+    """
+
+    def __init__(self, now=None, window=timedelta(hours=6), dry_run=False):
+        self.now = now or timezone.now()
+        self.window = window
+        self.dry_run = dry_run
+
+    def run(self):
+        """Process every reminder kind; returns {kind: reminders sent}"""
+        return {kind: self.run_kind(kind, lead) for kind, lead in REMINDER_LEADS.items()}
+
+    def run_kind(self, kind, lead):
+        watermark_name = f'tutoring.reminders.{kind}'
+        changes_name = f'{watermark_name}.changes'
+        if not self.dry_run:
+            # The rows must exist before the first run, or there is nothing to lock
+            for name in (watermark_name, changes_name):
+                TaskWatermark.objects.get_or_create(name=name, defaults={'value': self.now})
+        end = self.now + lead
+        sent = 0
+
+        with transaction.atomic():
+            start = self._locked_watermark(watermark_name)
+            changed_since = self._locked_watermark(changes_name) - CHANGES_OVERLAP
+            # Sessions saved since the last run that start behind the scan
+            # watermark. Ones inside a shorter lead get that reminder instead.
+            shorter = max((other for other in REMINDER_LEADS.values() if other < lead), default=timedelta(0))
+            if start > self.now + shorter:
+                sent += self._process_window(kind, self.now + shorter, min(start, end), changed_since)
+            if not self.dry_run:
+                TaskWatermark.set_value(changes_name, self.now)
+
+        while start < end:
+            window_end = min(start + self.window, end)
+            with transaction.atomic():
+                # Lock the watermark so overlapping cron runs don't send twice
+                current = self._locked_watermark(watermark_name)
+                if current > start:
+                    start = current
+                    continue
+                sent += self._process_window(kind, start, window_end)
+                if not self.dry_run:
+                    TaskWatermark.set_value(watermark_name, window_end)
+            start = window_end
+
+        return sent
+
+    def _locked_watermark(self, name):
+        value = TaskWatermark.objects.select_for_update().filter(name=name).values_list('value', flat=True).first()
+        return value or self.now
+
+    def _sessions_starting_between(self, start, end, changed_since=None):
+        """Sessions whose start falls in (start, end], optionally only ones saved after changed_since"""
+        tz = timezone.get_current_timezone()
+        local_start = timezone.localtime(start, tz)
+        local_end = timezone.localtime(end, tz)
+
+        candidates = Session.objects.filter(
+            status__in=REMINDER_STATUSES,
+            date__gte=local_start.date(),
+            date__lte=local_end.date(),
+        ).select_related('tutor__user', 'student')
+        if changed_since is not None:
+            candidates = candidates.filter(updated_at__gt=changed_since)
+
+        for session in candidates:
+            starts_at = timezone.make_aware(datetime.combine(session.date, session.start_time), tz)
+            if start < starts_at <= end:
+                yield session, starts_at
+
+    def _process_window(self, kind, start, end, changed_since=None):
+        due = list(self._sessions_starting_between(start, end, changed_since))
+        if not due:
+            return 0
+
+        already_sent = set(SessionReminder.objects.filter(
+            kind=kind, session_id__in=[session.id for session, _ in due]
+        ).values_list('session_id', flat=True))
+
+        reminders = []
+        notifications = []
+        for session, starts_at in due:
+            if session.id in already_sent:
+                continue
+            when = timezone.localtime(starts_at).strftime('%a %d %b at %H:%M')
+            reminders.append(SessionReminder(session=session, kind=kind, sent_at=self.now))
+            notifications.append(session_notification(
+                session.student, session, "Upcoming Session",
+                f"Your session with {session.tutor.full_name} starts {when}.",
+                notification_type='session_reminder',
+            ))
+            notifications.append(session_notification(
+                session.tutor.user, session, "Upcoming Session",
+                f"Your session with {session.student.username} starts {when}.",
+                notification_type='session_reminder',
+            ))
+
+        if reminders and not self.dry_run:
+            SessionReminder.objects.bulk_create(reminders, ignore_conflicts=True)
+            Notification.objects.bulk_create(notifications)
+
+        return len(reminders)
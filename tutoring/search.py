@@ -0,0 +1,75 @@
+# tutoring/search.py
+from .models import Tutor, TutorSearchDocument
+
+DAY_ABBREVIATIONS = {
+    'monday': 'Mon', 'tuesday': 'Tue', 'wednesday': 'Wed', 'thursday': 'Thu',
+    'friday': 'Fri', 'saturday': 'Sat', 'sunday': 'Sun',
+}
+
+
+def summarize_availability(availability):
+    """('Mon, Wed', 6) style summary of the weekly availability JSON"""
+    days = []
+    hours = 0
+    for day, abbreviation in DAY_ABBREVIATIONS.items():
+        slots = (availability or {}).get(day)
+        if slots and isinstance(slots, list):
+            days.append(abbreviation)
+            hours += len(slots)
+    if not days:
+        return 'Not specified', 0
+    return f"{', '.join(days)} - {hours} hrs/week", hours
+
+
+def build_document(tutor):
+    """Create or refresh the search document for one tutor"""
+    user = tutor.user
+    subjects = list(tutor.subjects.values_list('id', 'name'))
+    primary = tutor.primary_subject
+    full_name = user.get_full_name() or user.username
+    summary, weekly_hours = summarize_availability(tutor.availability)
+    subject_names = ', '.join(name for _, name in subjects)
+
+    search_text = ' '.join(filter(None, [
+        full_name, user.username, subject_names, primary.name if primary else '', tutor.bio,
+    ])).lower()
+
+    document, _ = TutorSearchDocument.objects.update_or_create(
+        tutor=tutor,
+        defaults={
+            'full_name': full_name,
+            'username': user.username,
+            'subject_names': subject_names[:1000],
+            'subject_ids': (',' + ','.join(str(pk) for pk, _ in subjects) + ',') if subjects else '',
+            'primary_subject_id': primary.id if primary else None,
+            'primary_subject_name': primary.name if primary else '',
+            'year_of_study': tutor.year_of_study,
+            'search_text': search_text,
+            'completion_score': tutor.compute_profile_completion(bool(subjects)),
+            'rating': tutor.rating,
+            'total_reviews': tutor.total_reviews,
+            'hourly_rate': tutor.hourly_rate,
+            'total_sessions': tutor.total_sessions,
+            'total_hours': tutor.total_hours,
+            'availability_summary': summary,
+            'weekly_available_hours': weekly_hours,
+            'is_available': tutor.is_available,
+            'is_verified': tutor.is_verified,
+            'created_at': tutor.created_at,
+        },
+    )
+    return document
+
+
+def rebuild_document(tutor_id):
+    tutor = Tutor.objects.select_related('user', 'primary_subject').filter(pk=tutor_id).first()
+    if tutor:
+        build_document(tutor)
+
+
+def rebuild_all_documents():
+    count = 0
+    for tutor in Tutor.objects.select_related('user', 'primary_subject').iterator(chunk_size=500):
+        build_document(tutor)
+        count += 1
+    return count
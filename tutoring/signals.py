@@ -0,0 +1,184 @@
+# tutoring/signals.py
+from copy import deepcopy
+
+from django.db.models.signals import post_init, post_save, post_delete, pre_delete, m2m_changed
+from django.db.models import Q
+from django.dispatch import receiver
+
+from core.tasks import run_in_background
+from core.utils import refresh_tutor_qr_code
+from accounts.models import CustomUser
+from .models import Tutor, Subject, SubjectCategory, SubjectCategoryClosure, TutorCategory
+from .matching import INDEX_FIELDS, bump_index_version
+from .search import build_document, rebuild_document
+from .taxonomy import add_category_to_closure, rebuild_taxonomy, refresh_counts, refresh_tutors
+
+# Fields that appear on the tutor's QR card
+QR_FIELDS = {'hourly_rate', 'primary_subject', 'contact_email'}
+
+
+@receiver(post_save, sender=Tutor)
+def schedule_tutor_qr_code(sender, instance, update_fields=None, **kwargs):
+    """Re-render the QR card in the background; unchanged payloads are skipped there"""
+    if update_fields is not None and not QR_FIELDS.intersection(update_fields):
+        return
+    run_in_background(refresh_tutor_qr_code, instance.pk)
+
+
+# User fields that appear on a tutor's QR card
+USER_QR_FIELDS = {'first_name', 'last_name', 'username', 'email'}
+
+
+@receiver(post_save, sender=CustomUser)
+def schedule_tutor_qr_code_for_user(sender, instance, created, update_fields=None, **kwargs):
+    """The card shows the user's name (and email when the tutor has no contact email)"""
+    if created or (update_fields is not None and not USER_QR_FIELDS.intersection(update_fields)):
+        return
+    tutor_id = Tutor.objects.filter(user=instance).values_list('id', flat=True).first()
+    if tutor_id:
+        run_in_background(refresh_tutor_qr_code, tutor_id)
+
+
+@receiver(post_init, sender=Tutor)
+def remember_indexed_fields(sender, instance, **kwargs):
+    # Deep copy: availability is a dict that may be edited in place
+    instance._indexed_state = deepcopy(tuple(instance.__dict__.get(field) for field in INDEX_FIELDS))
+
+
+@receiver(post_save, sender=Tutor)
+def invalidate_matching_index(sender, instance, created, **kwargs):
+    """Only the fields the matching index holds force every worker to rebuild it"""
+    state = tuple(getattr(instance, field) for field in INDEX_FIELDS)
+    if created or state != instance._indexed_state:
+        bump_index_version()
+    instance._indexed_state = deepcopy(state)
+
+
+@receiver(post_delete, sender=Tutor)
+def invalidate_matching_index_on_delete(sender, instance, **kwargs):
+    bump_index_version()
+
+
+@receiver(m2m_changed, sender=Tutor.subjects.through)
+def invalidate_matching_subjects(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        bump_index_version()
+
+
+@receiver(post_save, sender=Tutor)
+def refresh_tutor_search_document(sender, instance, **kwargs):
+    build_document(instance)
+
+
+@receiver(m2m_changed, sender=Tutor.subjects.through)
+def refresh_tutor_search_subjects(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            build_document(instance)
+        return
+
+    # Changed from the Subject side: pk_set holds tutor ids
+    if action == 'pre_clear':
+        instance._cleared_tutor_ids = list(instance.tutors.values_list('id', flat=True))
+    elif action in ('post_add', 'post_remove'):
+        for tutor_id in pk_set:
+            rebuild_document(tutor_id)
+    elif action == 'post_clear':
+        for tutor_id in getattr(instance, '_cleared_tutor_ids', []):
+            rebuild_document(tutor_id)
+
+
+@receiver(post_save, sender=CustomUser)
+def refresh_tutor_search_name(sender, instance, created, update_fields=None, **kwargs):
+    """Names are denormalized into the document"""
+    if created or (update_fields is not None and
+                   not {'first_name', 'last_name', 'username'}.intersection(update_fields)):
+        return
+    tutor_id = Tutor.objects.filter(user=instance).values_list('id', flat=True).first()
+    if tutor_id:
+        rebuild_document(tutor_id)
+
+
+@receiver(post_save, sender=Subject)
+def refresh_tutor_search_subject_name(sender, instance, created, **kwargs):
+    if created:
+        return
+    tutor_ids = Tutor.objects.filter(
+        Q(subjects=instance) | Q(primary_subject=instance)
+    ).values_list('id', flat=True).distinct()
+    for tutor_id in tutor_ids:
+        rebuild_document(tutor_id)
+
+
+@receiver(post_save, sender=Tutor)
+def refresh_tutor_taxonomy_counts(sender, instance, created, update_fields=None, **kwargs):
+    """Counts only include available tutors"""
+    if created or (update_fields is not None and 'is_available' not in update_fields):
+        return
+    refresh_tutors([instance.pk])
+
+
+@receiver(pre_delete, sender=Tutor)
+def remember_tutor_taxonomy(sender, instance, **kwargs):
+    instance._taxonomy_ids = (
+        list(TutorCategory.objects.filter(tutor=instance).values_list('category_id', flat=True)),
+        list(instance.subjects.values_list('id', flat=True)),
+    )
+
+
+@receiver(post_delete, sender=Tutor)
+def refresh_deleted_tutor_taxonomy(sender, instance, **kwargs):
+    category_ids, subject_ids = getattr(instance, '_taxonomy_ids', ([], []))
+    refresh_counts(category_ids, subject_ids)
+
+
+@receiver(m2m_changed, sender=Tutor.subjects.through)
+def refresh_tutor_taxonomy(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == 'pre_clear':
+        # post_clear isn't told which rows went away
+        if reverse:
+            instance._cleared_taxonomy = (list(instance.tutors.values_list('id', flat=True)), [instance.pk])
+        else:
+            instance._cleared_taxonomy = ([instance.pk], list(instance.subjects.values_list('id', flat=True)))
+    elif action in ('post_add', 'post_remove'):
+        if reverse:
+            refresh_tutors(pk_set, [instance.pk])
+        else:
+            refresh_tutors([instance.pk], pk_set)
+    elif action == 'post_clear':
+        refresh_tutors(*getattr(instance, '_cleared_taxonomy', ([], [])))
+
+
+@receiver(post_save, sender=Subject)
+def refresh_subject_taxonomy(sender, instance, created, update_fields=None, **kwargs):
+    if created or (update_fields is not None and 'taxonomy' not in update_fields):
+        return
+    refresh_tutors(instance.tutors.values_list('id', flat=True), [instance.pk])
+
+
+@receiver(pre_delete, sender=Subject)
+def remember_subject_tutors(sender, instance, **kwargs):
+    instance._tutor_ids = list(instance.tutors.values_list('id', flat=True))
+
+
+@receiver(post_delete, sender=Subject)
+def refresh_deleted_subject_taxonomy(sender, instance, **kwargs):
+    refresh_tutors(getattr(instance, '_tutor_ids', []))
+
+
+@receiver(post_save, sender=SubjectCategory)
+def update_category_closure(sender, instance, created, **kwargs):
+    if created:
+        add_category_to_closure(instance)
+        return
+    stored_parent = SubjectCategoryClosure.objects.filter(
+        descendant=instance, depth=1
+    ).values_list('ancestor_id', flat=True).first()
+    if stored_parent != instance.parent_id:
+        # Moved: ancestors of the whole subtree change
+        rebuild_taxonomy()
+
+
+@receiver(post_delete, sender=SubjectCategory)
+def refresh_deleted_category(sender, instance, **kwargs):
+    rebuild_taxonomy()
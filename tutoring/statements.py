@@ -0,0 +1,164 @@
+# tutoring/statements.py
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connections
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import mm
+from reportlab.pdfgen import canvas
+
+from .ledger import get_month_rollup, month_start
+from .models import EarningsEntry, MonthlyEarnings, Tutor
+
+PAGE_MARGIN = 15 * mm
+ROW_HEIGHT = 6 * mm
+COLUMNS = [  # (heading, x offset from the margin, right aligned)
+    ('Date', 0, False),
+    ('Student', 25 * mm, False),
+    ('Subject', 70 * mm, False),
+    ('Entry', 110 * mm, False),
+    ('Hours', 150 * mm, True),
+    ('Amount', 180 * mm, True),
+]
+
+
+def statement_name(tutor_id, month, version):
+    """Storage path; a new ledger version for the month means a new file"""
+    return f'statements/{month:%Y-%m}/tutor_{tutor_id}_v{version}.pdf'
+
+
+def _header(c, tutor, month, page):
+    width, height = A4
+    c.setFont('Helvetica-Bold', 14)
+    c.drawString(PAGE_MARGIN, height - PAGE_MARGIN, 'Campus Essentials Hub - Earnings Statement')
+    c.setFont('Helvetica', 10)
+    c.drawString(PAGE_MARGIN, height - PAGE_MARGIN - 6 * mm, f"{tutor.full_name} ({tutor.user.email})")
+    c.drawString(PAGE_MARGIN, height - PAGE_MARGIN - 11 * mm, f"Statement for {month:%B %Y}")
+    c.drawRightString(width - PAGE_MARGIN, height - PAGE_MARGIN, f"Page {page}")
+    return height - PAGE_MARGIN - 20 * mm
+
+
+def _table_heading(c, y):
+    c.setFont('Helvetica-Bold', 9)
+    for heading, x, right in COLUMNS:
+        draw = c.drawRightString if right else c.drawString
+        draw(PAGE_MARGIN + x, y, heading)
+    c.line(PAGE_MARGIN, y - 2 * mm, A4[0] - PAGE_MARGIN, y - 2 * mm)
+    c.setFont('Helvetica', 9)
+    return y - ROW_HEIGHT
+
+
+def render_statement(tutor, month, output):
+    """Draw one tutor's statement for `month` into `output` (path or binary file)"""
+    month = month_start(month)
+    rollup = get_month_rollup(tutor, month)
+    entries = EarningsEntry.objects.filter(tutor=tutor, month=month).select_related(
+        'session__student', 'session__subject'
+    ).order_by('created_at', 'id')
+
+    c = canvas.Canvas(output, pagesize=A4, pageCompression=1)
+    c.setTitle(f"Earnings statement {month:%Y-%m}")
+    page = 1
+    y = _header(c, tutor, month, page)
+
+    c.setFont('Helvetica-Bold', 10)
+    c.drawString(PAGE_MARGIN, y, 'Summary')
+    c.setFont('Helvetica', 10)
+    summary = [
+        ('Sessions completed', str(rollup.sessions_completed)),
+        ('Hours taught', f"{rollup.hours_taught}"),
+        ('Earned', f"${rollup.amount_earned}"),
+        ('Paid', f"${rollup.amount_paid}"),
+        ('Refunded', f"${rollup.amount_refunded}"),
+        ('Net paid', f"${rollup.net_paid}"),
+    ]
+    for label, value in summary:
+        y -= ROW_HEIGHT
+        c.drawString(PAGE_MARGIN, y, label)
+        c.drawRightString(PAGE_MARGIN + 80 * mm, y, value)
+
+    y = _table_heading(c, y - 2 * ROW_HEIGHT)
+    count = 0
+    for entry in entries.iterator(chunk_size=500):
+        if y < PAGE_MARGIN + ROW_HEIGHT:
+            c.showPage()
+            page += 1
+            y = _table_heading(c, _header(c, tutor, month, page))
+
+        session = entry.session
+        row = [
+            f"{(session.date if session else entry.created_at.date()):%Y-%m-%d}",
+            (session.student.get_full_name() or session.student.username)[:24] if session else '-',
+            (session.subject.name if session and session.subject else '-')[:22],
+            entry.get_entry_type_display(),
+            f"{entry.hours}" if entry.entry_type == 'completed' else '',
+            f"-${entry.amount}" if entry.entry_type == 'refunded' else f"${entry.amount}",
+        ]
+        for (_, x, right), value in zip(COLUMNS, row):
+            draw = c.drawRightString if right else c.drawString
+            draw(PAGE_MARGIN + x, y, value)
+        y -= ROW_HEIGHT
+        count += 1
+
+    if not count:
+        c.drawString(PAGE_MARGIN, y, 'No completed or paid sessions this month.')
+
+    c.save()
+    return count
+
+
+def get_statement(tutor, month):
+    """Storage name of the tutor's statement, rendering it only if the ledger changed"""
+    month = month_start(month)
+    version = MonthlyEarnings.objects.filter(tutor=tutor, month=month).values_list(
+        'version', flat=True
+    ).first() or 0
+    name = statement_name(tutor.pk, month, version)
+    if default_storage.exists(name):
+        return name
+
+    buffer = BytesIO()
+    render_statement(tutor, month, buffer)
+    return default_storage.save(name, ContentFile(buffer.getvalue()))
+
+
+def _statement_worker(tutor_id, month_iso):
+    """Process pool entry point; each worker process opens its own DB connection"""
+    tutor = Tutor.objects.select_related('user').get(pk=tutor_id)
+    return tutor_id, get_statement(tutor, date.fromisoformat(month_iso))
+
+
+def _init_worker():
+    # Under the spawn start method the child starts with an unconfigured Django
+    import django
+    django.setup()
+
+
+def build_month_statements(month, workers=None, tutor_ids=None):
+    """
+    Render every statement for `month` whose ledger version isn't cached yet,
+    in parallel across processes. Returns (rendered, cached) counts.
+    """
+    month = month_start(month)
+    rollups = MonthlyEarnings.objects.filter(month=month)
+    if tutor_ids is not None:
+        rollups = rollups.filter(tutor_id__in=tutor_ids)
+
+    pending = [
+        tutor_id for tutor_id, version in rollups.values_list('tutor_id', 'version')
+        if not default_storage.exists(statement_name(tutor_id, month, version))
+    ]
+    cached = rollups.count() - len(pending)
+    if not pending:
+        return 0, cached
+
+    # Forked workers must not share the parent's open connections
+    connections.close_all()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = [pool.submit(_statement_worker, tutor_id, month.isoformat()) for tutor_id in pending]
+        for future in as_completed(futures):
+            future.result()
+    return len(pending), cached
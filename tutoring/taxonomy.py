@@ -0,0 +1,158 @@
+# tutoring/taxonomy.py
+from django.db import transaction
+from django.db.models import Count
+from django.utils.text import slugify
+
+from .models import Subject, SubjectCategory, SubjectCategoryClosure, Tutor, TutorCategory
+
+TutorSubject = Tutor.subjects.through
+
+
+def add_category_to_closure(category):
+    """Closure rows for a newly created node: itself plus its parent's ancestors"""
+    rows = [SubjectCategoryClosure(ancestor_id=category.pk, descendant_id=category.pk, depth=0)]
+    if category.parent_id:
+        rows += [
+            SubjectCategoryClosure(ancestor_id=ancestor_id, descendant_id=category.pk, depth=depth + 1)
+            for ancestor_id, depth in SubjectCategoryClosure.objects.filter(
+                descendant_id=category.parent_id
+            ).values_list('ancestor_id', 'depth')
+        ]
+    SubjectCategoryClosure.objects.bulk_create(rows, ignore_conflicts=True)
+
+
+def rebuild_closure():
+    """Recompute the whole closure table from parent pointers"""
+    parents = dict(SubjectCategory.objects.values_list('id', 'parent_id'))
+    rows = []
+    for node_id in parents:
+        ancestor_id, depth, seen = node_id, 0, set()
+        while ancestor_id is not None and ancestor_id not in seen:
+            seen.add(ancestor_id)
+            rows.append(SubjectCategoryClosure(ancestor_id=ancestor_id, descendant_id=node_id, depth=depth))
+            ancestor_id = parents.get(ancestor_id)
+            depth += 1
+
+    SubjectCategoryClosure.objects.all().delete()
+    SubjectCategoryClosure.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
+
+
+def refresh_counts(category_ids=None, subject_ids=None):
+    """
+    Recount available tutors per taxonomy node and per subject, one grouped
+    query each. None means every row; an empty list means none.
+    """
+    if category_ids is None or category_ids:
+        links = TutorCategory.objects.filter(tutor__is_available=True)
+        categories = SubjectCategory.objects.all()
+        if category_ids is not None:
+            links = links.filter(category_id__in=category_ids)
+            categories = categories.filter(pk__in=category_ids)
+        counts = dict(links.values_list('category_id').annotate(n=Count('id')).values_list('category_id', 'n'))
+        changed = []
+        for category in categories.only('id', 'tutor_count'):
+            if category.tutor_count != counts.get(category.pk, 0):
+                category.tutor_count = counts.get(category.pk, 0)
+                changed.append(category)
+        SubjectCategory.objects.bulk_update(changed, ['tutor_count'], batch_size=500)
+
+    if subject_ids is None or subject_ids:
+        links = TutorSubject.objects.filter(tutor__is_available=True)
+        subjects = Subject.objects.all()
+        if subject_ids is not None:
+            links = links.filter(subject_id__in=subject_ids)
+            subjects = subjects.filter(pk__in=subject_ids)
+        counts = dict(links.values_list('subject_id').annotate(n=Count('id')).values_list('subject_id', 'n'))
+        changed = []
+        for subject in subjects.only('id', 'tutor_count'):
+            if subject.tutor_count != counts.get(subject.pk, 0):
+                subject.tutor_count = counts.get(subject.pk, 0)
+                changed.append(subject)
+        Subject.objects.bulk_update(changed, ['tutor_count'], batch_size=500)
+
+
+@transaction.atomic
+def refresh_tutors(tutor_ids, subject_ids=()):
+    """
+    Recompute category memberships for these tutors from their subjects and
+    recount every node and subject they were or are attached to.
+    `subject_ids` adds subjects they were just removed from.
+    """
+    tutor_ids = list(tutor_ids)
+    if not tutor_ids:
+        return
+
+    links = list(TutorSubject.objects.filter(tutor_id__in=tutor_ids).values_list(
+        'tutor_id', 'subject_id', 'subject__taxonomy_id'
+    ))
+    ancestors = {}
+    for descendant_id, ancestor_id in SubjectCategoryClosure.objects.filter(
+        descendant_id__in={taxonomy_id for _, _, taxonomy_id in links if taxonomy_id}
+    ).values_list('descendant_id', 'ancestor_id'):
+        ancestors.setdefault(descendant_id, []).append(ancestor_id)
+
+    wanted = {
+        (tutor_id, ancestor_id)
+        for tutor_id, _, taxonomy_id in links
+        for ancestor_id in ancestors.get(taxonomy_id, ())
+    }
+    existing = TutorCategory.objects.filter(tutor_id__in=tutor_ids)
+    touched = set(existing.values_list('category_id', flat=True)) | {c for _, c in wanted}
+
+    existing.delete()
+    TutorCategory.objects.bulk_create(
+        [TutorCategory(tutor_id=tutor_id, category_id=category_id) for tutor_id, category_id in wanted],
+        batch_size=1000,
+    )
+    refresh_counts(touched, {subject_id for _, subject_id, _ in links} | set(subject_ids))
+
+
+@transaction.atomic
+def rebuild_taxonomy():
+    """Closure table, every tutor's memberships and all counts from scratch"""
+    rebuild_closure()
+    TutorCategory.objects.all().delete()
+    refresh_tutors(Tutor.objects.values_list('id', flat=True))
+    refresh_counts()
+
+
+def categories_from_subjects():
+    """Create a top-level node for each legacy category string and attach unassigned subjects to it"""
+    created = 0
+    for name in Subject.objects.filter(taxonomy__isnull=True).exclude(category='').values_list(
+        'category', flat=True
+    ).distinct():
+        category = SubjectCategory.objects.filter(name=name, parent__isnull=True).first()
+        if category is None:
+            category = SubjectCategory.objects.create(name=name, slug=unique_slug(name))
+            created += 1
+        Subject.objects.filter(taxonomy__isnull=True, category=name).update(taxonomy=category)
+    return created
+
+
+def unique_slug(name):
+    base = slugify(name) or 'category'
+    slug, n = base, 2
+    while SubjectCategory.objects.filter(slug=slug).exists():
+        slug, n = f'{base}-{n}', n + 1
+    return slug
+
+
+def category_tree():
+    """All nodes in depth-first order, each with a `level` attribute for indenting"""
+    categories = list(SubjectCategory.objects.all())
+    children = {}
+    for category in categories:
+        children.setdefault(category.parent_id, []).append(category)
+
+    ordered = []
+
+    def walk(parent_id, level):
+        for category in children.get(parent_id, ()):
+            category.level = level
+            ordered.append(category)
+            walk(category.pk, level + 1)
+
+    walk(None, 0)
+    return ordered
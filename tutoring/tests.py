@@ -1,3 +1,303 @@
+from datetime import date, time, timedelta
+from decimal import Decimal
+
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.models import CustomUser
+from .ledger import get_lifetime_totals, get_month_rollup, rebuild_ledger
+from .matching import TutorIndex, TutorMatcher
+from .models import (
+    CalendarFeedToken, EarningsEntry, Session, Subject, SubjectCategory, SubjectCategoryClosure, Tutor,
+)
+from .reconciliation import PaymentReconciler, parse_row
+from .taxonomy import category_tree, rebuild_closure, unique_slug
+
+
+class TutoringTestCase(TestCase):
+    def setUp(self):
+        self.tutor = Tutor.objects.create(
+            user=CustomUser.objects.create(username='tutor', email='tutor@example.com'),
+            hourly_rate=Decimal('30.00'),
+        )
+        self.student = CustomUser.objects.create(username='student', email='student@example.com')
+
+    def make_session(self, day=date(2024, 3, 4), start=time(10), **fields):
+        fields.setdefault('amount', Decimal('45.00'))
+        fields.setdefault('tutor', self.tutor)
+        return Session.objects.create(
+            student=self.student, date=day, start_time=start,
+            end_time=time(start.hour + 1, 30), duration=90, **fields
+        )
+
+
+class LedgerTests(TutoringTestCase):
+    def assertTotals(self, earned, net_paid, sessions, hours):
+        rollup = get_month_rollup(self.tutor)
+        self.assertEqual(get_lifetime_totals(self.tutor), {'earned': Decimal(earned), 'net_paid': Decimal(net_paid)})
+        self.assertEqual(rollup.sessions_completed, sessions)
+        self.assertEqual(rollup.hours_taught, Decimal(hours))
+        self.tutor.refresh_from_db()
+        self.assertEqual(self.tutor.total_sessions, sessions)
+        self.assertEqual(self.tutor.total_hours, Decimal(hours))
+
+    def test_complete_pay_cancel(self):
+        session = self.make_session()
+        self.assertTotals('0.00', '0.00', 0, '0.00')
+
+        session.status = 'completed'
+        session.save()
+        self.assertTotals('45.00', '0.00', 1, '1.50')
+
+        session.payment_status = 'paid'
+        session.save()
+        self.assertTotals('45.00', '45.00', 1, '1.50')
+
+        # Cancelling afterwards doesn't take back what was earned and paid
+        session.status = 'cancelled'
+        session.save()
+        session.save()
+        self.assertTotals('45.00', '45.00', 1, '1.50')
+        self.assertEqual(EarningsEntry.objects.filter(session=session).count(), 2)
+
+    def test_refund_reverses_payment(self):
+        session = self.make_session(status='completed', payment_status='paid')
+        session.payment_status = 'refunded'
+        session.save()
+        self.assertTotals('45.00', '0.00', 1, '1.50')
+
+    def test_rebuild_matches_incremental_totals(self):
+        self.make_session(status='completed', payment_status='paid')
+        self.make_session(start=time(14), status='completed')
+        self.make_session(start=time(16))
+        before = get_lifetime_totals(self.tutor)
+        self.assertEqual(before, {'earned': Decimal('90.00'), 'net_paid': Decimal('45.00')})
+
+        rebuild_ledger(self.tutor)
+        self.assertEqual(get_lifetime_totals(self.tutor), before)
+        self.assertTotals('90.00', '45.00', 2, '3.00')
+        self.assertEqual(EarningsEntry.objects.filter(tutor=self.tutor).count(), 3)
+
+
+class ReconciliationTests(TutoringTestCase):
+    def reconcile(self, *rows, **kwargs):
+        return PaymentReconciler(**kwargs).run(enumerate(rows, 2))
+
+    def row(self, amount='45.00', day='2024-03-04', status='paid', **fields):
+        return {'Amount': amount, 'Date': day, 'Status': status, **fields}
+
+    def test_parse_row(self):
+        row = parse_row({'TXN_ID': ' t-1 ', 'amount': '1,045.5', 'paid_at': '2024-03-04T10:00:00Z',
+                         'status': 'Settled', 'channel': 'card'})
+        self.assertEqual(row, ('t-1', Decimal('1045.50'), date(2024, 3, 4), 'paid', 'card'))
+        for raw in [None, self.row(amount='x'), self.row(day='04/03/2024'), self.row(status='held')]:
+            with self.subTest(raw=raw), self.assertRaises(ValueError):
+                parse_row(raw)
+
+    def test_match_by_transaction_id(self):
+        session = self.make_session(status='completed', transaction_id='t-1')
+        stats = self.reconcile(self.row(transaction_id='t-1', day='2024-03-09', method='card'))
+
+        self.assertEqual(stats['matched_transaction'], 1)
+        self.assertEqual(stats['updated'], 1)
+        session.refresh_from_db()
+        self.assertEqual((session.payment_status, session.payment_method), ('paid', 'card'))
+        self.assertEqual(get_lifetime_totals(self.tutor)['net_paid'], Decimal('45.00'))
+
+        # Re-importing the same export changes nothing
+        stats = self.reconcile(self.row(transaction_id='t-1'))
+        self.assertEqual(stats['unchanged'], 1)
+        self.assertEqual(EarningsEntry.objects.filter(session=session, entry_type='paid').count(), 1)
+
+    def test_fallback_to_amount_and_date(self):
+        session = self.make_session()
+        stats = self.reconcile(self.row(transaction_id='t-2'), self.row(transaction_id='t-2', status='refunded'))
+
+        self.assertEqual(stats['matched_amount_date'], 1)
+        self.assertEqual(stats['matched_transaction'], 1)
+        session.refresh_from_db()
+        self.assertEqual((session.transaction_id, session.payment_status), ('t-2', 'refunded'))
+        self.assertEqual(get_lifetime_totals(self.tutor)['net_paid'], Decimal('0.00'))
+
+    def test_mismatches(self):
+        self.make_session(transaction_id='t-3')
+        self.make_session(start=time(14), payment_status='refunded', transaction_id='t-4')
+        self.make_session(day=date(2024, 3, 5))
+        self.make_session(day=date(2024, 3, 5), start=time(14))
+
+        stats = self.reconcile(
+            self.row(transaction_id='t-3', amount='50.00'),
+            self.row(transaction_id='t-4'),
+            self.row(day='2024-03-06'),
+            self.row(day='2024-03-05'),
+            self.row(status='pending'),
+        )
+        self.assertEqual(stats['rows'], 5)
+        self.assertEqual(stats['updated'], 0)
+        for reason in ['amount_mismatch', 'invalid_transition', 'not_found', 'ambiguous', 'invalid_row']:
+            with self.subTest(reason=reason):
+                self.assertEqual(stats[f'mismatch_{reason}'], 1)
+
+    def test_dry_run_writes_nothing(self):
+        session = self.make_session()
+        stats = self.reconcile(self.row(transaction_id='t-5'), dry_run=True)
+
+        self.assertEqual(stats['updated'], 1)
+        session.refresh_from_db()
+        self.assertEqual((session.transaction_id, session.payment_status), ('', 'pending'))
+        self.assertFalse(EarningsEntry.objects.exists())
+
+
+class MatcherTests(TutoringTestCase):
+    def setUp(self):
+        super().setUp()
+        self.maths = Subject.objects.create(name='Maths', category='Sciences')
+        self.physics = Subject.objects.create(name='Physics', category='Sciences')
+        self.history = Subject.objects.create(name='History', category='Humanities')
+        self.tutor.subjects.set([self.maths, self.physics])
+        self.tutor.availability = {'monday': [9, 10], 'tuesday': [9]}
+        self.tutor.rating = 4.0
+        self.tutor.save()
+        self.cheap = self.make_tutor('cheap', [self.maths], rate='15.00', rating=3.0,
+                                     availability={'monday': [9], 'friday': ['x', 30]})
+        self.historian = self.make_tutor('historian', [self.history], rate='20.00', rating=5.0)
+        self.make_tutor('away', [self.maths, self.physics], is_available=False)
+
+    def make_tutor(self, username, subjects, rate='30.00', **fields):
+        tutor = Tutor.objects.create(
+            user=CustomUser.objects.create(username=username, email=f'{username}@example.com'),
+            hourly_rate=Decimal(rate), **fields
+        )
+        tutor.subjects.set(subjects)
+        return tutor
+
+    def matcher(self):
+        return TutorMatcher(TutorIndex.build())
+
+    def test_index_skips_unavailable_tutors_and_bad_slots(self):
+        index = TutorIndex.build()
+        self.assertEqual(list(index.tutor_ids), [self.tutor.pk, self.cheap.pk, self.historian.pk])
+        self.assertEqual(index.slots[index.rows_for([self.cheap.pk])[0]].sum(), 1)
+
+    def test_subject_required_drops_other_tutors(self):
+        ranked = self.matcher().top(subject_ids=[self.maths.pk, self.physics.pk], subject_required=True)
+        self.assertEqual([tutor_id for tutor_id, _, _ in ranked], [self.tutor.pk, self.cheap.pk])
+        self.assertEqual(ranked[0][2]['subject'], 1.0)
+        self.assertEqual(ranked[1][2]['subject'], 0.5)
+
+    def test_score_components(self):
+        scores = self.matcher().score(subject_ids=[self.maths.pk], max_rate=20,
+                                      slots=[('monday', 9), ('tuesday', 9)])
+        # Rows follow tutor id: tutor, cheap, historian
+        self.assertEqual(scores['subject'].tolist(), [1.0, 1.0, 0.0])
+        self.assertEqual(scores['price'].tolist(), [0.0, 1.0, 1.0])
+        self.assertEqual(scores['availability'].tolist(), [1.0, 0.5, 0.0])
+        expected = sum(weight * scores[name] for name, weight in TutorMatcher.WEIGHTS.items())
+        self.assertEqual(scores['total'].round(5).tolist(), expected.round(5).tolist())
+
+    def test_match_excludes_self_and_rewards_affinity(self):
+        self.make_session(status='completed', tutor=self.cheap)
+        student_tutor = Tutor.objects.create(user=self.student)
+        student_tutor.subjects.set([self.maths])
+
+        results = self.matcher().match(self.student, subject_ids=[self.maths.pk])
+        tutors = [result['tutor'] for result in results]
+        self.assertNotIn(student_tutor, tutors)
+        self.assertEqual(results[0]['tutor'], self.cheap)
+        self.assertEqual(results[0]['breakdown']['affinity'], 0.5)
+
+
+class TaxonomyTests(TutoringTestCase):
+    def setUp(self):
+        super().setUp()
+        self.sciences = self.make_category('Sciences')
+        self.physical = self.make_category('Physical Sciences', self.sciences)
+        self.chemistry = self.make_category('Chemistry', self.physical)
+        self.humanities = self.make_category('Humanities')
+        self.organic = Subject.objects.create(name='Organic Chemistry', category='Sciences', taxonomy=self.chemistry)
+
+    def make_category(self, name, parent=None):
+        return SubjectCategory.objects.create(name=name, slug=unique_slug(name), parent=parent)
+
+    def closure(self):
+        return set(SubjectCategoryClosure.objects.values_list('ancestor__name', 'descendant__name', 'depth'))
+
+    def counts(self):
+        return dict(SubjectCategory.objects.values_list('name', 'tutor_count'))
+
+    def test_closure_for_nested_categories(self):
+        self.assertEqual(self.closure(), {
+            ('Sciences', 'Sciences', 0), ('Physical Sciences', 'Physical Sciences', 0),
+            ('Chemistry', 'Chemistry', 0), ('Humanities', 'Humanities', 0),
+            ('Sciences', 'Physical Sciences', 1), ('Physical Sciences', 'Chemistry', 1),
+            ('Sciences', 'Chemistry', 2),
+        })
+        before = self.closure()
+        self.assertEqual(rebuild_closure(), 7)
+        self.assertEqual(self.closure(), before)
+
+    def test_tutor_counts_reach_ancestors(self):
+        self.tutor.subjects.add(self.organic)
+        self.assertEqual(self.counts(), {'Sciences': 1, 'Physical Sciences': 1, 'Chemistry': 1, 'Humanities': 0})
+        self.assertEqual(Subject.objects.get(pk=self.organic.pk).tutor_count, 1)
+
+        self.tutor.is_available = False
+        self.tutor.save()
+        self.assertEqual(self.counts(), {'Sciences': 0, 'Physical Sciences': 0, 'Chemistry': 0, 'Humanities': 0})
+
+    def test_moving_a_category_moves_its_subtree(self):
+        self.tutor.subjects.add(self.organic)
+        self.physical.parent = self.humanities
+        self.physical.save()
+
+        self.assertIn(('Humanities', 'Chemistry', 2), self.closure())
+        self.assertNotIn(('Sciences', 'Chemistry', 2), self.closure())
+        self.assertEqual(self.counts(), {'Sciences': 0, 'Physical Sciences': 1, 'Chemistry': 1, 'Humanities': 1})
+
+    def test_category_tree_order(self):
+        self.assertEqual(
+            [(category.name, category.level) for category in category_tree()],
+            [('Humanities', 0), ('Sciences', 0), ('Physical Sciences', 1), ('Chemistry', 2)],
+        )
+
+
+class CalendarFeedTests(TutoringTestCase):
+    def setUp(self):
+        super().setUp()
+        self.url = reverse('tutoring:calendar_feed', args=[CalendarFeedToken.for_user(self.student).token])
+        self.upcoming = timezone.localdate() + timedelta(days=3)
+
+    def test_etag_and_not_modified(self):
+        session = self.make_session(day=self.upcoming, status='confirmed')
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/calendar; charset=utf-8')
+        self.assertIn(f'UID:session-{session.pk}@', response.content.decode())
+        etag = response['ETag']
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_session_change_moves_the_etag(self):
+        session = self.make_session(day=self.upcoming)
+        etag = self.client.get(self.url)['ETag']
+
+        session.status = 'confirmed'
+        session.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('STATUS:CONFIRMED', response.content.decode())
+        self.assertNotEqual(response['ETag'], etag)
+
+        etag = response['ETag']
+        session.delete()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('BEGIN:VEVENT', response.content.decode())
 
-# Create your tests here.
+    def test_reset_token_stops_the_old_feed(self):
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        CalendarFeedToken.for_user(self.student).regenerate()
+        self.assertEqual(self.client.get(self.url).status_code, 404)
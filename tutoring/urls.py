@@ -12,6 +12,7 @@ urlpatterns = [
     path('become-tutor/', views.become_tutor, name='become_tutor'),
     path('dashboard/', views.tutor_dashboard, name='tutor_dashboard'),
     path('availability/', views.update_availability, name='update_availability'),
+    path('statements/<int:year>/<int:month>/', views.earnings_statement, name='earnings_statement'),
 
     # Session booking
     path('tutor/<int:tutor_id>/book/', views.book_session, name='book_session'),
@@ -25,6 +26,11 @@ urlpatterns = [
 
     # User sessions
     path('my-sessions/', views.my_sessions, name='my_sessions'),
+    path('sessions/export/', views.export_sessions, name='export_sessions'),
     path('sessions/<int:session_id>/cancel/', views.cancel_session, name='cancel_session'),
     path('sessions/<int:session_id>/update/', views.update_session_status, name='update_session_status'),
+
+    # Calendar feeds
+    path('calendar/<str:token>.ics', views.calendar_feed, name='calendar_feed'),
+    path('calendar/reset/', views.reset_calendar_feed, name='reset_calendar_feed'),
 ]
\ No newline at end of file
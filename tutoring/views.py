@@ -1,25 +1,39 @@
 from django.shortcuts import render, redirect, get_object_or_404
+from django.urls import reverse
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.http import JsonResponse, HttpResponseForbidden
-from django.views.decorators.http import require_POST, require_http_methods
+from django.http import JsonResponse, HttpResponse, HttpResponseForbidden, Http404, FileResponse
+from django.core.files.storage import default_storage
+from django.views.decorators.http import require_POST, require_http_methods, require_GET, condition
 from django.utils import timezone
 from django.db.models import Q, Avg, Count, Sum
 from django.core.paginator import Paginator
 from datetime import datetime, date, timedelta
 import json
 
-from .models import Tutor, Session, Review, Subject
+from .models import (Tutor, Session, Review, Subject, CalendarFeedToken, TutorSearchDocument,
+                     TutorCategory)
 from .forms import TutorRegistrationForm, SessionBookingForm, ReviewForm, TutorUpdateForm
+from .ledger import get_month_rollup, get_lifetime_totals
+from .calendar_feed import get_user_id_for_token, get_feed_etag, get_feed_body
+from .reminders import session_notification, send_notifications
+from .taxonomy import category_tree
+from core.exports import export_response
+from core.images import prefetch_variants
+from .market import get_rate_snapshot, rate_guide
+from .statements import get_statement
 from messaging.models import Message, Notification
 from accounts.models import CustomUser
 
 
 def tutor_list(request):
     """List all tutors with advanced filtering"""
-    tutors = Tutor.objects.filter(is_available=True).select_related('user', 'primary_subject')
+    # Filter, sort and count on the flattened search documents; Tutor rows
+    # are only loaded for the page being shown
+    documents = TutorSearchDocument.objects.filter(is_available=True)
 
     # Filtering
+    category_id = request.GET.get('category', '')
     subject_id = request.GET.get('subject', '')
     level = request.GET.get('level', '')
     min_rate = request.GET.get('min_rate', '')
@@ -28,28 +42,29 @@ def tutor_list(request):
     sort = request.GET.get('sort', 'rating')
 
     # Apply filters
-    if subject_id:
-        tutors = tutors.filter(subjects__id=subject_id)
+    # Semi-joins on the membership tables: indexed, and no duplicate rows to DISTINCT away
+    if category_id.isdigit():
+        documents = documents.filter(
+            pk__in=TutorCategory.objects.filter(category_id=category_id).values('tutor_id')
+        )
+    if subject_id.isdigit():
+        documents = documents.filter(
+            pk__in=Tutor.subjects.through.objects.filter(subject_id=subject_id).values('tutor_id')
+        )
     if level:
-        tutors = tutors.filter(year_of_study=level)
+        documents = documents.filter(year_of_study=level)
     if min_rate:
         try:
-            tutors = tutors.filter(hourly_rate__gte=float(min_rate))
+            documents = documents.filter(hourly_rate__gte=float(min_rate))
         except ValueError:
             pass
     if max_rate:
         try:
-            tutors = tutors.filter(hourly_rate__lte=float(max_rate))
+            documents = documents.filter(hourly_rate__lte=float(max_rate))
         except ValueError:
             pass
     if search:
-        tutors = tutors.filter(
-            Q(user__username__icontains=search) |
-            Q(user__first_name__icontains=search) |
-            Q(user__last_name__icontains=search) |
-            Q(bio__icontains=search) |
-            Q(primary_subject__name__icontains=search)
-        )
+        documents = documents.filter(search_text__contains=search.lower())
 
     # Apply sorting
     sort_options = {
@@ -58,37 +73,53 @@ def tutor_list(request):
         'rate_high': '-hourly_rate',
         'experience': '-total_sessions',
         'newest': '-created_at',
-        'name_asc': 'user__first_name',
+        'name_asc': 'full_name',
     }
-    tutors = tutors.order_by(sort_options.get(sort, '-rating'))
+    documents = documents.order_by(sort_options.get(sort, '-rating'), 'pk')
 
     # Get subjects for filter dropdown
     subjects = Subject.objects.all()
 
     # Calculate stats
+    totals = documents.aggregate(
+        count=Count('pk'),
+        avg_rate=Avg('hourly_rate'),
+        hours=Sum('total_hours'),
+    )
     stats = {
-        'total_tutors': tutors.count(),
-        'average_rate': tutors.aggregate(avg=Avg('hourly_rate'))['avg'] or 0,
-        'top_subject': subjects.annotate(tutor_count=Count('tutors')).order_by('-tutor_count').first(),
-        'total_hours': Session.objects.filter(status='completed').aggregate(total=Sum('duration'))['total'] or 0,
+        'total_tutors': totals['count'],
+        'average_rate': totals['avg_rate'] or 0,
+        'top_subject': subjects.order_by('-tutor_count').first(),
+        'total_hours': totals['hours'] or 0,
     }
 
     # Pagination
-    paginator = Paginator(tutors, 12)
+    paginator = Paginator(documents, 12)
+    paginator.count = totals['count']  # already counted above
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
+    page_ids = [document.pk for document in page_obj.object_list]
+    tutors = Tutor.objects.select_related('user', 'primary_subject', 'search_document').in_bulk(page_ids)
+    page_obj.object_list = [tutors[pk] for pk in page_ids if pk in tutors]
+    prefetch_variants([tutor.profile_picture for tutor in page_obj.object_list])
+
+    # Market rates come from the periodic snapshot, not a live aggregate
+    rate_snapshot = get_rate_snapshot(int(subject_id) if subject_id.isdigit() else None)
 
     context = {
         'tutors': page_obj,
         'subjects': subjects,
+        'categories': category_tree(),
         'stats': stats,
         'search_query': search,
+        'selected_category': category_id,
         'selected_subject': subject_id,
         'selected_level': level,
         'selected_sort': sort,
+        'rate_snapshot': rate_snapshot,
         'rate_range': {
-            'min': 0 if not tutors.exists() else float(min([t.hourly_rate for t in tutors])),
-            'max': 0 if not tutors.exists() else float(max([t.hourly_rate for t in tutors])),
+            'min': float(rate_snapshot.rate_min) if rate_snapshot else 0,
+            'max': float(rate_snapshot.rate_max) if rate_snapshot else 0,
         }
     }
     return render(request, 'tutoring/tutors.html', context)
@@ -262,6 +293,7 @@ def become_tutor(request):
         'form': form,
         'title': 'Become a Tutor',
         'action': 'Apply Now',
+        'rate_guide': rate_guide(),
     }
     return render(request, 'tutoring/become_tutor.html', context)
 
@@ -292,16 +324,10 @@ def tutor_dashboard(request):
     # Get recent reviews
     recent_reviews = Review.objects.filter(tutor=tutor).select_related('student').order_by('-created_at')[:5]
 
-    # Get earnings for this month
-    this_month = timezone.now().month
-    this_year = timezone.now().year
-    monthly_earnings = Session.objects.filter(
-        tutor=tutor,
-        status='completed',
-        completed_at__month=this_month,
-        completed_at__year=this_year,
-        payment_status='paid'
-    ).aggregate(total=Sum('amount'))['total'] or 0
+    # Earnings come from the ledger rollups, not from scanning sessions
+    month_rollup = get_month_rollup(tutor)
+    lifetime = get_lifetime_totals(tutor)
+    monthly_earnings = month_rollup.net_paid
 
     # Get total hours taught
     total_hours = tutor.total_hours
@@ -324,6 +350,10 @@ def tutor_dashboard(request):
         'pending_sessions': pending_sessions,
         'recent_reviews': recent_reviews,
         'monthly_earnings': monthly_earnings,
+        'total_earnings': lifetime['net_paid'],
+        'completed_sessions_this_month': month_rollup.sessions_completed,
+        'average_session_rate': month_rollup.average_session_rate,
+        'statement_month': month_rollup.month,
         'total_hours': total_hours,
         'today': date.today(),
         'next_7_days': next_7_days,
@@ -371,13 +401,11 @@ def book_session(request, tutor_id):
                 session.save()
 
                 # Create notifications
-                Notification.objects.create(
-                    user=tutor.user,
-                    title="New Session Request",
-                    message=f"{request.user.username} has requested a session on {session.date}",
+                send_notifications([session_notification(
+                    tutor.user, session, "New Session Request",
+                    f"{request.user.username} has requested a session on {session.date}",
                     notification_type='session_request',
-                    link=f"/tutoring/sessions/{session.id}/"
-                )
+                )])
 
                 messages.success(request,
                                  '✅ Session request sent successfully! '
@@ -531,6 +559,8 @@ def my_sessions(request):
         Q(date__lt=date.today())
     ) if tutor_sessions else []
 
+    calendar_feed = CalendarFeedToken.for_user(request.user)
+
     # Calculate totals
     total_spent = sum(session.amount for session in past_student if session.status == 'completed')
     pending_sessions_count = upcoming_student.filter(status='pending').count()
@@ -544,10 +574,99 @@ def my_sessions(request):
         'today': date.today(),
         'total_spent': total_spent,
         'pending_sessions_count': pending_sessions_count,
+        'calendar_feed_url': request.build_absolute_uri(
+            reverse('tutoring:calendar_feed', kwargs={'token': calendar_feed.token})
+        ),
     }
     return render(request, 'tutoring/my_sessions.html', context)
 
 
+def _feed_etag(request, token):
+    # Remembered on the request so the view doesn't look both up again
+    request.feed_user_id = get_user_id_for_token(token)
+    request.feed_etag = get_feed_etag(request.feed_user_id) if request.feed_user_id else None
+    return request.feed_etag
+
+
+@require_GET
+@condition(etag_func=_feed_etag)
+def calendar_feed(request, token):
+    """iCalendar feed of upcoming sessions, polled by calendar apps"""
+    user_id = request.feed_user_id
+    if not user_id:
+        raise Http404("Calendar feed not found")
+
+    response = HttpResponse(get_feed_body(user_id, request.feed_etag), content_type='text/calendar; charset=utf-8')
+    response['Content-Disposition'] = 'inline; filename="sessions.ics"'
+    response['Cache-Control'] = 'private, max-age=300'
+    return response
+
+
+@login_required
+@require_POST
+def reset_calendar_feed(request):
+    """Issue a new feed token, invalidating the old subscription URL"""
+    feed = CalendarFeedToken.for_user(request.user)
+    feed.regenerate()
+    messages.success(request, 'Your calendar feed link has been reset.')
+    return redirect('tutoring:my_sessions')
+
+
+@login_required
+def earnings_statement(request, year, month):
+    """Monthly earnings statement PDF; staff may pass ?tutor=<id> for any tutor"""
+    tutor_id = request.GET.get('tutor')
+    if tutor_id and request.user.is_staff:
+        tutor = get_object_or_404(Tutor.objects.select_related('user'), id=tutor_id)
+    elif hasattr(request.user, 'tutor_profile'):
+        tutor = request.user.tutor_profile
+    else:
+        return HttpResponseForbidden("Only tutors have earnings statements.")
+
+    try:
+        statement_month = date(year, month, 1)
+    except ValueError:
+        raise Http404("No such month")
+
+    name = get_statement(tutor, statement_month)
+    return FileResponse(default_storage.open(name, 'rb'), as_attachment=True,
+                        filename=f'earnings-{statement_month:%Y-%m}.pdf', content_type='application/pdf')
+
+
+@login_required
+def export_sessions(request):
+    """Stream a tutor's sessions as CSV or JSON lines; staff may pass ?tutor=<id>"""
+    tutor_id = request.GET.get('tutor')
+    if tutor_id and request.user.is_staff:
+        tutor = get_object_or_404(Tutor, id=tutor_id)
+    elif hasattr(request.user, 'tutor_profile'):
+        tutor = request.user.tutor_profile
+    else:
+        return HttpResponseForbidden("Only tutors can export sessions.")
+
+    sessions = Session.objects.filter(tutor=tutor).select_related('student', 'subject')
+    columns = [
+        ('id', lambda s: s.id),
+        ('date', lambda s: s.date),
+        ('start_time', lambda s: s.start_time),
+        ('end_time', lambda s: s.end_time),
+        ('duration', lambda s: s.duration),
+        ('student', lambda s: s.student.username),
+        ('student_email', lambda s: s.student.email),
+        ('subject', lambda s: s.subject.name if s.subject else ''),
+        ('topic', lambda s: s.topic),
+        ('location', lambda s: s.location),
+        ('status', lambda s: s.status),
+        ('amount', lambda s: s.amount),
+        ('payment_status', lambda s: s.payment_status),
+        ('payment_method', lambda s: s.payment_method),
+        ('transaction_id', lambda s: s.transaction_id),
+        ('created_at', lambda s: s.created_at),
+        ('updated_at', lambda s: s.updated_at),
+    ]
+    return export_response(request, sessions, columns, f'tutor-{tutor.id}-sessions')
+
+
 @login_required
 @require_http_methods(["POST"])
 def cancel_session(request, session_id):
@@ -571,13 +690,10 @@ def cancel_session(request, session_id):
 
     # Create notification for the other party
     other_user = session.tutor.user if request.user == session.student else session.student
-    Notification.objects.create(
-        user=other_user,
-        title="Session Cancelled",
-        message=f"Session on {session.date} has been cancelled.",
-        notification_type='session_update',
-        link=f"/tutoring/sessions/{session.id}/"
-    )
+    send_notifications([session_notification(
+        other_user, session, "Session Cancelled",
+        f"Session on {session.date} has been cancelled.",
+    )])
 
     messages.success(request, 'Session cancelled successfully.')
     return redirect('tutoring:my_sessions')
@@ -612,13 +728,10 @@ def update_session_status(request, session_id):
     session.save()
 
     # Create notification for student
-    Notification.objects.create(
-        user=session.student,
-        title=f"Session {status.capitalize()}",
-        message=f"Your session on {session.date} has been marked as {status}.",
-        notification_type='session_update',
-        link=f"/tutoring/sessions/{session.id}/"
-    )
+    send_notifications([session_notification(
+        session.student, session, f"Session {status.capitalize()}",
+        f"Your session on {session.date} has been marked as {status}.",
+    )])
 
     messages.success(request, f'Session marked as {status}.')
     return redirect('tutoring:my_sessions')